@@ -12,9 +12,16 @@ Responsibilities of this layer:
 - Aggregate scores
 - Combine explanations
 - Provide additional NON‑fraud insights
+- Time every rule (see analyzer/utils/tracing.py)
 """
 
-from typing import List, Dict
+import hashlib
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
 
 # ---- Rules ----
 from analyzer.rules.urgent_language import urgent_language_rule
@@ -39,77 +46,365 @@ except Exception:
 # ---- Insights (non-fraud) ----
 from analyzer.insights.skill_extractor import extract_skills
 
+# ---- Observability ----
+from analyzer.utils.logging import get_logger, log_event
+from analyzer.utils.metrics import RULE_ERRORS, RULE_FIRED, RULE_TIMEOUTS
+from analyzer.utils.tracing import Trace, current_trace, incr, span
 
-def run_all_rules(jd_context) -> Dict:
-    """
-    Analysis Engine Entry Point
+logger = get_logger("engine")
 
-    Required:
-        jd_context : JDContext
 
-    Notes:
-    - Raw text mode is intentionally removed.
-    - If parsing fails, engine returns safe low‑confidence output.
+# ===== Rule Registry =====
+# Built once at import time and shared by single and batch analysis.
+# Order generally grouped by theme to keep explanations naturally readable.
+RULES = [
+    # Urgency / psychological manipulation
+    urgent_language_rule,
+    urgency_density_rule,
+
+    # Compensation integrity
+    unrealistic_salary_rule,
+    role_salary_mismatch_rule,
+
+    # Identity / legitimacy
+    missing_company_identity_rule,
+    poor_contact_info_rule,
+
+    # Job content credibility
+    generic_job_title_rule,
+    hiring_process_absence_rule,
+    over_promising_language_rule,
+    language_inconsistency_rule,
+
+    # Behavioural / suspicious funnel
+    suspicious_application_flow_rule,
+
+    # Structural / duplicate-like patterns
+    copy_paste_jd_rule,
+]
+
+# Column order of per-rule score vectors (run_all_rules_with_scores)
+RULE_NAMES = [rule.__name__ for rule in RULES]
+
+EMPTY_SKILLS_INSIGHT = {"skills_found": [], "skill_count": 0}
+
+
+# ===== Parallel Execution =====
+RULE_TIMEOUT_SECONDS = 2.0   # per-rule budget in parallel mode, from when the rule starts
+ANALYSIS_TIMEOUT_SECONDS = 5.0   # whole-analysis budget in parallel mode, queue time included
+RULE_WORKERS = 32            # shared across concurrent analyses
+MAX_RULE_STRAGGLERS = RULE_WORKERS // 2   # abandoned rules still running before
+                                          # new analyses skip their rules
+
+_rule_executor: Optional[ThreadPoolExecutor] = None
+_rule_executor_lock = threading.Lock()
+
+# Timed-out rules keep their worker thread until they return
+_stragglers = 0
+_stragglers_lock = threading.Lock()
+
+
+# ===== Rule-set Version =====
+# Everything that can change an analysis result for a given JD text.
+_ANALYZER_DIR = os.path.dirname(os.path.abspath(__file__))
+_VERSIONED_SOURCES = (
+    "analysis_engine.py", "near_duplicate_index.py", "rules", "parsing", "insights",
+)
+
+
+def _ruleset_version(rules: List) -> str:
+    """
+    Fingerprint of the registry order + the source of every module that
+    shapes a result. Used to invalidate cached results on any rule change.
     """
+    digest = hashlib.sha256()
 
-    # ===== Validate Structured Input =====
-    if not JDContext or not isinstance(jd_context, JDContext):
-        return {
-            "rule_score": 0.0,
-            "reasons": ["Invalid analysis input: JDContext required"],
-            "insights": {
-                "skills": {"skills_found": [], "skill_count": 0}
-            }
+    for rule in rules:
+        digest.update(f"{rule.__module__}.{rule.__qualname__}\n".encode("utf-8"))
+
+    paths = []
+    for name in _VERSIONED_SOURCES:
+        path = os.path.join(_ANALYZER_DIR, name)
+        if os.path.isfile(path):
+            paths.append(path)
+            continue
+        for root, _, files in os.walk(path):
+            paths.extend(os.path.join(root, f) for f in files if f.endswith((".py", ".json")))
+
+    for path in sorted(paths):
+        digest.update(os.path.relpath(path, _ANALYZER_DIR).encode("utf-8"))
+        with open(path, "rb") as f:
+            digest.update(f.read())
+
+    return digest.hexdigest()[:16]
+
+
+RULESET_VERSION = _ruleset_version(RULES)
+
+NAN = float("nan")
+
+
+def _invalid_input_result() -> Dict:
+    return {
+        "rule_score": 0.0,
+        "reasons": ["Invalid analysis input: JDContext required"],
+        "insights": {
+            "skills": dict(EMPTY_SKILLS_INSIGHT)
         }
+    }
 
-    raw_text = jd_context.raw_text or ""
 
-    # ===== Rule Registry =====
-    # Order generally grouped by theme to keep explanations naturally readable.
-    rules = [
-        # Urgency / psychological manipulation
-        urgent_language_rule,
-        urgency_density_rule,
+def _rule_name(rule) -> str:
+    return getattr(rule, "__name__", repr(rule))
+
+
+def _get_rule_executor() -> ThreadPoolExecutor:
+    """
+    Process-wide executor shared by every parallel analysis.
+    """
+    global _rule_executor
+
+    if _rule_executor is None:
+        with _rule_executor_lock:
+            if _rule_executor is None:
+                _rule_executor = ThreadPoolExecutor(
+                    max_workers=RULE_WORKERS, thread_name_prefix="rule"
+                )
+    return _rule_executor
+
+
+def _call_rule(rule, jd_context, trace: Optional[Trace]) -> Optional[Dict]:
+    """
+    Runs one rule, timed as span "rule.<name>". Exceptions are swallowed
+    (a single faulty rule must never crash analysis) but counted + logged.
+
+    `trace` is passed explicitly because executor threads don't inherit
+    the caller's context.
+    """
+    name = _rule_name(rule)
+
+    with span(f"rule.{name}", trace):
+        try:
+            return rule(jd_context)
+        except Exception:
+            incr(f"rule_errors.{name}", trace=trace)
+            RULE_ERRORS.inc(rule=name)
+            log_event(logger, "rule_error", level=logging.WARNING, exc_info=True, rule=name)
+            return None
+
+
+def _run_rules_sequential(jd_context, rules: List) -> List[Optional[Dict]]:
+    trace = current_trace()
+    return [_call_rule(rule, jd_context, trace) for rule in rules]
+
+
+def rule_stragglers() -> int:
+    """Timed-out rules still holding a rule executor thread."""
+    with _stragglers_lock:
+        return _stragglers
+
+
+class _RuleRuns:
+    """
+    Progress of one analysis' rules on the executor. Rule threads report
+    start / finish under `cond`; the analysis waits on it.
+    """
+
+    def __init__(self, count: int):
+        self.cond = threading.Condition()
+        self.started: List[Optional[float]] = [None] * count
+        self.done = [False] * count
+        self.abandoned = [False] * count
+        self.outputs: List[Optional[Dict]] = [None] * count
+
+    def run(self, i: int, rule, jd_context, trace: Optional[Trace]):
+        global _stragglers
+
+        with self.cond:
+            if self.abandoned[i]:
+                return   # the analysis gave up before this rule got a thread
+            self.started[i] = time.monotonic()
+            self.cond.notify_all()
+
+        output = None
+        try:
+            output = _call_rule(rule, jd_context, trace)
+        finally:
+            with self.cond:
+                self.outputs[i] = output
+                self.done[i] = True
+                abandoned = self.abandoned[i]
+                self.cond.notify_all()
+
+            if abandoned:
+                with _stragglers_lock:
+                    _stragglers -= 1
+
+    def wait(self, rule_timeout: float, deadline: float) -> List[int]:
+        """
+        Waits until every rule finished or overran its budget: `rule_timeout`
+        counted from the rule's own start, and never past `deadline` (the
+        whole analysis, queue time included). Returns the positions of
+        unfinished rules, now abandoned; rules that never started won't run.
+        """
+        global _stragglers
+
+        with self.cond:
+            while True:
+                now = time.monotonic()
+                deadlines = [
+                    deadline if started is None else min(started + rule_timeout, deadline)
+                    for started, done in zip(self.started, self.done)
+                    if not done
+                ]
+
+                if all(d <= now for d in deadlines):
+                    break
+
+                self.cond.wait(timeout=min(d for d in deadlines if d > now) - now)
 
-        # Compensation integrity
-        unrealistic_salary_rule,
-        role_salary_mismatch_rule,
+            late = [i for i, done in enumerate(self.done) if not done]
+            running = 0
+            for i in late:
+                self.abandoned[i] = True
+                if self.started[i] is not None:
+                    running += 1
 
-        # Identity / legitimacy
-        missing_company_identity_rule,
-        poor_contact_info_rule,
+        if running:
+            with _stragglers_lock:
+                _stragglers += running
 
-        # Job content credibility
-        generic_job_title_rule,
-        hiring_process_absence_rule,
-        over_promising_language_rule,
-        language_inconsistency_rule,
+        return late
 
-        # Behavioural / suspicious funnel
-        suspicious_application_flow_rule,
 
-        # Structural / duplicate-like patterns
-        copy_paste_jd_rule,
-    ]
+def _run_rules_parallel(
+    jd_contexts: List, rules: List, rule_timeout: float, analysis_timeout: float
+) -> List[Tuple[List[Optional[Dict]], List[str]]]:
+    """
+    Fans every (posting, rule) pair out on the shared executor in one go
+    and waits once. Every rule gets `rule_timeout` seconds from when it
+    starts running, and the whole call (queue time included) at most
+    `analysis_timeout`; late rules are abandoned (a running thread runs on
+    until the rule returns) and reported.
+
+    While MAX_RULE_STRAGGLERS abandoned rules still hold executor threads,
+    nothing new is submitted and every rule is reported as timed out, so
+    the pool can't fill up with leftovers and a request never waits on it.
+
+    Returns, per posting, (outputs in rule order, names of rules skipped on timeout)
+    """
+
+    # Build the shared views once here instead of racing to build them in every rule
+    for jd_context in jd_contexts:
+        jd_context.text_index.keyword_hits  # also builds .lower
+
+    trace = current_trace()
+    count = len(jd_contexts) * len(rules)
+
+    if rule_stragglers() >= MAX_RULE_STRAGGLERS:
+        incr("rule_pool_saturated", trace=trace)
+        log_event(logger, "rule_pool_saturated", level=logging.WARNING,
+                  stragglers=rule_stragglers())
+        runs = None
+        late = set(range(count))
+    else:
+        deadline = time.monotonic() + analysis_timeout
+        executor = _get_rule_executor()
+        runs = _RuleRuns(count)
+
+        for c, jd_context in enumerate(jd_contexts):
+            for r, rule in enumerate(rules):
+                executor.submit(runs.run, c * len(rules) + r, rule, jd_context, trace)
+
+        late = set(runs.wait(rule_timeout, deadline))
+
+    per_context = []
+
+    for c in range(len(jd_contexts)):
+        outputs: List[Optional[Dict]] = []
+        skipped: List[str] = []
+
+        for r, rule in enumerate(rules):
+            i = c * len(rules) + r
+            if i in late:
+                # Can't interrupt a running thread; just stop waiting for it
+                name = _rule_name(rule)
+                skipped.append(name)
+                outputs.append(None)
+                incr(f"rule_timeouts.{name}", trace=trace)
+                RULE_TIMEOUTS.inc(rule=name)
+                if runs is not None:   # saturation was logged once above
+                    log_event(logger, "rule_timeout", level=logging.WARNING,
+                              rule=name, timeout_s=rule_timeout)
+                continue
+
+            outputs.append(runs.outputs[i])
+
+        per_context.append((outputs, skipped))
+
+    return per_context
+
+
+def _analyze_context(
+    jd_context,
+    rules: List,
+    parallel: bool = False,
+    rule_timeout: float = RULE_TIMEOUT_SECONDS,
+    analysis_timeout: float = ANALYSIS_TIMEOUT_SECONDS,
+    rule_outputs: Optional[Tuple[List[Optional[Dict]], List[str]]] = None,
+) -> Tuple[Dict, List[float]]:
+    """
+    Runs the given rule registry + insight layer on one validated JDContext.
+    `rule_outputs` are (outputs, skipped) of parallel rules already run for
+    it (batch mode); the rules are not run again.
+
+    Returns (analysis, per-rule scores in registry order). A rule that
+    failed or was skipped scores NaN there.
+    """
+
+    raw_text = jd_context.raw_text or ""
 
     total_score = 0.0
     reasons: List[str] = []
+    skipped: List[str] = []
+    scores: List[float] = []
 
     # ===== Execute Rules Safely =====
-    for rule in rules:
-        try:
-            result = rule(jd_context)
+    if rule_outputs is not None:
+        outputs, skipped = rule_outputs
+    elif parallel:
+        with span("stage.rules"):
+            [(outputs, skipped)] = _run_rules_parallel(
+                [jd_context], rules, rule_timeout, analysis_timeout
+            )
+    else:
+        with span("stage.rules"):
+            outputs = _run_rules_sequential(jd_context, rules)
+
+    # Aggregate in registry order → same score / reasons as sequential mode
+    for rule, result in zip(rules, outputs):
+        if result is None:
+            scores.append(NAN)
+            continue
 
+        try:
             score = float(result.get("score", 0.0))
             reason = result.get("reason")
 
             total_score += score
+            scores.append(score)
 
             if reason:
                 reasons.append(reason)
 
+            if score:
+                RULE_FIRED.inc(rule=_rule_name(rule))
+
         except Exception:
-            # A single faulty rule must never crash analysis
+            # malformed rule output counts as a swallowed rule error
+            incr(f"rule_errors.{_rule_name(rule)}")
+            RULE_ERRORS.inc(rule=_rule_name(rule))
+            scores.append(NAN)
             continue
 
     # Cap score at 1.0
@@ -123,14 +418,127 @@ def run_all_rules(jd_context) -> Dict:
             " ".join(jd_context.requirements or []),
             " ".join(jd_context.responsibilities or [])
         ])
-        skills_insight = extract_skills(skill_basis_text)
+        with span("stage.skills"):
+            skills_insight = extract_skills(skill_basis_text)
     except Exception:
-        skills_insight = {"skills_found": [], "skill_count": 0}
+        incr("insight_errors.skills")
+        log_event(logger, "insight_error", level=logging.WARNING, exc_info=True, insight="skills")
+        skills_insight = dict(EMPTY_SKILLS_INSIGHT)
 
-    return {
+    analysis = {
         "rule_score": total_score,
         "reasons": reasons,
         "insights": {
             "skills": skills_insight
         }
-    }
\ No newline at end of file
+    }
+
+    if parallel:
+        analysis["skipped_rules"] = skipped
+
+    return analysis, scores
+
+
+def run_all_rules(
+    jd_context,
+    parallel: bool = False,
+    rule_timeout: float = RULE_TIMEOUT_SECONDS,
+    analysis_timeout: float = ANALYSIS_TIMEOUT_SECONDS,
+) -> Dict:
+    """
+    Analysis Engine Entry Point
+
+    Required:
+        jd_context : JDContext
+
+    Optional:
+        parallel     : run rules concurrently on the shared rule executor
+        rule_timeout : (parallel only) seconds each rule may run, counted
+                       from its start; rules past it are dropped and
+                       listed in "skipped_rules"
+        analysis_timeout : (parallel only) seconds all rules may take
+                       together, time queued for a thread included;
+                       unfinished rules are dropped the same way
+
+    Notes:
+    - Raw text mode is intentionally removed.
+    - If parsing fails, engine returns safe low‑confidence output.
+    - Reasons keep registry order in both modes.
+    - A rule stuck inside a single C-level call (e.g. one regex match)
+      holds the GIL; only Python-level slowness is bounded by threads.
+    """
+
+    # ===== Validate Structured Input =====
+    if not JDContext or not isinstance(jd_context, JDContext):
+        return _invalid_input_result()
+
+    return _analyze_context(jd_context, RULES, parallel, rule_timeout, analysis_timeout)[0]
+
+
+def run_all_rules_with_scores(
+    jd_context,
+    parallel: bool = False,
+    rule_timeout: float = RULE_TIMEOUT_SECONDS,
+    analysis_timeout: float = ANALYSIS_TIMEOUT_SECONDS,
+) -> Tuple[Dict, List[float]]:
+    """
+    run_all_rules() plus the individual rule scores, aligned with
+    RULE_NAMES (NaN = rule failed or was skipped). Used by the feature
+    exporter; the rules still run only once.
+    """
+    if not JDContext or not isinstance(jd_context, JDContext):
+        return _invalid_input_result(), [NAN] * len(RULES)
+
+    return _analyze_context(jd_context, RULES, parallel, rule_timeout, analysis_timeout)
+
+
+def run_all_rules_batch(
+    contexts,
+    parallel: bool = False,
+    rule_timeout: float = RULE_TIMEOUT_SECONDS,
+    analysis_timeout: float = ANALYSIS_TIMEOUT_SECONDS,
+) -> List[Dict]:
+    """
+    Batch Analysis Entry Point
+
+    Required:
+        contexts : iterable of JDContext
+
+    Returns one result per input, in the same order, each shaped exactly
+    like run_all_rules() output. Invalid entries get the same safe
+    low‑confidence output instead of failing the whole batch.
+
+    In parallel mode the whole batch shares one executor submission and
+    one wait: every (posting, rule) pair is queued at once, so postings
+    run alongside each other instead of one after another, and the batch
+    gets `analysis_timeout` per posting as one overall deadline.
+    `rule_timeout` behaves as in run_all_rules(). Sequential mode runs
+    the postings one after another.
+    """
+
+    results: List[Optional[Dict]] = []
+    valid: List[int] = []
+
+    for jd_context in contexts:
+        if not JDContext or not isinstance(jd_context, JDContext):
+            results.append(_invalid_input_result())
+            continue
+
+        valid.append(len(results))
+        results.append(jd_context)
+
+    if parallel and valid:
+        with span("stage.rules"):
+            rule_outputs = _run_rules_parallel(
+                [results[i] for i in valid], RULES, rule_timeout,
+                analysis_timeout * len(valid),
+            )
+    else:
+        rule_outputs = [None] * len(valid)
+
+    for i, outputs in zip(valid, rule_outputs):
+        results[i] = _analyze_context(
+            results[i], RULES, parallel, rule_timeout, analysis_timeout, rule_outputs=outputs
+        )[0]
+
+    return results
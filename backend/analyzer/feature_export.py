@@ -0,0 +1,309 @@
+"""
+feature_export.py
+
+Columnar export of parsed JD fields + per-rule scores for batch analytics
+and threshold tuning.
+
+Rows are appended straight into typed column buffers (array.array for
+numbers, dictionary-encoded codes for the few categorical strings), so no
+per-row dict is ever built. A batch converts to:
+- a NumPy structured array (.npy, loads with mmap_mode="r")
+- an Arrow table (.parquet, written in row groups while appending),
+  one score_<rule> column per rule
+
+numpy / pyarrow are optional; only the matching output needs them.
+"""
+
+from array import array
+from typing import Dict, List, Optional, Sequence
+
+from analyzer.analysis_engine import RULE_NAMES, run_all_rules_with_scores
+
+try:
+    import numpy as np
+except ImportError:  # optional: only needed for .npy output
+    np = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional: only needed for Arrow / Parquet output
+    pa = None
+    pq = None
+
+
+NAN = float("nan")
+
+# Parsed numeric fields (NaN = not detected)
+FLOAT_COLUMNS = (
+    "salary_min",
+    "salary_max",
+    "salary_confidence",
+    "years_experience",
+    "experience_confidence",
+    "location_confidence",
+    "remote_confidence",
+    "employment_confidence",
+    "company_confidence",
+    "confidence_score",
+    "rule_score",
+)
+
+# Parsed categorical fields (None = not detected)
+STRING_COLUMNS = (
+    "salary_currency",
+    "salary_frequency",
+    "remote_mode",
+    "employment_type",
+)
+
+PARQUET_ROW_GROUP = 100_000
+
+
+def _float(value) -> float:
+    return NAN if value is None else float(value)
+
+
+class FeatureBatch:
+    """
+    Column buffers for many analyzed postings.
+
+    `index` ties a row back to its source (e.g. the batch record offset).
+    `rule_scores` is a flat row-major buffer of len(RULE_NAMES) per row.
+    """
+
+    def __init__(self, rule_names: Sequence[str] = RULE_NAMES):
+        self.rule_names = list(rule_names)
+        self.index = array("q")
+        self.floats: Dict[str, array] = {name: array("d") for name in FLOAT_COLUMNS}
+        self.rule_scores = array("d")
+        # categorical strings: per-row code into categories[name] (-1 = None)
+        self.codes: Dict[str, array] = {name: array("i") for name in STRING_COLUMNS}
+        self.categories: Dict[str, List[str]] = {name: [] for name in STRING_COLUMNS}
+        self._lookup: Dict[str, Dict[str, int]] = {name: {} for name in STRING_COLUMNS}
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    # ---------------- Appending ----------------
+    def add(self, jd_context, rule_scores: Sequence[float], rule_score: float,
+            index: Optional[int] = None):
+        """Appends one analyzed context (scores aligned with rule_names)."""
+        if len(rule_scores) != len(self.rule_names):
+            raise ValueError(
+                f"expected {len(self.rule_names)} rule scores, got {len(rule_scores)}"
+            )
+
+        salary = jd_context.salary
+        job = jd_context.job
+        floats = self.floats
+
+        self.index.append(len(self.index) if index is None else index)
+
+        floats["salary_min"].append(_float(salary.amount_min))
+        floats["salary_max"].append(_float(salary.amount_max))
+        floats["salary_confidence"].append(_float(salary.confidence))
+        floats["years_experience"].append(_float(job.years_experience))
+        floats["experience_confidence"].append(_float(job.experience_confidence))
+        floats["location_confidence"].append(_float(job.location_confidence))
+        floats["remote_confidence"].append(_float(job.remote_confidence))
+        floats["employment_confidence"].append(_float(job.employment_confidence))
+        floats["company_confidence"].append(_float(jd_context.company.confidence))
+        floats["confidence_score"].append(_float(jd_context.confidence_score))
+        floats["rule_score"].append(_float(rule_score))
+
+        self._add_string("salary_currency", salary.currency)
+        self._add_string("salary_frequency", salary.frequency)
+        self._add_string("remote_mode", job.remote_mode)
+        self._add_string("employment_type", job.employment_type)
+
+        self.rule_scores.extend(rule_scores)
+
+    def analyze(self, jd_context, index: Optional[int] = None) -> Dict:
+        """Runs the rules once, appends the row, returns the usual analysis."""
+        analysis, scores = run_all_rules_with_scores(jd_context)
+        self.add(jd_context, scores, analysis["rule_score"], index=index)
+        return analysis
+
+    def _add_string(self, name: str, value: Optional[str]):
+        if value is None:
+            self.codes[name].append(-1)
+            return
+
+        lookup = self._lookup[name]
+        code = lookup.get(value)
+        if code is None:
+            code = lookup[value] = len(self.categories[name])
+            self.categories[name].append(value)
+        self.codes[name].append(code)
+
+    def extend(self, other: "FeatureBatch"):
+        """Appends all rows of other (e.g. a chunk built in a worker process)."""
+        if other.rule_names != self.rule_names:
+            raise ValueError("feature batches have different rule columns")
+
+        self.index.extend(other.index)
+        self.rule_scores.extend(other.rule_scores)
+        for name in FLOAT_COLUMNS:
+            self.floats[name].extend(other.floats[name])
+
+        for name in STRING_COLUMNS:
+            # re-map other's codes onto this batch's categories
+            remap = {-1: -1}
+            for code, value in enumerate(other.categories[name]):
+                lookup = self._lookup[name]
+                if value not in lookup:
+                    lookup[value] = len(self.categories[name])
+                    self.categories[name].append(value)
+                remap[code] = lookup[value]
+            self.codes[name].extend(remap[code] for code in other.codes[name])
+
+    # ---------------- NumPy ----------------
+    def _string_width(self, name: str) -> int:
+        # NumPy strings are fixed width: size to the longest category, never truncate
+        return max((len(value) for value in self.categories[name]), default=1) or 1
+
+    def numpy_dtype(self):
+        if np is None:
+            raise ImportError("numpy is required for NumPy feature export")
+        return np.dtype(
+            [("index", "i8")]
+            + [(name, "f8") for name in FLOAT_COLUMNS]
+            + [(name, f"U{self._string_width(name)}") for name in STRING_COLUMNS]
+            + [("rule_scores", "f8", (len(self.rule_names),))]
+        )
+
+    def to_numpy(self):
+        """Structured array, one record per row; missing strings are ""."""
+        out = np.empty(len(self), dtype=self.numpy_dtype())
+
+        out["index"] = np.frombuffer(self.index, dtype="i8")
+        for name in FLOAT_COLUMNS:
+            out[name] = np.frombuffer(self.floats[name], dtype="f8")
+        for name in STRING_COLUMNS:
+            categories = np.array(self.categories[name] + [""], dtype=out.dtype[name])
+            # code -1 picks the trailing "" entry
+            out[name] = categories[np.frombuffer(self.codes[name], dtype="i4")]
+        out["rule_scores"] = np.frombuffer(self.rule_scores, dtype="f8").reshape(
+            len(self), len(self.rule_names)
+        )
+
+        return out
+
+    # ---------------- Arrow ----------------
+    def arrow_schema(self):
+        if pa is None:
+            raise ImportError("pyarrow is required for Arrow / Parquet feature export")
+        return pa.schema(
+            [pa.field("index", pa.int64())]
+            + [pa.field(name, pa.float64()) for name in FLOAT_COLUMNS]
+            + [pa.field(name, pa.dictionary(pa.int32(), pa.string())) for name in STRING_COLUMNS]
+            + [pa.field(f"score_{name}", pa.float64()) for name in self.rule_names],
+            metadata={"rule_names": ",".join(self.rule_names)},
+        )
+
+    def to_arrow(self):
+        """
+        Arrow table; categorical columns are dictionary arrays (None → null).
+        Rule scores are flat score_<rule> columns: Parquet reads flat columns
+        several times faster than a nested list column.
+        """
+        schema = self.arrow_schema()
+        columns = [pa.array(self.index, type=pa.int64())]
+        columns += [pa.array(self.floats[name], type=pa.float64()) for name in FLOAT_COLUMNS]
+
+        for name in STRING_COLUMNS:
+            codes = self.codes[name]
+            indices = pa.array(codes, type=pa.int32(), mask=_null_mask(codes))
+            columns.append(pa.DictionaryArray.from_arrays(
+                indices, pa.array(self.categories[name], type=pa.string())
+            ))
+
+        n_rules = len(self.rule_names)
+        columns += [
+            pa.array(self.rule_scores[j::n_rules], type=pa.float64()) for j in range(n_rules)
+        ]
+
+        return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _null_mask(codes: array):
+    if np is not None:
+        return np.frombuffer(codes, dtype="i4") < 0
+    return pa.array([c < 0 for c in codes], type=pa.bool_())
+
+
+def _parquet_options(table) -> Dict:
+    # The unique, increasing index column is delta-encoded; dictionary
+    # encoding everywhere else (few distinct scores / categories).
+    return {
+        "use_dictionary": [name for name in table.column_names if name != "index"],
+        "column_encoding": {"index": "DELTA_BINARY_PACKED"},
+    }
+
+
+class FeatureWriter:
+    """
+    Appends rows to a local .parquet or .npy file.
+
+    Parquet is written one row group at a time, so memory stays bounded by
+    PARQUET_ROW_GROUP rows. NumPy output needs the row count up front, so
+    rows are kept in the (compact) column buffers and written on close().
+    """
+
+    def __init__(self, path: str, rule_names: Sequence[str] = RULE_NAMES,
+                 row_group_size: int = PARQUET_ROW_GROUP):
+        if path.endswith(".parquet"):
+            self.format = "parquet"
+        elif path.endswith(".npy"):
+            self.format = "npy"
+        else:
+            raise ValueError(f"unsupported feature file (use .parquet or .npy): {path}")
+
+        self.path = path
+        self.row_group_size = row_group_size
+        self.rows = 0
+        self._batch = FeatureBatch(rule_names)
+        self._parquet = None
+
+        # fail fast if the optional dependency is missing
+        if self.format == "parquet":
+            self._batch.arrow_schema()
+        else:
+            self._batch.numpy_dtype()
+
+    def write(self, batch: FeatureBatch):
+        self._batch.extend(batch)
+        self.rows += len(batch)
+
+        if self.format == "parquet" and len(self._batch) >= self.row_group_size:
+            self._flush_parquet()
+
+    def _flush_parquet(self):
+        if not len(self._batch):
+            return
+        table = self._batch.to_arrow()
+        if self._parquet is None:
+            self._parquet = pq.ParquetWriter(self.path, table.schema, **_parquet_options(table))
+        self._parquet.write_table(table)
+        self._batch = FeatureBatch(self._batch.rule_names)
+
+    def close(self):
+        if self.format == "npy":
+            np.save(self.path, self._batch.to_numpy())
+            return
+
+        if self._parquet is None:
+            # no rows at all → still write a readable, empty file
+            table = self._batch.to_arrow()
+            pq.write_table(table, self.path, **_parquet_options(table))
+            return
+
+        self._flush_parquet()
+        self._parquet.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,235 @@
+"""
+async_fetcher.py
+
+asyncio counterpart of url_fetcher.fetch_url_content(), used by the ASGI
+service (asgi.py).
+
+Same validation, URL canonicalization, byte budget, charset handling,
+captcha detection, failure reasons, page cache and metrics as the sync
+fetcher; only the network wait differs. While a page downloads (or a
+retry backs off) the event loop serves other requests, so one process
+keeps hundreds of fetches in flight instead of one per worker thread.
+
+Requires httpx (optional dependency).
+"""
+
+import asyncio
+from typing import Optional
+
+from analyzer.ingestion.http_cache import HttpCache
+from analyzer.ingestion.url_fetcher import (
+    DEFAULT_HEADERS,
+    MAX_HTML_BYTES,
+    STREAM_CHUNK_BYTES,
+    _HtmlStreamReader,
+    _build_retry,
+    _cached_result,
+    _html_result,
+    _response_failure,
+    _validate_url,
+    canonicalize_url,
+)
+from analyzer.utils.metrics import CACHE_LOOKUPS, FETCH_RESULTS, fetch_outcome
+
+try:
+    import httpx
+except ImportError:  # optional: only the ASGI service needs it
+    httpx = None
+
+
+# ----- Connection pool config -----
+MAX_CONNECTIONS = 200           # open connections, all hosts
+MAX_KEEPALIVE_CONNECTIONS = 50  # idle connections kept for reuse
+CONNECT_TIMEOUT = 5
+
+
+def _network_failure(reason: str, status_code: Optional[int] = None) -> dict:
+    return {
+        "success": False,
+        "status_code": status_code,
+        "html": None,
+        "reason": reason,
+        "truncated": False,
+    }
+
+
+class AsyncFetcher:
+    """
+    One httpx.AsyncClient (keep-alive pool) shared by every fetch.
+
+    Retries follow url_fetcher._build_retry(): connection errors, timeouts
+    before the response arrives and retryable statuses are retried with
+    the same backoff (and Retry-After) as urllib3, but the waits are
+    asyncio.sleep() instead of a blocked thread.
+
+    Create and close it on the event loop that uses it.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = MAX_CONNECTIONS,
+        max_keepalive_connections: int = MAX_KEEPALIVE_CONNECTIONS,
+        transport=None,
+    ):
+        if httpx is None:
+            raise ImportError("httpx is required for async fetching")
+
+        self.retry = _build_retry()
+        self._client = httpx.AsyncClient(
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            transport=transport,
+        )
+
+    async def close(self):
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def fetch(
+        self,
+        url: str,
+        timeout: int = 10,
+        max_bytes: int = MAX_HTML_BYTES,
+        cache: Optional[HttpCache] = None,
+    ) -> dict:
+        """
+        Same contract and result dict as fetch_url_content() (streamed).
+        Cache reads / writes are SQLite calls and run in a worker thread.
+        """
+        _validate_url(url)
+        canonical = canonicalize_url(url)
+
+        result = await self._fetch_content(canonical.url, timeout, max_bytes, cache)
+        result["canonical_url"] = canonical.url
+        result["job_id"] = canonical.job_id
+
+        FETCH_RESULTS.inc(outcome=fetch_outcome(result["reason"]))
+        if result["cache"] is not None:
+            CACHE_LOOKUPS.inc(cache="http", outcome=result["cache"])
+
+        return result
+
+    async def _fetch_content(self, url: str, timeout: int, max_bytes: int,
+                             cache: Optional[HttpCache]):
+        entry = None
+        headers = DEFAULT_HEADERS
+
+        if cache is not None:
+            entry = await asyncio.to_thread(cache.get, url)
+
+            if entry is not None:
+                if entry.is_fresh(cache.ttl):
+                    cache.record("hits")
+                    return _cached_result(entry, "hit")
+
+                headers = dict(DEFAULT_HEADERS, **entry.conditional_headers())
+
+        result, response_headers = await self._download(url, headers, timeout, max_bytes)
+
+        if cache is None:
+            result["cache"] = None
+            return result
+
+        if result["status_code"] == 304 and entry is not None:
+            await asyncio.to_thread(
+                cache.mark_revalidated,
+                url,
+                etag=response_headers.get("ETag"),
+                last_modified=response_headers.get("Last-Modified"),
+            )
+            cache.record("revalidated")
+            return _cached_result(entry, "revalidated")
+
+        cache.record("misses")
+
+        if result["success"]:
+            await asyncio.to_thread(
+                cache.put,
+                url,
+                result["html"],
+                status_code=result["status_code"],
+                etag=response_headers.get("ETag"),
+                last_modified=response_headers.get("Last-Modified"),
+                truncated=result["truncated"],
+            )
+
+        result["cache"] = "miss"
+        return result
+
+    def _backoff(self, errors: int, response=None) -> float:
+        """Seconds to wait before the next attempt (urllib3 semantics)."""
+        retry = self.retry
+
+        if response is not None and response.status_code in retry.RETRY_AFTER_STATUS_CODES:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    return retry.parse_retry_after(retry_after)
+                except Exception:
+                    pass
+
+        if errors <= 1:
+            return 0.0
+        return min(retry.backoff_max, retry.backoff_factor * 2 ** (errors - 1))
+
+    async def _download(self, url: str, headers, timeout: int, max_bytes: int):
+        """
+        One fetch incl. retries → (result dict, response headers).
+        """
+        request_timeout = httpx.Timeout(timeout, connect=CONNECT_TIMEOUT, pool=None)
+        errors = 0
+
+        while True:
+            try:
+                async with self._client.stream(
+                    "GET", url, headers=headers, timeout=request_timeout
+                ) as response:
+                    if (response.status_code in self.retry.status_forcelist
+                            and errors < self.retry.total):
+                        errors += 1
+                        delay = self._backoff(errors, response)
+                    else:
+                        return await self._read_result(response, max_bytes), response.headers
+
+            except httpx.TimeoutException:
+                if errors >= self.retry.total:
+                    return _network_failure("network_timeout"), {}
+                errors += 1
+                delay = self._backoff(errors)
+
+            except httpx.HTTPError as e:
+                if errors >= self.retry.total:
+                    return _network_failure(f"network_error: {str(e)}"), {}
+                errors += 1
+                delay = self._backoff(errors)
+
+            await asyncio.sleep(delay)
+
+    async def _read_result(self, response, max_bytes: int) -> dict:
+        failure = _response_failure(response)
+        if failure is not None:
+            return failure
+
+        reader = _HtmlStreamReader(response, max_bytes)
+
+        # Errors here are not retried (same as a failure while streaming
+        # a requests body)
+        try:
+            async for chunk in response.aiter_bytes(STREAM_CHUNK_BYTES):
+                if reader.feed(chunk):
+                    break
+        except httpx.TimeoutException:
+            return _network_failure("network_timeout", response.status_code)
+        except httpx.HTTPError as e:
+            return _network_failure(f"network_error: {str(e)}", response.status_code)
+
+        html, truncated, blocked_early = reader.result()
+        return _html_result(response.status_code, html, truncated, blocked_early)
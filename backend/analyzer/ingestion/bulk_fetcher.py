@@ -0,0 +1,251 @@
+"""
+bulk_fetcher.py
+
+Concurrent fetching of many job URLs on top of fetch_url_content().
+
+Goals:
+- Throughput (bounded thread pool, shared keep-alive session pool)
+- Politeness (per-domain concurrency + per-domain request rate; optionally
+  robots.txt and adaptive, persisted rates via politeness.PolitenessScheduler)
+- Streaming (results are yielded as soon as each fetch completes)
+- Same validation / failure reasons as single fetches
+"""
+
+import logging
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Dict, Iterable, Iterator, Optional
+from urllib.parse import urlparse
+
+from analyzer.ingestion.canonical_url import canonicalize_url
+from analyzer.ingestion.http_cache import HttpCache
+from analyzer.ingestion.politeness import PolitenessScheduler
+from analyzer.ingestion.url_fetcher import (
+    SessionPool,
+    _validate_url,
+    fetch_url_content,
+    get_session_pool,
+)
+from analyzer.utils.logging import get_logger, log_event
+from analyzer.utils.tracing import incr
+
+
+# ----- Bulk fetch defaults -----
+MAX_WORKERS = 16              # global concurrency
+PER_DOMAIN_CONCURRENCY = 2    # simultaneous requests to one host
+PER_DOMAIN_RATE = 2.0         # request starts per second per host (None = unlimited)
+MAX_PENDING = 2000            # URLs read ahead from the input iterable
+
+logger = get_logger("bulk_fetcher")
+
+
+class _DomainQueue:
+    __slots__ = ("pending", "in_flight", "next_start", "loading_robots")
+
+    def __init__(self):
+        self.pending = deque()
+        self.in_flight = 0
+        self.next_start = 0.0
+        self.loading_robots = False
+
+
+def _domain_of(url: str) -> str:
+    return (urlparse(url).hostname or "").lower()
+
+
+def _failure(index: int, url: str, reason: str) -> Dict:
+    return {
+        "index": index,
+        "url": url,
+        "success": False,
+        "status_code": None,
+        "html": None,
+        "reason": reason,
+        "truncated": False,
+        "cache": None,
+        "canonical_url": None,
+        "job_id": None,
+    }
+
+
+def _fetch_one(index: int, url: str, target: str, timeout: int, session_pool: SessionPool,
+               cache: Optional[HttpCache],
+               scheduler: Optional[PolitenessScheduler] = None) -> Dict:
+    try:
+        result = fetch_url_content(url, timeout=timeout, session_pool=session_pool, cache=cache)
+    except Exception as e:
+        return _failure(index, url, f"fetch_error: {str(e)}")
+
+    # the request went to the canonical URL, so its host takes the outcome
+    if scheduler is not None and result.get("cache") != "hit":
+        scheduler.record(target, result)
+
+    return dict(result, index=index, url=url)
+
+
+def fetch_urls(
+    urls: Iterable[str],
+    max_workers: int = MAX_WORKERS,
+    per_domain_concurrency: int = PER_DOMAIN_CONCURRENCY,
+    per_domain_rate: Optional[float] = PER_DOMAIN_RATE,
+    timeout: int = 10,
+    session_pool: Optional[SessionPool] = None,
+    max_pending: int = MAX_PENDING,
+    cache: Optional[HttpCache] = None,
+    scheduler: Optional[PolitenessScheduler] = None,
+) -> Iterator[Dict]:
+    """
+    Fetches many URLs concurrently and yields results AS THEY COMPLETE.
+
+    Each yielded dict is the usual fetch_url_content() result plus:
+        "index" -> position of the URL in the input
+        "url"   -> the input URL
+
+    Invalid URLs are reported immediately (reason "invalid_url: ...")
+    without taking a worker slot. `urls` may be a lazy iterable; at most
+    `max_pending` URLs are buffered at a time. `cache` is passed through
+    to every fetch.
+
+    URLs are grouped by the host of their canonical form (canonicalize_url),
+    since that is where the request goes: aliases such as in.linkedin.com
+    and www.linkedin.com share one domain queue and one politeness state.
+
+    With a `scheduler`, each host's robots.txt is loaded (on a worker)
+    before its first request, disallowed URLs are reported with reason
+    "blocked_by_robots_txt", and the scheduler's adaptive per-host rate
+    replaces `per_domain_rate`. Without an explicit `session_pool`, fetches
+    then go through scheduler.session_pool, which leaves 429 / 503 to the
+    scheduler instead of retrying them.
+    """
+
+    if session_pool is None and scheduler is not None:
+        session_pool = scheduler.session_pool
+    pool = session_pool or get_session_pool()
+    if scheduler is not None:
+        per_domain_rate = None
+    min_interval = 1.0 / per_domain_rate if per_domain_rate else 0.0
+
+    source = enumerate(urls)
+    source_done = False
+    buffered = 0
+
+    domains: Dict[str, _DomainQueue] = {}
+    rate_marks: Dict[str, float] = {}
+    futures = {}
+    robots_jobs = set()
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    try:
+        while True:
+            # -------- Read ahead from input --------
+            while not source_done and buffered < max_pending:
+                try:
+                    index, url = next(source)
+                except StopIteration:
+                    source_done = True
+                    break
+
+                url = (url or "").strip()
+                try:
+                    _validate_url(url)
+                    target = canonicalize_url(url).url
+                except Exception as e:
+                    yield _failure(index, url, f"invalid_url: {str(e)}")
+                    continue
+
+                name = _domain_of(target)
+                domain = domains.get(name)
+                if domain is None:
+                    domain = domains[name] = _DomainQueue()
+                    # keep pacing a host whose queue drained moments ago
+                    domain.next_start = rate_marks.pop(name, 0.0)
+
+                    if scheduler is not None and not scheduler.robots_ready(target):
+                        domain.loading_robots = True
+                        future = executor.submit(scheduler.load_robots, target)
+                        futures[future] = name
+                        robots_jobs.add(future)
+
+                domain.pending.append((index, url, target))
+                buffered += 1
+
+            # -------- Dispatch whatever limits allow --------
+            now = time.monotonic()
+            next_wakeup = None
+
+            for name, domain in list(domains.items()):
+                while (
+                    domain.pending
+                    and len(futures) < max_workers
+                    and domain.in_flight < per_domain_concurrency
+                ):
+                    if domain.loading_robots:
+                        break
+
+                    wake = domain.next_start - now
+                    if scheduler is not None and wake <= 0:
+                        index, url, target = domain.pending[0]
+                        if not scheduler.allowed(target):
+                            domain.pending.popleft()
+                            buffered -= 1
+                            yield _failure(index, url, "blocked_by_robots_txt")
+                            continue
+                        wake = scheduler.reserve(target)
+
+                    if wake > 0:
+                        next_wakeup = wake if next_wakeup is None else min(next_wakeup, wake)
+                        break
+
+                    index, url, target = domain.pending.popleft()
+                    buffered -= 1
+                    domain.in_flight += 1
+                    domain.next_start = max(now, domain.next_start) + min_interval
+
+                    future = executor.submit(
+                        _fetch_one, index, url, target, timeout, pool, cache, scheduler
+                    )
+                    futures[future] = name
+
+                if not domain.pending and not domain.in_flight and not domain.loading_robots:
+                    if domain.next_start > now:
+                        rate_marks[name] = domain.next_start
+                    del domains[name]
+
+            if not futures:
+                if source_done and not domains:
+                    return
+
+                if next_wakeup is not None:
+                    time.sleep(next_wakeup)
+                continue
+
+            # -------- Stream completed results --------
+            done, _ = wait(futures, timeout=next_wakeup, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                name = futures.pop(future)
+                domain = domains.get(name)
+
+                if future in robots_jobs:
+                    robots_jobs.discard(future)
+                    error = future.exception()
+                    if error is not None:
+                        # the host stays allowed, but the failure is not silent
+                        incr("robots_errors")
+                        log_event(logger, "robots_load_error", level=logging.WARNING,
+                                  exc_info=error, host=name)
+                    if domain is not None:
+                        # unreachable robots.txt → scheduler allows the host
+                        domain.loading_robots = False
+                    continue
+
+                if domain is not None:
+                    domain.in_flight -= 1
+
+                yield future.result()
+
+    finally:
+        # Consumer may stop iterating early → drop queued work, don't block
+        executor.shutdown(wait=False, cancel_futures=True)
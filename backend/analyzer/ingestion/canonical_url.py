@@ -0,0 +1,146 @@
+"""
+canonical_url.py
+
+One canonical form per job URL, shared by the fetchers (url_fetcher.py,
+async_fetcher.py), the page cache key (http_cache.py) and request
+coalescing, so they can never disagree about which URLs are "the same".
+
+- tracking params (utm_*, click IDs; session / referral params on portals)
+  are dropped
+- LinkedIn / Indeed / Naukri / Wellfound job links are rebuilt from the
+  stable job ID
+- scheme / host are lowercased, default ports and fragments dropped;
+  userinfo, IPv6 brackets and the remaining query are kept as given
+"""
+
+import re
+from typing import NamedTuple, Optional
+from urllib.parse import parse_qsl, unquote_plus, urlsplit, urlunsplit
+
+from analyzer.ingestion.jd_extractor import source_for_host
+
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Dropped from every URL (ad / email / social click tracking)
+TRACKING_PARAMS = frozenset((
+    "gclid", "fbclid", "msclkid", "dclid", "yclid", "igshid",
+    "mc_cid", "mc_eid", "_hsenc", "_hsmi", "mkt_tok",
+))
+TRACKING_PARAM_PREFIXES = ("utm_",)
+
+# Also dropped on job portal URLs (session / referral / search state)
+PORTAL_TRACKING_PARAMS = frozenset((
+    "trk", "trkinfo", "refid", "trackingid", "lipi", "midtoken", "midsig",
+    "ebp", "recommendedflavor", "originalsubdomain", "from", "tk", "src",
+    "sid", "xp", "px", "alid", "ref", "referer", "position", "pagenum",
+))
+
+LINKEDIN_JOB_PATH_REGEX = re.compile(r"/jobs/view/(?:[^/]*-)?(\d{6,})(?:/|$)")
+LINKEDIN_JOB_ID_REGEX = re.compile(r"\d{6,}")
+INDEED_JOB_KEY_REGEX = re.compile(r"[0-9a-f]{16}")
+NAUKRI_JOB_PATH_REGEX = re.compile(r"^/job-listings-[^/]*?-(\d{9,})/?$")
+WELLFOUND_JOB_PATH_REGEX = re.compile(r"^(?:/company/[^/]+)?/jobs/(\d+)(?:-[^/]*)?/?$")
+
+
+class CanonicalUrl(NamedTuple):
+    url: str                  # what is fetched and cached
+    source: str               # linkedin / indeed / naukri / wellfound / generic
+    job_id: Optional[str]     # portal job ID, when the URL carries one
+
+
+def _is_tracking_param(name: str, portal: bool) -> bool:
+    name = name.lower()
+    if name in TRACKING_PARAMS or name.startswith(TRACKING_PARAM_PREFIXES):
+        return True
+    return portal and name in PORTAL_TRACKING_PARAMS
+
+
+def _portal_job(source: str, host: str, path: str, params):
+    """
+    (canonical url, job id) for a recognizable job posting URL, else None.
+    Only rewrites to forms the portal serves the same posting under.
+    """
+    query = dict((name.lower(), value) for name, value in params)
+
+    if source == "linkedin":
+        match = LINKEDIN_JOB_PATH_REGEX.search(path)
+        job_id = match.group(1) if match else query.get("currentjobid", "")
+        if LINKEDIN_JOB_ID_REGEX.fullmatch(job_id):
+            return f"https://www.linkedin.com/jobs/view/{job_id}/", job_id
+
+    elif source == "indeed":
+        job_key = (query.get("jk") or query.get("vjk") or "").lower()
+        if INDEED_JOB_KEY_REGEX.fullmatch(job_key):
+            if host in ("indeed.com", "m.indeed.com"):
+                host = "www.indeed.com"
+            return f"https://{host}/viewjob?jk={job_key}", job_key
+
+    elif source == "naukri":
+        match = NAUKRI_JOB_PATH_REGEX.match(path)
+        if match:
+            return f"https://www.naukri.com{path.rstrip('/')}", match.group(1)
+
+    elif source == "wellfound":
+        match = WELLFOUND_JOB_PATH_REGEX.match(path)
+        if match:
+            return f"https://wellfound.com{path.rstrip('/')}", match.group(1)
+
+    return None
+
+
+def _netloc(parts, scheme: str, host: str) -> str:
+    """
+    Authority rebuilt around the lowercased host: userinfo kept as given,
+    brackets back around IPv6 literals, default port dropped.
+    """
+    if ":" in host:
+        host = f"[{host}]"
+
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+
+    userinfo, at, _ = parts.netloc.rpartition("@")
+    return f"{userinfo}{at}{host}"
+
+
+def canonicalize_url(url: str) -> CanonicalUrl:
+    """
+    Stable form of a job URL, so the same posting reached through different
+    links is fetched, cached and deduplicated once.
+
+    - Known portals (LinkedIn / Indeed / Naukri / Wellfound): job posting
+      URLs are rebuilt from the stable job ID (e.g. any LinkedIn link with
+      /jobs/view/<slug>-<id> or ?currentJobId=<id> → /jobs/view/<id>/);
+      other portal URLs lose session / referral params as well.
+    - Every URL: lowercase scheme / host, no default port, no fragment,
+      no utm_* / click-id params. Userinfo, IPv6 brackets and the
+      remaining params are kept as given.
+
+    Raises ValueError for unparsable URLs (e.g. a bad port).
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    path = parts.path or "/"
+    params = parse_qsl(parts.query, keep_blank_values=True)
+
+    source = source_for_host(host)
+
+    # URLs with credentials are never rewritten (the rebuilt form would drop them)
+    if source is not None and "@" not in parts.netloc:
+        job = _portal_job(source, host, path, params)
+        if job is not None:
+            return CanonicalUrl(job[0], source, job[1])
+
+    # filter the raw pairs: kept params stay byte-for-byte as given
+    query = "&".join(
+        pair for pair in parts.query.split("&")
+        if pair and not _is_tracking_param(unquote_plus(pair.split("=", 1)[0]), source is not None)
+    )
+
+    return CanonicalUrl(
+        urlunsplit((scheme, _netloc(parts, scheme, host), path, query, "")),
+        source or "generic",
+        None,
+    )
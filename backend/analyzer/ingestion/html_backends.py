@@ -0,0 +1,60 @@
+"""
+html_backends.py
+
+HTML parser backends for the extraction layer.
+
+All backends build the same BeautifulSoup tree API, so portal selectors
+and noise filtering in jd_extractor work unchanged on every backend;
+only the tokenizer / tree builder underneath differs.
+
+Backends:
+- "html.parser" : pure-Python stdlib parser (REFERENCE, always available)
+- "lxml"        : libxml2 C parser, several times faster (optional)
+"""
+
+from typing import List, Optional
+
+from bs4 import BeautifulSoup
+
+try:
+    import lxml  # noqa: F401  (only needed so bs4 can use its tree builder)
+except ImportError:
+    lxml = None
+
+
+REFERENCE_BACKEND = "html.parser"
+FAST_BACKEND = "lxml"
+
+# Preference order when no backend is requested explicitly
+PREFERRED_BACKENDS = (FAST_BACKEND, REFERENCE_BACKEND)
+
+
+def available_backends() -> List[str]:
+    backends = [REFERENCE_BACKEND]
+    if lxml is not None:
+        backends.append(FAST_BACKEND)
+    return backends
+
+
+def default_backend() -> str:
+    available = available_backends()
+    for name in PREFERRED_BACKENDS:
+        if name in available:
+            return name
+    return REFERENCE_BACKEND
+
+
+def parse_html(html: str, backend: Optional[str] = None) -> BeautifulSoup:
+    """
+    Parses html with the requested backend (default: fastest available).
+    Raises ValueError for an unknown or unavailable backend.
+    """
+    name = backend or default_backend()
+
+    if name not in available_backends():
+        raise ValueError(
+            f"HTML backend '{name}' is not available "
+            f"(available: {', '.join(available_backends())})"
+        )
+
+    return BeautifulSoup(html, name)
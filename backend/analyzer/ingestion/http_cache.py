@@ -0,0 +1,201 @@
+"""
+http_cache.py
+
+Persistent (SQLite) cache of fetched job pages.
+
+Goals:
+- Skip the download entirely while an entry is fresh (TTL)
+- Revalidate stale entries with conditional GET (ETag / Last-Modified)
+- Bounded disk use (LRU eviction under a byte cap)
+- Hit / miss counters for monitoring
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+from analyzer.ingestion.canonical_url import canonicalize_url
+
+
+# ----- Cache defaults -----
+CACHE_TTL_SECONDS = 15 * 60         # serve without revalidation for this long
+CACHE_MAX_BYTES = 256 * 1024 * 1024 # total stored HTML before LRU eviction
+
+
+def _key(url: str) -> str:
+    # same canonical form the fetchers request (canonical_url.py)
+    return canonicalize_url(url).url
+
+
+class CacheEntry:
+    __slots__ = ("url", "html", "status_code", "etag", "last_modified",
+                 "truncated", "fetched_at")
+
+    def __init__(self, url, html, status_code, etag, last_modified, truncated, fetched_at):
+        self.url = url
+        self.html = html
+        self.status_code = status_code
+        self.etag = etag
+        self.last_modified = last_modified
+        self.truncated = bool(truncated)
+        self.fetched_at = fetched_at
+
+    def is_fresh(self, ttl: float, now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        return now - self.fetched_at < ttl
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    """
+    Thread-safe SQLite page cache.
+
+    `path` may be ":memory:" (tests) or a file path; parent dirs are created.
+    Only successful HTML fetches are stored.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float = CACHE_TTL_SECONDS,
+        max_bytes: int = CACHE_MAX_BYTES,
+    ):
+        if path != ":memory:":
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+                key           TEXT PRIMARY KEY,
+                url           TEXT NOT NULL,
+                html          TEXT NOT NULL,
+                status_code   INTEGER,
+                etag          TEXT,
+                last_modified TEXT,
+                truncated     INTEGER NOT NULL DEFAULT 0,
+                size          INTEGER NOT NULL,
+                fetched_at    REAL NOT NULL,
+                last_access   REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS pages_lru ON pages (last_access)")
+        self._conn.commit()
+
+        self._counters = {"hits": 0, "misses": 0, "revalidated": 0, "evictions": 0}
+
+    # ---------------- Lookups ----------------
+    def get(self, url: str) -> Optional[CacheEntry]:
+        key = _key(url)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, html, status_code, etag, last_modified, truncated, fetched_at "
+                "FROM pages WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            self._conn.execute(
+                "UPDATE pages SET last_access = ? WHERE key = ?", (time.time(), key)
+            )
+            self._conn.commit()
+
+        return CacheEntry(*row)
+
+    # ---------------- Writes ----------------
+    def put(
+        self,
+        url: str,
+        html: str,
+        status_code: Optional[int] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        truncated: bool = False,
+    ):
+        now = time.time()
+        size = len(html.encode("utf-8", errors="replace"))
+
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages "
+                "(key, url, html, status_code, etag, last_modified, truncated, size, fetched_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (_key(url), url, html, status_code, etag, last_modified,
+                 int(truncated), size, now, now),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def mark_revalidated(self, url: str, etag: Optional[str] = None,
+                         last_modified: Optional[str] = None):
+        """Server answered 304 → restart the entry's TTL (and pick up new validators)."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE pages SET fetched_at = ?, last_access = ?, "
+                "etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified) "
+                "WHERE key = ?",
+                (now, now, etag, last_modified, _key(url)),
+            )
+            self._conn.commit()
+
+    def delete(self, url: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM pages WHERE key = ?", (_key(url),))
+            self._conn.commit()
+
+    def _evict(self):
+        # caller holds the lock
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        victims = []
+        for key, size in self._conn.execute("SELECT key, size FROM pages ORDER BY last_access"):
+            if total <= self.max_bytes:
+                break
+            victims.append((key,))
+            total -= size
+
+        self._conn.executemany("DELETE FROM pages WHERE key = ?", victims)
+        self._counters["evictions"] += len(victims)
+
+    # ---------------- Reporting ----------------
+    def record(self, outcome: str):
+        """outcome: "hits" | "misses" | "revalidated" """
+        with self._lock:
+            self._counters[outcome] += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM pages"
+            ).fetchone()
+            return dict(self._counters, entries=entries, bytes=size)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -10,10 +10,16 @@ Goals:
 - Preserve important structure (titles, sections, bullets)
 - Aggressively remove noise (ads, cookie banners, UI chrome)
 - Never silently return garbage: predictable failure cases
+- Parser independent: works on any backend from html_backends.py
 """
 
-from bs4 import BeautifulSoup
-from typing import Optional, List
+import re
+
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from analyzer.ingestion.html_backends import parse_html
 
 
 # --- Noise detection keywords ---
@@ -23,6 +29,52 @@ NOISE_KEYWORDS = (
     "tracking", "advert", "promo"
 )
 
+# --- Source detection (cheap signals only) ---
+SOURCE_DOMAINS = (
+    ("linkedin", ("linkedin.com", "linkedin")),
+    ("indeed", ("indeed.com", "indeed")),
+    ("naukri", ("naukri.com", "naukri")),
+    ("wellfound", ("wellfound.com", "wellfound", "angel.co")),
+)
+
+SITE_NAME_WORD_REGEX = re.compile(r"[a-z0-9]+")
+
+SOURCE_META_NAMES = ("og:site_name", "og:url", "application-name", "twitter:site")
+
+# Portal-specific attributes (distinctive ones only; generic class names
+# like "description" would misclassify ordinary career pages)
+SOURCE_MARKERS = (
+    ("linkedin", (
+        {"class": "jobs-description"},
+        {"class": "jobs-box__html-content"},
+        {"class": "show-more-less-html__markup"},
+        {"class": "jobs-details"},
+    )),
+    ("indeed", (
+        {"id": "jobDescriptionText"},
+        {"class": "jobsearch-jobDescriptionText"},
+    )),
+    ("naukri", (
+        {"class": "jd-container"},
+    )),
+    ("wellfound", (
+        {"class": "styles__Description"},
+    )),
+)
+
+MARKER_IDS = {
+    marker["id"]: source
+    for source, markers in SOURCE_MARKERS for marker in markers if "id" in marker
+}
+MARKER_CLASSES = {
+    marker["class"]: source
+    for source, markers in SOURCE_MARKERS for marker in markers if "class" in marker
+}
+
+# --- Fallback block scan ---
+BLOCK_TAGS = ["p", "div", "section"]
+TEXT_STRING_TYPES = (NavigableString, CData)
+
 
 def _is_noise_element(tag) -> bool:
     if not tag:
@@ -42,27 +94,97 @@ def _is_noise_element(tag) -> bool:
     return any(k in classes or k in element_id for k in NOISE_KEYWORDS)
 
 
-def _detect_source(soup: BeautifulSoup) -> str:
+def source_for_host(host: str) -> Optional[str]:
+    """
+    Portal of a hostname, on whole labels only: "in.linkedin.com" is
+    LinkedIn, "notlinkedin.com" and "linkedin.evil.io" are not.
+    """
+    host = host.lower().rstrip(".")
+    for source, domains in SOURCE_DOMAINS:
+        for domain in domains:
+            if "." in domain and (host == domain or host.endswith("." + domain)):
+                return source
+    return None
+
+
+def _host_source(value: str) -> Optional[str]:
+    """
+    Portal named by a URL / hostname ("https://in.indeed.com/...",
+    "Naukri.com") or a site name / handle ("LinkedIn", "@indeed").
+    """
+    value = value.strip().lower()
+
+    if "." in value:
+        host = urlparse(value if "//" in value else "//" + value).hostname
+        return source_for_host(host or "")
+
+    words = set(SITE_NAME_WORD_REGEX.findall(value))
+    for source, domains in SOURCE_DOMAINS:
+        if any(d in words for d in domains if "." not in d):
+            return source
+    return None
+
+
+def _detect_source(soup: BeautifulSoup, url: Optional[str] = None) -> str:
     """
     Best-effort source detection.
     This helps us choose extraction strategies.
+
+    Looks only at cheap, high-signal places (never the whole page text):
+    1. the job URL's host
+    2. <meta> site / url tags and <link rel="canonical">
+    3. the portal-specific attributes the extractors search for
     """
 
-    html_text = soup.get_text(" ", strip=True).lower()
+    if url:
+        source = _host_source(urlparse(url).hostname or "")
+        if source:
+            return source
+
+    for meta in soup.find_all("meta"):
+        name = (meta.get("name") or meta.get("property") or "").lower()
+        content = meta.get("content")
+
+        if name in SOURCE_META_NAMES and content:
+            source = _host_source(content)
+            if source:
+                return source
+
+    for link in soup.find_all("link", rel="canonical", href=True):
+        source = _host_source(link["href"])
+        if source:
+            return source
 
-    if "linkedin" in html_text or "jobs-details" in html_text:
-        return "linkedin"
+    return _marker_source(soup) or "generic"
 
-    if "indeed" in html_text or "jobDescriptionText" in html_text:
-        return "indeed"
 
-    if "naukri" in html_text or "naukri.com" in html_text:
-        return "naukri"
+def _iter_tags(root):
+    # Plain generator walk: much cheaper than find_all(<callable>) per tag
+    return (node for node in root.descendants if isinstance(node, Tag))
 
-    if "wellfound" in html_text or "angel.co" in html_text:
-        return "wellfound"
 
-    return "generic"
+def _marker_source(soup: BeautifulSoup) -> Optional[str]:
+    """
+    Single walk over the tree for all portal markers at once.
+    Portals are ranked in SOURCE_MARKERS order, as with sequential finds.
+    """
+    found = set()
+
+    for tag in _iter_tags(soup):
+        source = MARKER_IDS.get(tag.get("id"))
+        if source:
+            found.add(source)
+
+        for cls in tag.get("class") or ():
+            source = MARKER_CLASSES.get(cls)
+            if source:
+                found.add(source)
+
+    for source, _ in SOURCE_MARKERS:
+        if source in found:
+            return source
+
+    return None
 
 
 def _extract_from_known_portal(soup: BeautifulSoup, source: str) -> Optional[str]:
@@ -125,6 +247,50 @@ def _extract_by_selectors(soup: BeautifulSoup, selectors: List[dict]) -> List[st
     return collected
 
 
+def _text_stats(root) -> Dict[int, Tuple[int, int, bool]]:
+    """
+    One bottom-up pass over `root` computing, for every tag, what
+    tag.get_text(" ", strip=True) would produce without building it:
+
+        id(tag) -> (text length, non-empty string count, contains a space)
+
+    Children are visited before parents (reverse document order), so each
+    node is aggregated exactly once instead of once per ancestor.
+    """
+
+    stats: Dict[int, Tuple[int, int, bool]] = {}
+
+    for node in reversed(list(root.descendants)):
+        if isinstance(node, Tag):
+            length = count = pieces = 0
+            spaced = False
+
+            for child in node.contents:
+                child_stats = stats.get(id(child))
+                if child_stats is None or not child_stats[1]:
+                    continue
+                length += child_stats[0]
+                count += child_stats[1]
+                spaced = spaced or child_stats[2]
+                pieces += 1
+
+            # get_text joins the strings with single spaces; children
+            # already include their own separators
+            if pieces:
+                length += pieces - 1
+                spaced = spaced or count > 1
+
+            stats[id(node)] = (length, count, spaced)
+
+        # Same string types get_text() reads (no comments, doctypes, ...)
+        elif type(node) in TEXT_STRING_TYPES:
+            stripped = node.strip()
+            if stripped:
+                stats[id(node)] = (len(stripped), 1, " " in stripped)
+
+    return stats
+
+
 def _fallback_largest_block(soup: BeautifulSoup) -> Optional[str]:
     """
     Fallback when no structured block is found.
@@ -135,33 +301,44 @@ def _fallback_largest_block(soup: BeautifulSoup) -> Optional[str]:
     if not body:
         return None
 
-    # gather paragraph-like elements
-    blocks = []
-    for tag in body.find_all(["p", "div", "section"]):
+    stats = _text_stats(body)
+
+    # gather paragraph-like elements; only the winner's text is materialized
+    largest = None
+    largest_len = 0
+
+    for tag in body.find_all(BLOCK_TAGS):
         if _is_noise_element(tag):
             continue
 
-        text = tag.get_text(" ", strip=True)
-        if not text:
-            continue
+        length, _, spaced = stats.get(id(tag), (0, 0, False))
 
         # basic sanity: should look like real language, not random UI
-        if len(text) > 120 and (" " in text):
-            blocks.append(text)
+        if length > 120 and spaced and length > largest_len:
+            largest = tag
+            largest_len = length
 
-    if not blocks:
+    if largest is None:
         return None
 
-    largest = max(blocks, key=len)
+    return largest.get_text(" ", strip=True) if largest_len > 200 else None
 
-    return largest if len(largest) > 200 else None
 
-
-def extract_job_description(html: str) -> Optional[str]:
+def extract_job_description(
+    html: str,
+    url: Optional[str] = None,
+    backend: Optional[str] = None,
+) -> Optional[str]:
     """
     Extracts readable job description text from HTML while preserving basic structure.
     Output is a structured text blob suitable for downstream parsing.
 
+    `url` (the page's address, if known) lets the portal be recognised
+    without inspecting page content.
+
+    `backend` selects the HTML parser (see html_backends.py); default is
+    the fastest one installed. "html.parser" is the reference behaviour.
+
     Returns:
         str  -> extracted JD text
         None -> extraction failed
@@ -170,7 +347,7 @@ def extract_job_description(html: str) -> Optional[str]:
     if not html:
         return None
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parse_html(html, backend)
 
     extracted_lines = []
 
@@ -193,11 +370,11 @@ def extract_job_description(html: str) -> Optional[str]:
     ]):
         tag.decompose()
 
-    for tag in soup.find_all(_is_noise_element):
+    for tag in [t for t in _iter_tags(soup) if _is_noise_element(t)]:
         tag.decompose()
 
     # ---- Portal-aware extraction ----
-    source = _detect_source(soup)
+    source = _detect_source(soup, url)
     portal_text = _extract_from_known_portal(soup, source)
 
     if portal_text:
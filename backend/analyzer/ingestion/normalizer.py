@@ -3,23 +3,44 @@ import html
 from typing import Optional
 
 
+# Single-character mappings. "\u2022" (•) maps straight to "-", so it is
+# never treated as a spaced bullet. "\r" is folded in here; the bullet
+# regex treats \r and \n alike (\s).
+# Applied with str.replace: it skips absent characters with a fast C
+# search, whereas str.translate maps non-ASCII text char by char and is
+# 20-50x slower on it.
+_CHAR_REPLACEMENTS = {
+    "\u00A0": " ",   # non-breaking space
+    "\u200B": "",    # zero width space
+    "\u2013": "-",   # en dash
+    "\u2014": "-",   # em dash
+    "\u2022": "-",   # bullet
+    "\u25CF": "-",   # filled bullet
+    "\u2212": "-",   # minus sign
+    "\r": "\n",
+}
+
+# Remaining bullet styles, together with the whitespace after them -> "- "
+_BULLET_REGEX = re.compile(r"[▪‣►»]\s*")
+
+_SPACE_RUN_REGEX = re.compile(r"[ \t][ \t]+")
+
+# Matched against the stripped, lowercased line (blank lines are dropped separately)
+_TRASH_LINE_REGEX = re.compile(
+    r"cookies? policy|privacy policy|terms and conditions|advertisement|subscribe|sign up|login"
+)
+
+
 def _clean_unicode(text: str) -> str:
     """
     Handles unicode oddities & HTML entities.
     """
     text = html.unescape(text)
 
-    replacements = {
-        "\u00A0": " ",   # non-breaking space
-        "\u200B": "",    # zero width space
-        "\u2013": "-",   # en dash
-        "\u2014": "-",   # em dash
-        "\u2022": "-",   # bullet
-        "\u25CF": "-",   # filled bullet
-        "\u2212": "-",   # minus sign
-    }
-
-    for bad, good in replacements.items():
+    if text.isascii():
+        return text.replace("\r", "\n")
+
+    for bad, good in _CHAR_REPLACEMENTS.items():
         text = text.replace(bad, good)
 
     return text
@@ -31,64 +52,40 @@ def _normalize_bullets(text: str) -> str:
     Turns weird bullet formats into:
         - something
     """
-
-    # Convert common bullet styles to dash bullets
-    bullet_patterns = [
-        r"•\s*", r"▪\s*", r"‣\s*", r"►\s*", r"»\s*", r"-\s*•\s*",
-    ]
-
-    for pat in bullet_patterns:
-        text = re.sub(pat, "- ", text)
-
-    return text
+    return _BULLET_REGEX.sub("- ", text)
 
 
-def _collapse_whitespace(text: str) -> str:
+def _clean_lines(text: str) -> str:
     """
-    Structure-preserving whitespace cleanup.
-    Does NOT aggressively flatten paragraphs.
+    Structure-preserving whitespace cleanup + garbage line removal, in one
+    pass over the lines:
+    - runs of 2+ spaces / tabs become one space
+    - every line is stripped
+    - blank lines and leftover UI crap (cookie banners, login prompts...)
+      are dropped. Very conservative.
     """
-    text = text.replace("\r", "\n")
-
-    # collapse 3+ newlines -> 2
-    text = re.sub(r"\n{3,}", "\n\n", text)
-
-    # collapse 2+ spaces
-    text = re.sub(r"[ \t]{2,}", " ", text)
-
-    # strip trailing spaces on each line
-    text = "\n".join(line.strip() for line in text.split("\n"))
+    text = _SPACE_RUN_REGEX.sub(" ", text)
+    trash = _TRASH_LINE_REGEX.match
 
-    return text.strip()
-
-
-def _remove_trash_lines(text: str) -> str:
-    """
-    Removes obvious garbage / leftover UI crap without hurting JD meaning.
-    Very conservative.
-    """
     cleaned_lines = []
-
-    trash_patterns = [
-        r"^\s*$",
-        r"^cookies? policy",
-        r"^privacy policy",
-        r"^terms and conditions",
-        r"^advertisement",
-        r"^subscribe",
-        r"^sign up",
-        r"^login",
-    ]
-
     for line in text.split("\n"):
-        lower = line.strip().lower()
+        line = line.strip()
+        if line and not trash(line.lower()):
+            cleaned_lines.append(line)
 
-        if any(re.match(p, lower) for p in trash_patterns):
-            continue
+    return "\n".join(cleaned_lines)
 
-        cleaned_lines.append(line)
 
-    return "\n".join(cleaned_lines).strip()
+def normalize_whitespace(text: str) -> str:
+    """
+    Whitespace-only form of pasted JD text, matching what
+    normalize_job_description() produces for fetched pages: line endings
+    become "\n", runs of spaces / tabs one space, lines are stripped and
+    blank lines dropped. Reposts that differ only in layout map to the
+    same text (and the same result-cache key).
+    """
+    text = _SPACE_RUN_REGEX.sub(" ", (text or "").replace("\r\n", "\n").replace("\r", "\n"))
+    return "\n".join(line.strip() for line in text.split("\n") if line.strip())
 
 
 def normalize_job_description(text: str) -> Optional[str]:
@@ -108,11 +105,10 @@ def normalize_job_description(text: str) -> Optional[str]:
 
     text = _clean_unicode(text)
     text = _normalize_bullets(text)
-    text = _collapse_whitespace(text)
-    text = _remove_trash_lines(text)
+    text = _clean_lines(text)
 
     # final sanity
     if len(text) < 200:
         return None
 
-    return text
\ No newline at end of file
+    return text
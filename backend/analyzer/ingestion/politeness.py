@@ -0,0 +1,375 @@
+"""
+politeness.py
+
+Per-domain politeness for bulk crawls (see bulk_fetcher.fetch_urls).
+
+- robots.txt is fetched once per host and cached on disk with a TTL;
+  Crawl-delay / Request-rate cap the host's request rate and Disallow
+  rules are honoured.
+- Every host gets a token bucket; requests start only when a token is
+  available.
+- The rate adapts to what the host tells us: 429 / 503 responses and
+  captcha walls halve it and pause the host (cooldown doubling with each
+  consecutive strike); successes win it back step by step (AIMD).
+- Adapted rates, strikes and cooldowns are persisted in the same SQLite
+  file, so a restarted crawl does not hammer a host that just blocked us.
+- The scheduler's own session pool never retries 429 / 503 (nor sleeps on
+  Retry-After): the first throttling answer reaches record() as a strike.
+- robots.txt is requested as ROBOTS_USER_AGENT and its rules are read for
+  the same agent.
+
+Thread-safe; `path` may be ":memory:" (tests).
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+from urllib.robotparser import RobotFileParser
+
+import requests
+
+from analyzer.ingestion.url_fetcher import (
+    RETRY_STATUSES,
+    SessionPool,
+    _build_retry,
+)
+
+
+# ----- Rate defaults -----
+DEFAULT_RATE = 2.0            # request starts per second per host
+MIN_RATE = 1 / 60             # never slower than one request a minute
+BURST = 1                     # tokens a host may bank (1 = strict spacing)
+BACKOFF_FACTOR = 0.5          # rate multiplier on a throttling signal
+RECOVERY_STEP = 0.05          # req/s won back per successful fetch
+BASE_COOLDOWN_SECONDS = 30.0  # pause after the first strike, doubled per strike
+MAX_COOLDOWN_SECONDS = 15 * 60
+STATE_TTL_SECONDS = 6 * 3600  # persisted rates older than this are forgotten
+
+THROTTLE_STATUSES = (429, 503)
+THROTTLE_REASONS = ("blocked_by_site_captcha",)
+
+# ----- robots.txt -----
+ROBOTS_AGENT = "ghosthire"              # group looked up first ("*" otherwise)
+ROBOTS_USER_AGENT = f"{ROBOTS_AGENT}/1.0"   # sent with the robots.txt request
+ROBOTS_HEADERS = {"User-Agent": ROBOTS_USER_AGENT, "Accept": "text/plain, */*;q=0.5"}
+ROBOTS_TTL_SECONDS = 24 * 3600
+ROBOTS_ERROR_TTL_SECONDS = 10 * 60      # retry unreachable robots.txt sooner
+ROBOTS_MAX_BYTES = 500 * 1024           # RFC 9309 minimum parse limit
+ROBOTS_TIMEOUT = 10
+
+
+class _HostState:
+    __slots__ = ("rate", "ceiling", "tokens", "updated", "strikes",
+                 "cooldown_until", "robots", "robots_expires")
+
+    def __init__(self, rate: float, now: float):
+        self.rate = rate
+        self.ceiling = rate
+        self.tokens = float(BURST)
+        self.updated = now
+        self.strikes = 0
+        self.cooldown_until = 0.0
+        self.robots: Optional[RobotFileParser] = None
+        self.robots_expires = 0.0
+
+
+def _host_of(url: str) -> str:
+    return (urlsplit(url).hostname or "").lower()
+
+
+def polite_session_pool(**kwargs) -> SessionPool:
+    """
+    SessionPool for scheduled crawls: 429 / 503 are returned as they are
+    (no retries, no Retry-After sleeps) so the scheduler can back off.
+    Other transient errors are retried as usual.
+    """
+    statuses = [s for s in RETRY_STATUSES if s not in THROTTLE_STATUSES]
+    retry = _build_retry(statuses)
+    retry.respect_retry_after_header = False
+    return SessionPool(max_retries=retry, **kwargs)
+
+
+def _parse_robots(status: Optional[int], body: str) -> RobotFileParser:
+    """
+    RFC 9309: 2xx → rules; 4xx (incl. 401/403) → no rules; 5xx / network
+    error → no rules either, but only cached for ROBOTS_ERROR_TTL_SECONDS.
+    """
+    parser = RobotFileParser()
+    if status is not None and 200 <= status < 300:
+        parser.parse(body.splitlines())
+    else:
+        parser.allow_all = True
+    parser.modified()
+    return parser
+
+
+class PolitenessScheduler:
+    """
+    Token buckets + robots.txt rules per host, persisted in SQLite.
+
+    Typical loop (bulk_fetcher does this):
+        if not scheduler.allowed(url): skip
+        wait = scheduler.reserve(url)   # 0 → start now (token taken)
+        ...fetch (through scheduler.session_pool)...
+        scheduler.record(url, result)
+
+    Without `session_pool` the scheduler owns a polite_session_pool().
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        default_rate: float = DEFAULT_RATE,
+        robots_ttl: float = ROBOTS_TTL_SECONDS,
+        session_pool: Optional[SessionPool] = None,
+        clock=time.time,
+    ):
+        if path != ":memory:":
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.default_rate = default_rate
+        self.robots_ttl = robots_ttl
+        self._owns_pool = session_pool is None
+        self.session_pool = session_pool or polite_session_pool()
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, _HostState] = {}
+        self._robots_locks: Dict[str, threading.Lock] = {}
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS host_state (
+                host           TEXT PRIMARY KEY,
+                rate           REAL NOT NULL,
+                strikes        INTEGER NOT NULL,
+                cooldown_until REAL NOT NULL,
+                updated_at     REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS robots (
+                host       TEXT PRIMARY KEY,
+                status     INTEGER,
+                body       TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    # ---------------- Host state ----------------
+    def _state(self, host: str, now: float) -> _HostState:
+        """In-memory state, loaded from disk on first use. Caller holds _lock."""
+        state = self._hosts.get(host)
+        if state is not None:
+            return state
+
+        state = self._hosts[host] = _HostState(self.default_rate, now)
+
+        row = self._conn.execute(
+            "SELECT rate, strikes, cooldown_until, updated_at FROM host_state WHERE host = ?",
+            (host,),
+        ).fetchone()
+
+        if row is not None and now - row[3] < STATE_TTL_SECONDS:
+            state.rate = min(row[0], self.default_rate)
+            state.strikes = row[1]
+            state.cooldown_until = row[2]
+
+        return state
+
+    def _save(self, host: str, state: _HostState, now: float):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO host_state (host, rate, strikes, cooldown_until, updated_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (host, state.rate, state.strikes, state.cooldown_until, now),
+        )
+        self._conn.commit()
+
+    # ---------------- robots.txt ----------------
+    def robots_ready(self, url: str) -> bool:
+        """True if the host's robots.txt is known (no network needed)."""
+        host = _host_of(url)
+        now = self._clock()
+
+        with self._lock:
+            state = self._state(host, now)
+            if state.robots is not None and now < state.robots_expires:
+                return True
+
+            row = self._conn.execute(
+                "SELECT status, body, fetched_at FROM robots WHERE host = ?", (host,)
+            ).fetchone()
+
+            if row is None or now >= self._robots_expiry(row[0], row[2]):
+                return False
+
+            self._apply_robots(state, _parse_robots(row[0], row[1]),
+                               self._robots_expiry(row[0], row[2]))
+            return True
+
+    def load_robots(self, url: str):
+        """
+        Fetches and caches the host's robots.txt unless already known.
+        Blocking (network); call it from a worker thread.
+        """
+        host = _host_of(url)
+
+        with self._lock:
+            host_lock = self._robots_locks.setdefault(host, threading.Lock())
+
+        # one fetch per host even if several workers ask at once
+        with host_lock:
+            if self.robots_ready(url):
+                return
+
+            parts = urlsplit(url)
+            status, body = self._fetch_robots(f"{parts.scheme}://{parts.netloc}/robots.txt")
+            now = self._clock()
+
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO robots (host, status, body, fetched_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (host, status, body, now),
+                )
+                self._conn.commit()
+                self._apply_robots(self._state(host, now), _parse_robots(status, body),
+                                   self._robots_expiry(status, now))
+
+    def _robots_expiry(self, status: Optional[int], fetched_at: float) -> float:
+        if status is None or status >= 500:
+            return fetched_at + min(ROBOTS_ERROR_TTL_SECONDS, self.robots_ttl)
+        return fetched_at + self.robots_ttl
+
+    def _fetch_robots(self, robots_url: str) -> Tuple[Optional[int], str]:
+        try:
+            response = self.session_pool.get(
+                robots_url, headers=ROBOTS_HEADERS, timeout=(5, ROBOTS_TIMEOUT), stream=True
+            )
+        except requests.exceptions.RequestException:
+            return None, ""
+
+        try:
+            received = bytearray()
+            for chunk in response.iter_content(chunk_size=16 * 1024):
+                received += chunk
+                if len(received) >= ROBOTS_MAX_BYTES:
+                    break
+            return response.status_code, bytes(received[:ROBOTS_MAX_BYTES]).decode(
+                "utf-8", errors="replace"
+            )
+        except requests.exceptions.RequestException:
+            return None, ""
+        finally:
+            response.close()
+
+    def _apply_robots(self, state: _HostState, parser: RobotFileParser, expires: float):
+        """Caller holds _lock."""
+        state.robots = parser
+        state.robots_expires = expires
+
+        ceiling = self.default_rate
+
+        delay = parser.crawl_delay(ROBOTS_AGENT)
+        if delay:
+            ceiling = min(ceiling, 1.0 / float(delay))
+
+        request_rate = parser.request_rate(ROBOTS_AGENT)
+        if request_rate and request_rate.requests:
+            ceiling = min(ceiling, request_rate.requests / request_rate.seconds)
+
+        state.ceiling = max(ceiling, MIN_RATE)
+        state.rate = min(state.rate, state.ceiling)
+
+    def allowed(self, url: str) -> bool:
+        """
+        robots.txt verdict for url; True while robots.txt is not loaded yet.
+        """
+        with self._lock:
+            state = self._state(_host_of(url), self._clock())
+            if state.robots is None:
+                return True
+            return state.robots.can_fetch(ROBOTS_AGENT, url)
+
+    # ---------------- Token bucket ----------------
+    def reserve(self, url: str) -> float:
+        """
+        Takes a token for url's host if one is available and returns 0.
+        Otherwise takes nothing and returns the seconds until one is.
+        """
+        host = _host_of(url)
+        now = self._clock()
+
+        with self._lock:
+            state = self._state(host, now)
+
+            if now < state.cooldown_until:
+                return state.cooldown_until - now
+
+            state.tokens = min(float(BURST), state.tokens + (now - state.updated) * state.rate)
+            state.updated = now
+
+            if state.tokens >= 1.0:
+                state.tokens -= 1.0
+                return 0.0
+
+            return (1.0 - state.tokens) / state.rate
+
+    def record(self, url: str, result: Dict):
+        """
+        Adapts the host's rate to one fetch result (fetch_url_content dict).
+        """
+        host = _host_of(url)
+        now = self._clock()
+        throttled = (
+            result.get("status_code") in THROTTLE_STATUSES
+            or result.get("reason") in THROTTLE_REASONS
+        )
+
+        with self._lock:
+            state = self._state(host, now)
+
+            if throttled:
+                state.strikes += 1
+                state.rate = max(MIN_RATE, state.rate * BACKOFF_FACTOR)
+                cooldown = min(MAX_COOLDOWN_SECONDS,
+                               BASE_COOLDOWN_SECONDS * 2 ** (state.strikes - 1))
+                state.cooldown_until = max(state.cooldown_until, now + cooldown)
+                state.tokens = 0.0
+                self._save(host, state, now)
+
+            elif result.get("success") and (state.strikes or state.rate < state.ceiling):
+                state.strikes = 0
+                state.rate = min(state.ceiling, state.rate + RECOVERY_STEP)
+                self._save(host, state, now)
+
+    def host_stats(self, url: str) -> Dict:
+        """Current rate / limits for url's host (diagnostics, tests)."""
+        now = self._clock()
+        with self._lock:
+            state = self._state(_host_of(url), now)
+            return {
+                "rate": state.rate,
+                "ceiling": state.ceiling,
+                "strikes": state.strikes,
+                "cooldown_seconds": max(0.0, state.cooldown_until - now),
+                "robots_loaded": state.robots is not None,
+            }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+        if self._owns_pool:
+            self.session_pool.close()
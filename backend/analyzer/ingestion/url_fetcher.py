@@ -9,14 +9,25 @@ Goals:
 - Security (no file:// etc, only http/https)
 - Validation (must return meaningful HTML)
 - Helpful failure reasons (not vague errors)
+- Connection reuse (keep-alive pool shared across threads)
+- Optional persistent page cache (see http_cache.py)
+- URL canonicalization (see canonical_url.py) before fetch + cache
 """
 
 import re
+import codecs
+import threading
 import requests
+from typing import List, Optional
 from urllib.parse import urlparse
 from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
 from urllib3.util.retry import Retry
 
+from analyzer.ingestion.canonical_url import CanonicalUrl, canonicalize_url  # noqa: F401 (re-export)
+from analyzer.ingestion.http_cache import CacheEntry, HttpCache
+from analyzer.utils.metrics import CACHE_LOOKUPS, FETCH_RESULTS, fetch_outcome
+
 
 DEFAULT_HEADERS = {
     "User-Agent": (
@@ -29,6 +40,23 @@ DEFAULT_HEADERS = {
 }
 
 
+# ----- Body download config -----
+MAX_HTML_BYTES = 2_000_000      # byte budget per page (protect memory)
+STREAM_CHUNK_BYTES = 64 * 1024
+META_SNIFF_BYTES = 4096         # where <meta charset> is looked for
+
+HEADER_CHARSET_REGEX = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.IGNORECASE)
+META_CHARSET_REGEX = re.compile(
+    rb"<meta[^>]+charset\s*=\s*[\"']?\s*([\w.:-]+)", re.IGNORECASE
+)
+
+
+# ----- Connection pool config -----
+POOL_CONNECTIONS = 20   # distinct hosts kept alive
+POOL_MAXSIZE = 10       # open connections per host
+POOL_BLOCK = False      # don't block callers when a host's pool is exhausted
+
+
 CAPTCHA_KEYWORDS = [
     "captcha",
     "robot check",
@@ -63,27 +91,316 @@ def _validate_url(url: str):
         raise Exception("Invalid URL provided")
 
 
-def _build_session():
-    session = requests.Session()
+RETRY_STATUSES = (429, 500, 502, 503, 504)
 
-    retry_strategy = Retry(
+
+def _build_retry(statuses=RETRY_STATUSES) -> Retry:
+    return Retry(
         total=3,
         backoff_factor=0.8,
-        status_forcelist=[429, 500, 502, 503, 504],
+        status_forcelist=list(statuses),
         allowed_methods=["GET"],
         raise_on_status=False,
     )
 
-    adapter = HTTPAdapter(max_retries=retry_strategy)
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
 
-    return session
+class ConnectionStats:
+    """
+    Thread-safe counters for connection reuse across a SessionPool.
+
+    requests         -> HTTP requests put on the wire (incl. retries / redirects)
+    new_connections  -> TCP (+TLS) connections opened
+    reused           -> requests served over an already open keep-alive connection
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.new_connections = 0
+
+    def incr(self, field: str):
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            requests_made = self.requests
+            new_connections = self.new_connections
+
+        return {
+            "requests": requests_made,
+            "new_connections": new_connections,
+            "reused_connections": max(requests_made - new_connections, 0),
+        }
+
+
+def _counting_pool_classes(stats: ConnectionStats) -> dict:
+    """
+    urllib3 pool classes that report opened connections / sent requests to stats.
+    """
+
+    class _CountingMixin:
+        def _new_conn(self):
+            stats.incr("new_connections")
+            return super()._new_conn()
+
+        def _make_request(self, *args, **kwargs):
+            stats.incr("requests")
+            return super()._make_request(*args, **kwargs)
+
+    class CountingHTTPConnectionPool(_CountingMixin, HTTPConnectionPool):
+        pass
+
+    class CountingHTTPSConnectionPool(_CountingMixin, HTTPSConnectionPool):
+        pass
+
+    return {"http": CountingHTTPConnectionPool, "https": CountingHTTPSConnectionPool}
+
+
+class _PooledAdapter(HTTPAdapter):
+    def __init__(self, stats: ConnectionStats, **kwargs):
+        self._stats = stats
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = _counting_pool_classes(self._stats)
+
+
+class SessionPool:
+    """
+    Keep-alive connection pool shared by every fetch in the process.
+
+    requests.Session is not thread-safe, so each thread gets its own Session,
+    but all of them are mounted on ONE adapter. The adapter's urllib3
+    PoolManager owns the per-host connection pools, so a Flask worker thread
+    fetching a LinkedIn / Naukri URL reuses connections (and TLS sessions)
+    opened by any other thread for the same host.
+
+    pool_connections -> number of distinct hosts kept alive
+    pool_maxsize     -> max open connections per host
+    pool_block       -> wait for a free connection instead of opening extra ones
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = POOL_CONNECTIONS,
+        pool_maxsize: int = POOL_MAXSIZE,
+        pool_block: bool = POOL_BLOCK,
+        max_retries: Optional[Retry] = None,
+    ):
+        self.stats = ConnectionStats()
+        self._adapter = _PooledAdapter(
+            self.stats,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            max_retries=max_retries or _build_retry(),
+        )
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sessions: List[requests.Session] = []
+
+    def session(self) -> requests.Session:
+        """Session bound to the calling thread (created on first use)."""
+        session = getattr(self._local, "session", None)
+
+        if session is None:
+            session = requests.Session()
+            session.mount("http://", self._adapter)
+            session.mount("https://", self._adapter)
+            self._local.session = session
+
+            with self._lock:
+                self._sessions.append(session)
+
+        return session
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.session().get(url, **kwargs)
 
+    def close(self):
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
 
-def fetch_url_content(url: str, timeout: int = 10):
+        for session in sessions:
+            session.close()
+
+        self._adapter.close()
+
+
+_default_pool: Optional[SessionPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def get_session_pool() -> SessionPool:
+    """Process-wide SessionPool, created lazily."""
+    global _default_pool
+
+    if _default_pool is None:
+        with _default_pool_lock:
+            if _default_pool is None:
+                _default_pool = SessionPool()
+
+    return _default_pool
+
+
+def configure_session_pool(**kwargs) -> SessionPool:
+    """
+    Replaces the process-wide pool (e.g. different per-host limits).
+    Accepts the same keyword arguments as SessionPool.
+    Meant for startup configuration: the previous pool is closed.
+    """
+    global _default_pool
+
+    with _default_pool_lock:
+        old, _default_pool = _default_pool, SessionPool(**kwargs)
+
+    if old is not None:
+        old.close()
+
+    return _default_pool
+
+
+def get_session_pool_stats() -> dict:
+    return get_session_pool().stats.snapshot()
+
+
+def _header_charset(response: requests.Response) -> Optional[str]:
+    content_type = response.headers.get("Content-Type", "")
+    match = HEADER_CHARSET_REGEX.search(content_type)
+    return match.group(1) if match else None
+
+
+def _meta_charset(head: bytes) -> Optional[str]:
+    """
+    <meta charset="..."> or <meta http-equiv=... content="...; charset=...">
+    Looked up in raw bytes, so the page is never decoded twice.
+    """
+    match = META_CHARSET_REGEX.search(head[:META_SNIFF_BYTES])
+    if not match:
+        return None
+    return match.group(1).decode("ascii", errors="ignore") or None
+
+
+def _resolve_charset(response: requests.Response, head: bytes) -> str:
+    for candidate in (_header_charset(response), _meta_charset(head)):
+        if not candidate:
+            continue
+        try:
+            return codecs.lookup(candidate.strip().strip("'\"")).name
+        except LookupError:
+            continue
+    return "utf-8"
+
+
+class _HtmlStreamReader:
+    """
+    Incremental decoding of a streamed body, chunk by chunk (shared with
+    the asyncio fetcher, which feeds it from an async iterator).
+    """
+
+    def __init__(self, response, max_bytes: int):
+        self.response = response
+        self.max_bytes = max_bytes
+        self.decoder = None
+        self.parts: List[str] = []
+        self.received = 0
+        self.truncated = False
+        self.blocked_early = False
+
+    def feed(self, chunk: bytes) -> bool:
+        """Adds one chunk; True means stop reading."""
+        if not chunk:
+            return False
+
+        remaining = self.max_bytes - self.received
+        if len(chunk) > remaining:
+            chunk = chunk[:remaining]
+            self.truncated = True
+
+        self.received += len(chunk)
+
+        if self.decoder is None:
+            charset = _resolve_charset(self.response, chunk)
+            self.decoder = codecs.getincrementaldecoder(charset)(errors="replace")
+            first_text = self.decoder.decode(chunk)
+            self.parts.append(first_text)
+
+            # Fail fast on bot walls without downloading the rest
+            if len(first_text.strip()) >= 200 and _looks_like_captcha(first_text):
+                self.blocked_early = True
+                return True
+        else:
+            self.parts.append(self.decoder.decode(chunk))
+
+        if self.truncated or self.received >= self.max_bytes:
+            self.truncated = True
+            return True
+
+        return False
+
+    def result(self):
+        """(html, truncated, blocked_early)"""
+        if self.blocked_early:
+            return self.parts[0], False, True
+
+        if self.decoder is not None and not self.truncated:
+            self.parts.append(self.decoder.decode(b"", final=True))
+
+        return "".join(self.parts), self.truncated, False
+
+
+def _read_html_stream(response: requests.Response, max_bytes: int):
+    """
+    Reads a streamed body in chunks, decoding incrementally.
+    Stops at `max_bytes` and bails out on the first chunk if it already
+    looks like a captcha / bot wall.
+
+    Returns (html, truncated, blocked_early)
+    """
+    reader = _HtmlStreamReader(response, max_bytes)
+
+    for chunk in response.iter_content(chunk_size=STREAM_CHUNK_BYTES):
+        if reader.feed(chunk):
+            break
+
+    return reader.result()
+
+
+def _cached_result(entry: CacheEntry, outcome: str):
+    return {
+        "success": True,
+        "status_code": entry.status_code,
+        "html": entry.html,
+        "reason": None,
+        "truncated": entry.truncated,
+        "cache": outcome,
+    }
+
+
+def fetch_url_content(
+    url: str,
+    timeout: int = 10,
+    session_pool: Optional[SessionPool] = None,
+    stream: bool = True,
+    max_bytes: int = MAX_HTML_BYTES,
+    cache: Optional[HttpCache] = None,
+):
     """
     Fetch raw HTML content from a URL in a robust, production-safe way.
+    Connections are reused through `session_pool` (default: process-wide pool).
+
+    stream=True (default) reads the body in chunks and stops at `max_bytes`,
+    so oversized pages never sit fully in memory. stream=False keeps the
+    legacy behaviour (full download, then cut to `max_bytes` characters).
+
+    With a `cache`, fresh entries are served without a request and stale
+    ones are revalidated with If-None-Match / If-Modified-Since.
+
+    The URL is canonicalized first (canonicalize_url): the canonical URL is
+    what gets fetched and cached, so tracking / session variants of one
+    posting share a cache entry.
 
     Returns dict:
     {
@@ -91,19 +408,91 @@ def fetch_url_content(url: str, timeout: int = 10):
         "status_code": int | None,
         "html": str | None,
         "reason": str | None,
+        "truncated": bool,
+        "cache": "hit" | "revalidated" | "miss" | None (no cache used),
+        "canonical_url": str,
+        "job_id": str | None (portal job ID),
     }
     """
 
     _validate_url(url)
+    canonical = canonicalize_url(url)
+
+    result = _fetch_content(
+        canonical.url, timeout, session_pool or get_session_pool(), stream, max_bytes, cache
+    )
+    result["canonical_url"] = canonical.url
+    result["job_id"] = canonical.job_id
+
+    FETCH_RESULTS.inc(outcome=fetch_outcome(result["reason"]))
+    if result["cache"] is not None:
+        CACHE_LOOKUPS.inc(cache="http", outcome=result["cache"])
+
+    return result
+
+
+def _fetch_content(url: str, timeout: int, pool: SessionPool, stream: bool,
+                   max_bytes: int, cache: Optional[HttpCache]):
+    """
+    Cache lookup / revalidation around one download (see fetch_url_content).
+    """
+
+    entry = None
+    headers = DEFAULT_HEADERS
+
+    if cache is not None:
+        entry = cache.get(url)
 
-    session = _build_session()
+        if entry is not None:
+            if entry.is_fresh(cache.ttl):
+                cache.record("hits")
+                return _cached_result(entry, "hit")
+
+            headers = dict(DEFAULT_HEADERS, **entry.conditional_headers())
+
+    result, response_headers = _download(url, pool, headers, timeout, stream, max_bytes)
+
+    if cache is None:
+        result["cache"] = None
+        return result
+
+    if result["status_code"] == 304 and entry is not None:
+        cache.mark_revalidated(
+            url,
+            etag=response_headers.get("ETag"),
+            last_modified=response_headers.get("Last-Modified"),
+        )
+        cache.record("revalidated")
+        return _cached_result(entry, "revalidated")
+
+    cache.record("misses")
+
+    if result["success"]:
+        cache.put(
+            url,
+            result["html"],
+            status_code=result["status_code"],
+            etag=response_headers.get("ETag"),
+            last_modified=response_headers.get("Last-Modified"),
+            truncated=result["truncated"],
+        )
+
+    result["cache"] = "miss"
+    return result
+
+
+def _download(url: str, pool: SessionPool, headers, timeout: int, stream: bool, max_bytes: int):
+    """
+    One network fetch → (result dict, response headers).
+    """
 
     try:
-        response = session.get(
+        response = pool.get(
             url,
-            headers=DEFAULT_HEADERS,
+            headers=headers,
             timeout=(5, timeout),  # connect timeout, read timeout
             allow_redirects=True,
+            stream=stream,
         )
     except requests.exceptions.Timeout:
         return {
@@ -111,23 +500,63 @@ def fetch_url_content(url: str, timeout: int = 10):
             "status_code": None,
             "html": None,
             "reason": "network_timeout",
-        }
+            "truncated": False,
+        }, {}
     except requests.exceptions.RequestException as e:
         return {
             "success": False,
             "status_code": None,
             "html": None,
             "reason": f"network_error: {str(e)}",
-        }
+            "truncated": False,
+        }, {}
 
+    # Streamed responses hold their connection until closed
+    try:
+        return _build_fetch_result(response, stream, max_bytes), response.headers
+    except requests.exceptions.Timeout:
+        return {
+            "success": False,
+            "status_code": response.status_code,
+            "html": None,
+            "reason": "network_timeout",
+            "truncated": False,
+        }, response.headers
+    except requests.exceptions.RequestException as e:
+        return {
+            "success": False,
+            "status_code": response.status_code,
+            "html": None,
+            "reason": f"network_error: {str(e)}",
+            "truncated": False,
+        }, response.headers
+    finally:
+        response.close()
+
+
+def _response_failure(response) -> Optional[dict]:
+    """
+    Failure result decided by status / headers alone (before the body is
+    read), or None.
+    """
     status = response.status_code
 
+    if status == 304:
+        return {
+            "success": False,
+            "status_code": status,
+            "html": None,
+            "reason": "not_modified",
+            "truncated": False,
+        }
+
     if status >= 400:
         return {
             "success": False,
             "status_code": status,
             "html": None,
             "reason": f"http_error_{status}",
+            "truncated": False,
         }
 
     if not _is_html_response(response):
@@ -136,9 +565,24 @@ def fetch_url_content(url: str, timeout: int = 10):
             "status_code": status,
             "html": None,
             "reason": "non_html_content",
+            "truncated": False,
         }
 
-    html = response.text or ""
+    return None
+
+
+def _html_result(status: int, html: str, truncated: bool, blocked_early: bool = False) -> dict:
+    """
+    Validates a downloaded page (must return meaningful HTML).
+    """
+    if blocked_early:
+        return {
+            "success": False,
+            "status_code": status,
+            "html": html,
+            "reason": "blocked_by_site_captcha",
+            "truncated": False,
+        }
 
     # Hard fail if suspiciously tiny
     if len(html.strip()) < 200:
@@ -147,6 +591,7 @@ def fetch_url_content(url: str, timeout: int = 10):
             "status_code": status,
             "html": html,
             "reason": "empty_or_too_small",
+            "truncated": truncated,
         }
 
     # Detect captcha / bot challenges
@@ -156,15 +601,33 @@ def fetch_url_content(url: str, timeout: int = 10):
             "status_code": status,
             "html": html,
             "reason": "blocked_by_site_captcha",
+            "truncated": truncated,
         }
 
-    # Safety: large pages truncated (protect memory)
-    if len(html) > 2_000_000:  # 2MB
-        html = html[:2_000_000]
-
     return {
         "success": True,
         "status_code": status,
         "html": html,
         "reason": None,
-    }
\ No newline at end of file
+        "truncated": truncated,
+    }
+
+
+def _build_fetch_result(response: requests.Response, stream: bool, max_bytes: int):
+    failure = _response_failure(response)
+    if failure is not None:
+        return failure
+
+    if stream:
+        html, truncated, blocked_early = _read_html_stream(response, max_bytes)
+        return _html_result(response.status_code, html, truncated, blocked_early)
+
+    html = response.text or ""
+    result = _html_result(response.status_code, html, False)
+
+    # Safety: large pages truncated (protect memory)
+    if result["success"] and len(html) > max_bytes:
+        result["html"] = html[:max_bytes]
+        result["truncated"] = True
+
+    return result
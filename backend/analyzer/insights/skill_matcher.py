@@ -0,0 +1,171 @@
+"""
+Single-pass skill matcher over an external taxonomy.
+
+The taxonomy (data/skill_taxonomy.json) lists canonical skills with their
+aliases. Every alias is tokenized and inserted into ONE token trie, so a
+document is tokenized once and each token position walks the trie instead
+of scanning the whole text once per alias.
+
+Matching semantics are identical to the old per-alias loop:
+- text is lowercased and split into runs of [a-z0-9+#/]
+- an alias matches where its tokens appear as consecutive tokens
+  (i.e. `f" {alias} "` in the normalized text)
+Overlapping aliases ("spring" inside "spring boot") are each reported.
+"""
+
+import json
+import os
+import re
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+
+TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "skill_taxonomy.json")
+
+TOKEN_REGEX = re.compile(r"[a-z0-9+#/]+")
+
+_END = ""  # trie terminal marker (never a token)
+
+
+def tokenize(text: str) -> Iterator[Tuple[str, int, int]]:
+    """(token, start, end) over the lowercased text."""
+    for m in TOKEN_REGEX.finditer(text.lower()):
+        yield m.group(), m.start(), m.end()
+
+
+class SkillTaxonomy(NamedTuple):
+    version: str
+    skills: Dict[str, List[str]]      # canonical skill → aliases
+    categories: Dict[str, str]        # canonical skill → category
+
+
+def load_taxonomy(path: str = TAXONOMY_PATH) -> SkillTaxonomy:
+    """
+    Loads and validates a taxonomy file:
+        {"version": "...", "skills": [{"name": ..., "category": ..., "aliases": [...]}, ...]}
+    Raises ValueError on malformed content.
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    if not isinstance(data, dict) or not data.get("version"):
+        raise ValueError(f"{path}: taxonomy needs a 'version'")
+
+    skills: Dict[str, List[str]] = {}
+    categories: Dict[str, str] = {}
+
+    for entry in data.get("skills") or []:
+        name = (entry.get("name") or "").strip().lower()
+        if not name:
+            raise ValueError(f"{path}: skill entry without a name: {entry!r}")
+        if name in skills:
+            raise ValueError(f"{path}: duplicate skill '{name}'")
+
+        aliases = [a.strip().lower() for a in entry.get("aliases") or [name] if a.strip()]
+        skills[name] = aliases
+        categories[name] = entry.get("category") or "other"
+
+    return SkillTaxonomy(str(data["version"]), skills, categories)
+
+
+class SkillMatch(NamedTuple):
+    skill: str
+    alias: str
+    start: int      # character offsets into job_text.lower()
+    end: int
+
+
+class SkillMatches:
+    """
+    Result of one scan: every alias occurrence, in text order.
+    """
+
+    __slots__ = ("matches",)
+
+    def __init__(self, matches: List[SkillMatch]):
+        self.matches = matches
+
+    def skills(self) -> List[str]:
+        """Distinct canonical skills, sorted."""
+        return sorted({m.skill for m in self.matches})
+
+    def counts(self) -> Dict[str, int]:
+        """Occurrences per canonical skill."""
+        counts: Dict[str, int] = {}
+        for m in self.matches:
+            counts[m.skill] = counts.get(m.skill, 0) + 1
+        return counts
+
+    def positions(self, skill: str) -> List[Tuple[int, int]]:
+        return [(m.start, m.end) for m in self.matches if m.skill == skill]
+
+
+class SkillMatcher:
+    """
+    Token trie over all aliases of a taxonomy. Immutable after construction,
+    so one instance is safely shared across threads.
+    """
+
+    def __init__(self, taxonomy: SkillTaxonomy):
+        self.version = taxonomy.version
+        self.categories = taxonomy.categories
+        self._trie: Dict = {}
+        self.max_alias_tokens = 0
+
+        for skill, aliases in taxonomy.skills.items():
+            for alias in aliases:
+                tokens = [t for t, _, _ in tokenize(alias)]
+                if not tokens:
+                    continue
+
+                node = self._trie
+                for token in tokens:
+                    node = node.setdefault(token, {})
+
+                # one alias may belong to several skills
+                owners = node.setdefault(_END, [])
+                if (skill, alias) not in owners:
+                    owners.append((skill, alias))
+
+                self.max_alias_tokens = max(self.max_alias_tokens, len(tokens))
+
+    def scan(self, text: str) -> SkillMatches:
+        """Single pass over the tokens of text → every alias occurrence."""
+        if not text:
+            return SkillMatches([])
+
+        spans = list(TOKEN_REGEX.finditer(text.lower()))
+        tokens = [m.group() for m in spans]
+        n_tokens = len(tokens)
+        trie = self._trie
+        matches: List[SkillMatch] = []
+
+        for i, token in enumerate(tokens):
+            node = trie.get(token)
+            if node is None:
+                continue  # most tokens: one dict miss
+
+            j = i
+            while node is not None:
+                owners = node.get(_END)
+                if owners:
+                    start, end = spans[i].start(), spans[j].end()
+                    for skill, alias in owners:
+                        matches.append(SkillMatch(skill, alias, start, end))
+
+                j += 1
+                if j == n_tokens:
+                    break
+                node = node.get(tokens[j])
+
+        return SkillMatches(matches)
+
+
+_default_matcher: Optional[SkillMatcher] = None
+
+
+def default_matcher() -> SkillMatcher:
+    """Process-wide matcher over the bundled taxonomy (built on first use)."""
+    global _default_matcher
+    if _default_matcher is None:
+        _default_matcher = SkillMatcher(load_taxonomy())
+    return _default_matcher
@@ -0,0 +1,245 @@
+"""
+near_duplicate_index.py
+
+Persistent cross-posting index: finds earlier postings whose text is
+nearly identical to a new one (e.g. the same scam reposted under
+different company names).
+
+How it works:
+- text → lowercased word 5-shingles
+- one-permutation MinHash: every shingle is hashed once and kept as the
+  minimum of one of SIGNATURE_SIZE bins (no per-permutation rehashing)
+- LSH banding: the signature is cut into BANDS bands; each band becomes
+  one indexed bucket key in SQLite, so a lookup is a single indexed query
+  no matter how many postings are stored
+- candidates are ranked by shared buckets (ties: newest first), capped at
+  MAX_CANDIDATES and verified against their stored signatures
+
+Every distinct text is stored once, at first sight. Matches are only
+counted among postings seen before that, so a text always gets the same
+answer (results stay valid in the result cache).
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import struct
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from analyzer.parsing.schema import NearDuplicateInfo
+
+
+# ----- Index defaults -----
+SHINGLE_SIZE = 5              # words per shingle
+MIN_SHINGLES = 20             # shorter texts are neither indexed nor matched
+SIGNATURE_SIZE = 64           # MinHash bins
+BANDS = 16                    # LSH bands (SIGNATURE_SIZE / BANDS rows each)
+SIMILARITY_THRESHOLD = 0.7    # estimated Jaccard similarity to count as a match
+MAX_CANDIDATES = 500          # bound work on very common templates
+
+_ROWS = SIGNATURE_SIZE // BANDS
+_BIN_SHIFT = 64 - (SIGNATURE_SIZE.bit_length() - 1)
+_VALUE_MASK = 0xFFFFFFFF
+_SIGNATURE = struct.Struct(f"<{SIGNATURE_SIZE}I")
+
+WORD_REGEX = re.compile(r"\w+")
+
+
+def _hash64(data: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+
+
+def signature(text: str) -> Optional[Tuple[int, ...]]:
+    """
+    One-permutation MinHash of the text's word shingles, or None when the
+    text is too short to fingerprint reliably.
+    """
+    words = WORD_REGEX.findall((text or "").lower())
+    n_shingles = len(words) - SHINGLE_SIZE + 1
+
+    if n_shingles < MIN_SHINGLES:
+        return None
+
+    bins = [None] * SIGNATURE_SIZE
+
+    for i in range(n_shingles):
+        h = _hash64(" ".join(words[i:i + SHINGLE_SIZE]).encode("utf-8"))
+        slot = h >> _BIN_SHIFT
+        value = h & _VALUE_MASK
+        current = bins[slot]
+        if current is None or value < current:
+            bins[slot] = value
+
+    # Densify empty bins from the next filled one (rotation), offset by
+    # distance so borrowed values don't collide with real ones
+    for slot in range(SIGNATURE_SIZE):
+        if bins[slot] is None:
+            distance = 1
+            while bins[(slot + distance) % SIGNATURE_SIZE] is None:
+                distance += 1
+            borrowed = bins[(slot + distance) % SIGNATURE_SIZE]
+            bins[slot] = (borrowed + distance * 0x9E3779B1) & _VALUE_MASK
+
+    return tuple(bins)
+
+
+def band_keys(sig: Tuple[int, ...]) -> List[int]:
+    """One signed 64-bit bucket key per band (band number is part of the key)."""
+    keys = []
+    for band in range(BANDS):
+        rows = sig[band * _ROWS:(band + 1) * _ROWS]
+        data = struct.pack(f"<B{_ROWS}I", band, *rows)
+        keys.append(int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big", signed=True))
+    return keys
+
+
+def similarity(a: Tuple[int, ...], b: Tuple[int, ...]) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return sum(x == y for x, y in zip(a, b)) / SIGNATURE_SIZE
+
+
+def _company_key(name: Optional[str]) -> str:
+    return " ".join((name or "").lower().split())
+
+
+class NearDuplicateIndex:
+    """
+    Thread-safe SQLite near-duplicate index.
+
+    `path` may be ":memory:" (tests) or a file path; parent dirs are created.
+    Inserts are incremental; nothing is ever rebuilt.
+    """
+
+    def __init__(self, path: str, threshold: float = SIMILARITY_THRESHOLD):
+        if path != ":memory:":
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.threshold = threshold
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS postings (
+                id          INTEGER PRIMARY KEY,
+                digest      BLOB NOT NULL UNIQUE,
+                company     TEXT,
+                company_key TEXT NOT NULL,
+                signature   BLOB NOT NULL,
+                created_at  REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS buckets (
+                key        INTEGER NOT NULL,
+                posting_id INTEGER NOT NULL,
+                PRIMARY KEY (key, posting_id)
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.commit()
+
+    # ---------------- Lookup + insert ----------------
+    def check(self, text: str, company: Optional[str] = None, add: bool = True) -> NearDuplicateInfo:
+        """
+        Near-duplicates of text among earlier postings. With add=True the
+        text is stored (first sighting only) for future lookups.
+        """
+        sig = signature(text)
+        if sig is None:
+            return NearDuplicateInfo()
+
+        digest = hashlib.sha256(" ".join(WORD_REGEX.findall(text.lower())).encode("utf-8")).digest()
+        keys = band_keys(sig)
+        company_key = _company_key(company)
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id FROM postings WHERE digest = ?", (digest,)
+            ).fetchone()
+
+            seen_before = row[0] if row else None
+            matches = self._matches(sig, keys, before=seen_before)
+
+            if add and seen_before is None:
+                self._insert(digest, company, company_key, sig, keys)
+
+        others = {}
+        other_company_matches = 0
+        for match_company, match_key, _ in matches:
+            if match_key and match_key != company_key:
+                others.setdefault(match_key, match_company)
+                other_company_matches += 1
+
+        return NearDuplicateInfo(
+            matches=len(matches),
+            other_company_matches=other_company_matches,
+            other_companies=sorted(others.values()),
+            max_similarity=max((s for _, _, s in matches), default=0.0),
+        )
+
+    def _matches(self, sig, keys, before: Optional[int]) -> List[Tuple[str, str, float]]:
+        # caller holds the lock
+        placeholders = ",".join("?" * len(keys))
+        query = f"SELECT posting_id FROM buckets WHERE key IN ({placeholders})"
+        params: list = list(keys)
+
+        if before is not None:
+            query += " AND posting_id < ?"
+            params.append(before)
+
+        # Deterministic cut: the most similar (most shared bands) first, newest
+        # on ties, so the same earlier postings always give the same candidates
+        query += (
+            " GROUP BY posting_id ORDER BY COUNT(*) DESC, posting_id DESC"
+            f" LIMIT {MAX_CANDIDATES}"
+        )
+        candidate_ids = [r[0] for r in self._conn.execute(query, params)]
+        if not candidate_ids:
+            return []
+
+        rows = self._conn.execute(
+            f"SELECT company, company_key, signature FROM postings "
+            f"WHERE id IN ({','.join('?' * len(candidate_ids))})",
+            candidate_ids,
+        ).fetchall()
+
+        matches = []
+        for company, company_key, blob in rows:
+            score = similarity(sig, _SIGNATURE.unpack(blob))
+            if score >= self.threshold:
+                matches.append((company, company_key, score))
+
+        return matches
+
+    def _insert(self, digest, company, company_key, sig, keys):
+        # caller holds the lock
+        cursor = self._conn.execute(
+            "INSERT INTO postings (digest, company, company_key, signature, created_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (digest, company, company_key, _SIGNATURE.pack(*sig), time.time()),
+        )
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO buckets (key, posting_id) VALUES (?, ?)",
+            [(key, cursor.lastrowid) for key in keys],
+        )
+        self._conn.commit()
+
+    # ---------------- Reporting ----------------
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM postings").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -15,7 +15,9 @@ Returns a simple structured result used by jd_parser.py
 """
 
 import re
-from typing import Dict
+from typing import Dict, Optional
+
+from analyzer.parsing.text_index import TextIndex, get_text_index
 
 
 EMPLOYMENT_PATTERNS = {
@@ -46,9 +48,11 @@ EMPLOYMENT_PATTERNS = {
 }
 
 
-def detect_employment_type(text: str) -> Dict:
+def detect_employment_type(text: str, index: Optional[TextIndex] = None) -> Dict:
     """
     Detects employment type confidence and classifies best type.
+    `index` is an optional shared TextIndex for `text` (avoids re-lowercasing / re-scanning).
+
     Returns:
         {
             "employment_type": str or None,
@@ -59,7 +63,7 @@ def detect_employment_type(text: str) -> Dict:
     if not text:
         return {"employment_type": None, "confidence": 0.0}
 
-    lower = text.lower()
+    lower = get_text_index(text, index).lower
 
     best_match = None
     best_confidence = 0.0
@@ -83,9 +87,9 @@ def detect_employment_type(text: str) -> Dict:
 # ------------------------------------
 # Compatibility Wrapper
 # ------------------------------------
-def extract_employment_type(text: str):
+def extract_employment_type(text: str, index: Optional[TextIndex] = None):
     """
     Backward compatible wrapper so older code using
     `extract_employment_type()` continues to work.
     """
-    return detect_employment_type(text)
\ No newline at end of file
+    return detect_employment_type(text, index)
\ No newline at end of file
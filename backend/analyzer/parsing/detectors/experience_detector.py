@@ -16,14 +16,21 @@ Returns structured & confidence-scored output for JD parser.
 import re
 from typing import Dict, Optional
 
+from analyzer.parsing.keyword_matcher import KEYWORDS
+from analyzer.parsing.text_index import TextIndex, get_text_index
+
 
 FRESHER_PATTERNS = [
-    r"\bfreshers?\b",
-    r"\bno experience required\b",
-    r"\bno prior experience\b",
-    r"\bentry level\b"
+    "fresher",
+    "freshers",
+    "no experience required",
+    "no prior experience",
+    "entry level"
 ]
 
+# Whole-word phrases, answered from the shared keyword scan
+FRESHER = KEYWORDS.register("experience.fresher", FRESHER_PATTERNS, word_boundary=True)
+
 POSITIVE_EXPERIENCE_PATTERNS = [
     r"\bminimum\s+(\d+)\s*(years|year|yrs|yr)\b",
     r"\bat\s+least\s+(\d+)\s*(years|year|yrs|yr)\b",
@@ -32,8 +39,10 @@ POSITIVE_EXPERIENCE_PATTERNS = [
 ]
 
 
-def detect_experience(text: str) -> Dict:
+def detect_experience(text: str, index: Optional[TextIndex] = None) -> Dict:
     """
+    `index` is an optional shared TextIndex for `text` (avoids re-lowercasing / re-scanning).
+
     Returns:
         {
           "years_min": Optional[int],
@@ -51,17 +60,17 @@ def detect_experience(text: str) -> Dict:
             "confidence": 0.0
         }
 
-    lower = text.lower()
+    index = get_text_index(text, index)
+    lower = index.lower
 
     # -------- FRESHER DETECTION --------
-    for p in FRESHER_PATTERNS:
-        if re.search(p, lower, re.IGNORECASE):
-            return {
-                "years_min": 0,
-                "years_max": 1,
-                "inferred_label": "freshers",
-                "confidence": 0.9
-            }
+    if index.keyword_hits.any(FRESHER):
+        return {
+            "years_min": 0,
+            "years_max": 1,
+            "inferred_label": "freshers",
+            "confidence": 0.9
+        }
 
     # -------- POSITIVE EXPERIENCE MATCH --------
     for p in POSITIVE_EXPERIENCE_PATTERNS:
@@ -110,9 +119,9 @@ def detect_experience(text: str) -> Dict:
 # Compatibility wrapper
 # jd_parser expects `extract_experience`
 # ------------------------------------------------------------------
-def extract_experience(text: str):
+def extract_experience(text: str, index: Optional[TextIndex] = None):
     """
     Wrapper to maintain compatibility with parser import style.
     Internally uses detect_experience().
     """
-    return detect_experience(text)
\ No newline at end of file
+    return detect_experience(text, index)
\ No newline at end of file
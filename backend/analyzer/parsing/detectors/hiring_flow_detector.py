@@ -14,55 +14,71 @@ We do NOT judge fraud here.
 We ONLY extract clean structured information so rules layer can decide.
 """
 
-import re
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+from analyzer.parsing.keyword_matcher import KEYWORDS
+from analyzer.parsing.text_index import TextIndex, get_text_index
 
 
 HIRING_KEYWORDS = {
     "interview": [
-        r"\binterview\b",
-        r"\btechnical interview\b",
-        r"\bhr interview\b",
-        r"\btelephonic interview\b",
-        r"\bvirtual interview\b",
-        r"\bvideo interview\b"
+        "interview",
+        "technical interview",
+        "hr interview",
+        "telephonic interview",
+        "virtual interview",
+        "video interview"
     ],
     "screening": [
-        r"\bscreening\b",
-        r"\bshortlist(ed|ing)?\b",
-        r"\bprofile review\b"
+        "screening",
+        "shortlist",
+        "shortlisted",
+        "shortlisting",
+        "profile review"
     ],
     "assessment": [
-        r"\bassignment\b",
-        r"\bassessment\b",
-        r"\btest\b",
-        r"\bcoding test\b",
-        r"\baptitude test\b"
+        "assignment",
+        "assessment",
+        "test",
+        "coding test",
+        "aptitude test"
     ],
     "background_check": [
-        r"\bbackground\b",
-        r"\bverification\b",
-        r"\bdocument verification\b"
+        "background",
+        "verification",
+        "document verification"
     ],
     "offer_stage": [
-        r"\boffer letter\b",
-        r"\bselection letter\b",
-        r"\bjoining letter\b"
+        "offer letter",
+        "selection letter",
+        "joining letter"
     ]
 }
 
 SUSPICIOUS_NO_PROCESS_PATTERNS = [
-    r"\bno interview\b",
-    r"\bno interview required\b",
-    r"\bno selection process\b",
-    r"\bguaranteed selection\b",
-    r"\binstant offer\b",
-    r"\binstant joining\b"
+    "no interview",
+    "no interview required",
+    "no selection process",
+    "guaranteed selection",
+    "instant offer",
+    "instant joining"
 ]
 
+# Whole-word phrase categories in the shared keyword scan
+HIRING_STEP_CATEGORIES = {
+    step_name: KEYWORDS.register(f"hiring_flow.{step_name}", phrases, word_boundary=True)
+    for step_name, phrases in HIRING_KEYWORDS.items()
+}
+
+SUSPICIOUS_NO_PROCESS = KEYWORDS.register(
+    "hiring_flow.suspicious_no_process", SUSPICIOUS_NO_PROCESS_PATTERNS, word_boundary=True
+)
 
-def detect_hiring_flow(text: str) -> Dict:
+
+def detect_hiring_flow(text: str, index: Optional[TextIndex] = None) -> Dict:
     """
+    `index` is an optional shared TextIndex for `text` (avoids re-lowercasing / re-scanning).
+
     Returns:
         {
             "steps": List[str],
@@ -80,26 +96,23 @@ def detect_hiring_flow(text: str) -> Dict:
             "confidence": 0.0
         }
 
-    lower = text.lower()
+    hits = get_text_index(text, index).keyword_hits
 
     detected_steps: List[str] = []
     mentions_interview = False
     suspicious_fast_track = False
 
     # -------- Positive Hiring Steps --------
-    for step_name, patterns in HIRING_KEYWORDS.items():
-        for p in patterns:
-            if re.search(p, lower):
-                if step_name not in detected_steps:
-                    detected_steps.append(step_name)
+    for step_name, category in HIRING_STEP_CATEGORIES.items():
+        if hits.any(category):
+            detected_steps.append(step_name)
 
-                if step_name == "interview":
-                    mentions_interview = True
+            if step_name == "interview":
+                mentions_interview = True
 
     # -------- Suspicious Fast Lane --------
-    for p in SUSPICIOUS_NO_PROCESS_PATTERNS:
-        if re.search(p, lower):
-            suspicious_fast_track = True
+    if hits.any(SUSPICIOUS_NO_PROCESS):
+        suspicious_fast_track = True
 
     # -------- Confidence Heuristic --------
     confidence = 0.0
@@ -124,9 +137,9 @@ def detect_hiring_flow(text: str) -> Dict:
 # ------------------------------------
 # Compatibility Wrapper
 # ------------------------------------
-def extract_hiring_flow(text: str):
+def extract_hiring_flow(text: str, index: Optional[TextIndex] = None):
     """
     Backward compatible wrapper so older pipeline code using
     `extract_hiring_flow()` continues to work.
     """
-    return detect_hiring_flow(text)
\ No newline at end of file
+    return detect_hiring_flow(text, index)
\ No newline at end of file
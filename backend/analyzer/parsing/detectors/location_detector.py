@@ -14,28 +14,38 @@ than wrong structured data.
 import re
 from typing import Dict, Optional
 
+from analyzer.parsing.keyword_matcher import KEYWORDS
+from analyzer.parsing.text_index import TextIndex, get_text_index
+
 
 # ----------- Remote / Hybrid / Onsite Keywords -----------
 REMOTE_PATTERNS = [
-    r"\bremote\b",
-    r"\bwork from home\b",
-    r"\bwork\-from\-home\b",
-    r"\banywhere\b",
-    r"\bwork from anywhere\b",
+    "remote",
+    "work from home",
+    "work-from-home",
+    "anywhere",
+    "work from anywhere",
 ]
 
 HYBRID_PATTERNS = [
-    r"\bhybrid\b",
-    r"\bpartial remote\b",
-    r"\b2-3 days office\b",
-    r"\bsplit work model\b"
+    "hybrid",
+    "partial remote",
+    "2-3 days office",
+    "split work model"
 ]
 
 ONSITE_PATTERNS = [
-    r"\bonsite\b",
-    r"\bon-site\b",
-    r"\boffice based\b",
-    r"\bwork from office\b",
+    "onsite",
+    "on-site",
+    "office based",
+    "work from office",
+]
+
+# Checked in priority order against the shared (whole-word) keyword scan
+REMOTE_MODE_CATEGORIES = [
+    (KEYWORDS.register("location.remote", REMOTE_PATTERNS, word_boundary=True), "remote", 0.9),
+    (KEYWORDS.register("location.hybrid", HYBRID_PATTERNS, word_boundary=True), "hybrid", 0.85),
+    (KEYWORDS.register("location.onsite", ONSITE_PATTERNS, word_boundary=True), "onsite", 0.8),
 ]
 
 
@@ -43,20 +53,12 @@ ONSITE_PATTERNS = [
 CITY_COUNTRY_REGEX = r"\b([A-Z][a-zA-Z]+(?:\s[A-Z][a-zA-Z]+)*)(,\s*[A-Z][a-zA-Z]+)?\b"
 
 
-def detect_remote_mode(text: str) -> (Optional[str], float):
-    lower = text.lower()
+def detect_remote_mode(text: str, index: Optional[TextIndex] = None) -> (Optional[str], float):
+    hits = get_text_index(text, index).keyword_hits
 
-    for p in REMOTE_PATTERNS:
-        if re.search(p, lower):
-            return "remote", 0.9
-
-    for p in HYBRID_PATTERNS:
-        if re.search(p, lower):
-            return "hybrid", 0.85
-
-    for p in ONSITE_PATTERNS:
-        if re.search(p, lower):
-            return "onsite", 0.8
+    for category, mode, confidence in REMOTE_MODE_CATEGORIES:
+        if hits.any(category):
+            return mode, confidence
 
     return None, 0.0
 
@@ -92,8 +94,10 @@ def detect_location_name(text: str) -> (Optional[str], float):
     return None, 0.0
 
 
-def detect_location(text: str) -> Dict:
+def detect_location(text: str, index: Optional[TextIndex] = None) -> Dict:
     """
+    `index` is an optional shared TextIndex for `text` (avoids re-lowercasing / re-scanning).
+
     Returns:
         {
             "location": str or None,
@@ -111,7 +115,7 @@ def detect_location(text: str) -> Dict:
             "remote_confidence": 0.0
         }
 
-    remote_mode, remote_conf = detect_remote_mode(text)
+    remote_mode, remote_conf = detect_remote_mode(text, index)
     location_name, loc_conf = detect_location_name(text)
 
     # If remote AND a city exists, reduce certainty of city relevance
@@ -126,9 +130,9 @@ def detect_location(text: str) -> Dict:
     }
 
 # ===== Compatibility Wrapper for jd_parser =====
-def extract_location(text: str) -> Dict:
+def extract_location(text: str, index: Optional[TextIndex] = None) -> Dict:
     """
     Wrapper to maintain backward compatibility.
     jd_parser imports extract_location(), internally we use detect_location().
     """
-    return detect_location(text)
\ No newline at end of file
+    return detect_location(text, index)
\ No newline at end of file
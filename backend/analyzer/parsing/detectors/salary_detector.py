@@ -17,6 +17,8 @@ We ONLY extract structured information.
 import re
 from typing import Dict, Optional
 
+from analyzer.parsing.text_index import TextIndex, get_text_index
+
 
 # ----------- Currency Detection -----------
 CURRENCY_SYMBOLS = {
@@ -67,8 +69,8 @@ SALARY_REGEX = re.compile(
 )
 
 
-def detect_frequency(text: str) -> (Optional[str], float):
-    lower = text.lower()
+def detect_frequency(text: str, index: Optional[TextIndex] = None) -> (Optional[str], float):
+    lower = get_text_index(text, index).lower
 
     for freq, patterns in FREQUENCY_PATTERNS.items():
         for p in patterns:
@@ -78,11 +80,11 @@ def detect_frequency(text: str) -> (Optional[str], float):
     return None, 0.0
 
 
-def detect_currency(symbol: Optional[str], text: str) -> Optional[str]:
+def detect_currency(symbol: Optional[str], text: str, index: Optional[TextIndex] = None) -> Optional[str]:
     if symbol and symbol in CURRENCY_SYMBOLS:
         return CURRENCY_SYMBOLS[symbol]
 
-    lower = text.lower()
+    lower = get_text_index(text, index).lower
 
     for word, code in CURRENCY_WORDS.items():
         if word in lower:
@@ -95,8 +97,10 @@ def normalize_amount(val: str) -> float:
     return float(val.replace(",", ""))
 
 
-def detect_salary(text: str) -> Dict:
+def detect_salary(text: str, index: Optional[TextIndex] = None) -> Dict:
     """
+    `index` is an optional shared TextIndex for `text` (avoids re-lowercasing / re-scanning).
+
     Returns:
         {
             "raw_text": str or None,
@@ -135,7 +139,10 @@ def detect_salary(text: str) -> Dict:
     symbol2 = match.group(3)
     amount2 = match.group(4)
 
-    currency = detect_currency(symbol1 or symbol2, text)
+    # one shared index so currency + frequency lowercase the text only once
+    index = get_text_index(text, index)
+
+    currency = detect_currency(symbol1 or symbol2, text, index)
 
     try:
         min_val = normalize_amount(amount1)
@@ -143,7 +150,7 @@ def detect_salary(text: str) -> Dict:
     except:
         min_val, max_val = None, None
 
-    frequency, freq_conf = detect_frequency(text)
+    frequency, freq_conf = detect_frequency(text, index)
 
     confidence = 0.0
 
@@ -168,10 +175,10 @@ def detect_salary(text: str) -> Dict:
     # ------------------------------------
 # Compatibility Wrapper
 # ------------------------------------
-def extract_salary_info(text: str):
+def extract_salary_info(text: str, index: Optional[TextIndex] = None):
     """
     Backward compatible wrapper.
     Older pipeline expects `extract_salary_info()`,
     but new detector uses `detect_salary()`.
     """
-    return detect_salary(text)
\ No newline at end of file
+    return detect_salary(text, index)
\ No newline at end of file
@@ -11,8 +11,11 @@ from analyzer.parsing.schema import (
     JobRoleInfo,
     CompanyInfo
 )
+from analyzer.parsing.text_index import TextIndex, get_text_index
+from analyzer.utils.tracing import span
 
 import re
+from typing import Optional
 
 # -------- Email Extraction Pattern --------
 EMAIL_REGEX = re.compile(
@@ -21,7 +24,7 @@ EMAIL_REGEX = re.compile(
 
 
 # -------- Company Extraction Helper --------
-def parse_company(raw_text: str) -> CompanyInfo:
+def parse_company(raw_text: str, index: Optional[TextIndex] = None) -> CompanyInfo:
     """
     Lightweight heuristic company extractor.
     If first line looks like a company name → assume it.
@@ -29,7 +32,7 @@ def parse_company(raw_text: str) -> CompanyInfo:
     if not raw_text:
         return CompanyInfo()
 
-    lines = [l.strip() for l in raw_text.split("\n") if l.strip()]
+    lines = get_text_index(raw_text, index).stripped_lines
     if not lines:
         return CompanyInfo()
 
@@ -56,12 +59,21 @@ def parse_jd(raw_text: str) -> JDContext:
 
     text = raw_text.strip()
 
+    # One shared text index → detectors, company heuristic and later the
+    # rules all reuse the same lowercased text / lines instead of rebuilding.
+    index = TextIndex(text)
+
     # ---------- Run detectors (each returns dict now) ----------
-    exp_data = extract_experience(text) or {}
-    loc_data = extract_location(text) or {}
-    emp_data = extract_employment_type(text) or {}
-    hiring_data = extract_hiring_flow(text) or {}
-    salary_data = extract_salary_info(text) or {}
+    with span("detector.experience"):
+        exp_data = extract_experience(text, index) or {}
+    with span("detector.location"):
+        loc_data = extract_location(text, index) or {}
+    with span("detector.employment_type"):
+        emp_data = extract_employment_type(text, index) or {}
+    with span("detector.hiring_flow"):
+        hiring_data = extract_hiring_flow(text, index) or {}
+    with span("detector.salary"):
+        salary_data = extract_salary_info(text, index) or {}
 
     # ---------- EXPERIENCE ----------
     years_min = exp_data.get("years_min")
@@ -96,7 +108,8 @@ def parse_jd(raw_text: str) -> JDContext:
     emails = list(set(EMAIL_REGEX.findall(text))) if text else []
 
     # ---------- COMPANY ----------
-    company_info = parse_company(text)
+    with span("detector.company"):
+        company_info = parse_company(text, index)
 
     # ---------- JOB ROLE ----------
     job_role = JobRoleInfo(
@@ -125,7 +138,7 @@ def parse_jd(raw_text: str) -> JDContext:
     if confidences:
         overall_conf = round(sum(confidences) / len(confidences), 2)
 
-    return JDContext(
+    jd_context = JDContext(
         raw_text=text,
         company=company_info,
         job=job_role,
@@ -138,4 +151,7 @@ def parse_jd(raw_text: str) -> JDContext:
         urls=[],
         hiring_flow=hiring_steps,
         confidence_score=overall_conf,
-    )
\ No newline at end of file
+    )
+    jd_context.text_index = index
+
+    return jd_context
\ No newline at end of file
@@ -0,0 +1,232 @@
+"""
+Shared multi-phrase keyword matcher.
+
+Rules and detectors register their phrase lists once at import time.
+All registered phrases are compiled into ONE trie-shaped regex, so a
+document is scanned a single time and every category reads its hit
+counts from that shared result instead of looping over its own patterns.
+
+Matching semantics are identical to what the rules did before:
+- word_boundary=False → plain substring check (`phrase in lower`)
+- word_boundary=True  → `re.findall(r"\\bphrase\\b", lower)`
+Overlapping phrases (e.g. "immediately" inside "join immediately") are
+each counted, exactly like running one pattern at a time.
+"""
+
+import re
+import threading
+from typing import Dict, List, Optional
+
+
+_END = ""  # trie terminal marker
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _has_boundary(text: str, pos: int) -> bool:
+    """Same rule as regex \\b: word-ness differs on both sides of pos."""
+    before = pos > 0 and _is_word_char(text[pos - 1])
+    after = pos < len(text) and _is_word_char(text[pos])
+    return before != after
+
+
+def _trie_regex(node: Dict) -> str:
+    """
+    Emits a prefix-factored regex for a char trie.
+    Greedy optional groups → longest phrase at a position is matched first.
+    """
+    alternatives = [
+        re.escape(ch) + _trie_regex(child)
+        for ch, child in sorted(node.items())
+        if ch != _END
+    ]
+
+    if not alternatives:
+        return ""
+
+    terminal = _END in node
+
+    if len(alternatives) == 1 and not terminal:
+        return alternatives[0]
+
+    body = "(?:" + "|".join(alternatives) + ")"
+    return body + "?" if terminal else body
+
+
+class KeywordHits:
+    """
+    Result of one scan: per category, per phrase occurrence counts.
+    """
+
+    __slots__ = ("version", "_counts", "_matcher")
+
+    def __init__(self, matcher: "KeywordMatcher", version: int):
+        self.version = version
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._matcher = matcher
+
+    def _add(self, category: str, phrase: str, n: int = 1):
+        per_phrase = self._counts.setdefault(category, {})
+        per_phrase[phrase] = per_phrase.get(phrase, 0) + n
+
+    def merge(self, other: "KeywordHits") -> "KeywordHits":
+        """New hits object holding the summed counts of self + other."""
+        merged = KeywordHits(self._matcher, self.version)
+        for source in (self, other):
+            for category, per_phrase in source._counts.items():
+                for phrase, n in per_phrase.items():
+                    merged._add(category, phrase, n)
+        return merged
+
+    def count(self, category: str) -> int:
+        """Total occurrences of all phrases in category."""
+        return sum(self._counts.get(category, {}).values())
+
+    def any(self, category: str) -> bool:
+        return bool(self._counts.get(category))
+
+    def matched(self, category: str) -> List[str]:
+        """Registered phrases of category that occurred, in registration order."""
+        per_phrase = self._counts.get(category, {})
+        return [p for p in self._matcher.phrases(category) if p in per_phrase]
+
+    def counts(self, category: str) -> Dict[str, int]:
+        return dict(self._counts.get(category, {}))
+
+
+class _CompiledState:
+    __slots__ = ("version", "regex", "entries", "prefixes", "boundaries", "max_phrase_len")
+
+
+class KeywordMatcher:
+    """
+    Registry of phrase categories + the single compiled scanner over them.
+    """
+
+    def __init__(self):
+        self._categories: Dict[str, List[str]] = {}
+        self._boundaries: Dict[str, bool] = {}
+        self._lock = threading.Lock()
+        self._state: Optional[_CompiledState] = None
+        self.version = 0
+
+    # ---------------- Registration ----------------
+    def register(self, category: str, phrases: List[str], word_boundary: bool = False) -> str:
+        """
+        Registers a phrase list under category and returns the category name.
+        Phrases are literal, matched against lowercased text.
+        """
+        with self._lock:
+            self._categories[category] = [p.lower() for p in phrases if p]
+            self._boundaries[category] = word_boundary
+            self._state = None
+            self.version += 1
+        return category
+
+    def phrases(self, category: str) -> List[str]:
+        return self._categories.get(category, [])
+
+    # ---------------- Compilation ----------------
+    def _compiled(self) -> _CompiledState:
+        state = self._state
+        if state is not None:
+            return state
+
+        with self._lock:
+            if self._state is not None:
+                return self._state
+
+            entries: Dict[str, List[str]] = {}
+            for category, phrases in self._categories.items():
+                for phrase in phrases:
+                    owners = entries.setdefault(phrase, [])
+                    if category not in owners:
+                        owners.append(category)
+
+            trie: Dict = {}
+            for phrase in entries:
+                node = trie
+                for ch in phrase:
+                    node = node.setdefault(ch, {})
+                node[_END] = True
+
+            state = _CompiledState()
+            state.version = self.version
+            state.entries = entries
+            # Every shorter phrase that is a prefix of a longer one also
+            # matches wherever the longer one does; the regex only reports
+            # the longest, so remember the rest here.
+            state.prefixes = {
+                phrase: [p for p in entries if p != phrase and phrase.startswith(p)]
+                for phrase in entries
+            }
+            state.boundaries = dict(self._boundaries)
+            state.max_phrase_len = max((len(p) for p in entries), default=0)
+            state.regex = re.compile("(?=(" + _trie_regex(trie) + "))") if entries else None
+
+            self._state = state
+            return state
+
+    # ---------------- Scanning ----------------
+    @staticmethod
+    def _scan_into(state: _CompiledState, hits: KeywordHits, lower: str, stop: Optional[int] = None):
+        if state.regex is None or not lower:
+            return
+
+        entries = state.entries
+        prefixes = state.prefixes
+        boundaries = state.boundaries
+
+        for m in state.regex.finditer(lower):
+            start = m.start()
+            if stop is not None and start >= stop:
+                break
+
+            longest = m.group(1)
+            for phrase in [longest, *prefixes[longest]]:
+                for category in entries[phrase]:
+                    if boundaries[category] and not (
+                        _has_boundary(lower, start)
+                        and _has_boundary(lower, start + len(phrase))
+                    ):
+                        continue
+                    hits._add(category, phrase)
+
+    def scan(self, lower: str) -> KeywordHits:
+        """
+        Single pass over already-lowercased text → hit counts for every category.
+        """
+        state = self._compiled()
+        hits = KeywordHits(self, state.version)
+        self._scan_into(state, hits, lower)
+        return hits
+
+    def scan_joined(self, head: str, body: str, body_hits: Optional[KeywordHits] = None,
+                    sep: str = " ") -> KeywordHits:
+        """
+        Hits for `head + sep + body` while reusing an existing scan of body.
+        Only head and the junction window are scanned again, so a short
+        prefix like a job title costs almost nothing.
+        """
+        state = self._compiled()
+
+        if body_hits is None or body_hits.version != state.version:
+            body_hits = self.scan(body)
+
+        if not head:
+            # separator is not a word char → body boundaries are unchanged
+            return body_hits
+
+        head_len = len(head) + len(sep)
+        window = head + sep + body[:state.max_phrase_len + 1]
+
+        head_hits = KeywordHits(self, state.version)
+        self._scan_into(state, head_hits, window, stop=head_len)
+
+        return head_hits.merge(body_hits)
+
+
+# Process-wide registry shared by all rules and detectors.
+KEYWORDS = KeywordMatcher()
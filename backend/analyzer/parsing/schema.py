@@ -1,9 +1,11 @@
 from dataclasses import dataclass, field
 from typing import List, Optional
 
+from analyzer.parsing.text_index import TextIndex
+
 
 # ---------------- Salary ----------------
-@dataclass
+@dataclass(slots=True)
 class SalaryInfo:
     raw_text: Optional[str] = None
     currency: Optional[str] = None
@@ -14,7 +16,7 @@ class SalaryInfo:
 
 
 # ---------------- Company ----------------
-@dataclass
+@dataclass(slots=True)
 class CompanyInfo:
     name: Optional[str] = None
     inferred_from: Optional[str] = None  # title/meta/url/page text
@@ -22,7 +24,7 @@ class CompanyInfo:
 
 
 # ---------------- Job Role ----------------
-@dataclass
+@dataclass(slots=True)
 class JobRoleInfo:
     title: Optional[str] = None
     seniority: Optional[str] = None
@@ -41,19 +43,32 @@ class JobRoleInfo:
 
 
 # ---------------- Hiring Flow ----------------
-@dataclass
+@dataclass(slots=True)
 class HiringFlowInfo:
     steps: List[str] = field(default_factory=list)
     mentions_interview: bool = False
     confidence: float = 0.0
 
 
+# ---------------- Cross-posting ----------------
+@dataclass(slots=True)
+class NearDuplicateInfo:
+    matches: int = 0                  # earlier near-identical postings
+    other_company_matches: int = 0    # ... of them attributed to another company
+    other_companies: List[str] = field(default_factory=list)
+    max_similarity: float = 0.0
+
+
 # ---------------- JD Context Root ----------------
-@dataclass
+@dataclass(slots=True)
 class JDContext:
     """
     Structured representation of a Job Description.
     This is what rules & insights layer will consume.
+
+    All schema classes are slotted (no per-instance __dict__), so large
+    in-memory batches stay compact. raw_text is stored by reference and
+    shared with the text index, never copied.
     """
 
     raw_text: str
@@ -74,5 +89,39 @@ class JDContext:
 
     detected_language: Optional[str] = "en"
 
+    # set by the near-duplicate index when enabled (None = not checked)
+    near_duplicates: Optional[NearDuplicateInfo] = None
+
     # overall metadata
-    confidence_score: float = 0.0
\ No newline at end of file
+    confidence_score: float = 0.0
+
+    # lazily built shared text views (see text_index property)
+    _text_index: Optional[TextIndex] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def text_index(self) -> TextIndex:
+        """
+        Lowercased text / lines / tokens of raw_text, computed once and
+        shared by every detector and rule reading this context.
+        """
+        source = self.raw_text or ""
+        index = self._text_index
+
+        if index is None or index.text is not source:
+            index = TextIndex(source)
+            self._text_index = index
+
+        return index
+
+    @text_index.setter
+    def text_index(self, index: TextIndex):
+        self._text_index = index
+
+    def release_text_index(self):
+        """
+        Drops the cached text views (the bulk of a parsed context's memory).
+        They are rebuilt on next access; use when holding many contexts.
+        """
+        self._text_index = None
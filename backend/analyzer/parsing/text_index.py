@@ -0,0 +1,109 @@
+"""
+Shared, lazily computed text views for one job description.
+
+Detectors and rules all need the same few derived forms of the raw text
+(lowercased copy, line list, tokens). TextIndex computes each of them at
+most once per document and hands the same objects to every consumer.
+"""
+
+import re
+from typing import List, Optional
+
+from analyzer.parsing.keyword_matcher import KEYWORDS, KeywordHits
+
+
+TOKEN_REGEX = re.compile(r"\S+")
+
+
+class TextIndex:
+    """
+    Read-only views over a single text, each built on first access.
+
+    - lower          : lowercased text
+    - lines          : text split on "\\n" (unmodified)
+    - stripped_lines : stripped, non-empty lines
+    - tokens         : whitespace-delimited tokens
+    - word_offsets   : start offset of each token in text
+    - keyword_hits   : shared keyword scan of `lower` (all rule/detector phrases)
+    """
+
+    __slots__ = (
+        "text",
+        "_lower",
+        "_lines",
+        "_stripped_lines",
+        "_tokens",
+        "_word_offsets",
+        "_keyword_hits",
+    )
+
+    def __init__(self, text: str):
+        self.text = text or ""
+        self._lower: Optional[str] = None
+        self._lines: Optional[List[str]] = None
+        self._stripped_lines: Optional[List[str]] = None
+        self._tokens: Optional[List[str]] = None
+        self._word_offsets: Optional[List[int]] = None
+        self._keyword_hits: Optional[KeywordHits] = None
+
+    @property
+    def lower(self) -> str:
+        if self._lower is None:
+            self._lower = self.text.lower()
+        return self._lower
+
+    @property
+    def lines(self) -> List[str]:
+        if self._lines is None:
+            self._lines = self.text.split("\n")
+        return self._lines
+
+    @property
+    def stripped_lines(self) -> List[str]:
+        if self._stripped_lines is None:
+            stripped = (l.strip() for l in self.lines)
+            self._stripped_lines = [l for l in stripped if l]
+        return self._stripped_lines
+
+    @property
+    def tokens(self) -> List[str]:
+        if self._tokens is None:
+            self._tokenize()
+        return self._tokens
+
+    @property
+    def word_offsets(self) -> List[int]:
+        if self._word_offsets is None:
+            self._tokenize()
+        return self._word_offsets
+
+    @property
+    def keyword_hits(self) -> KeywordHits:
+        hits = self._keyword_hits
+        # rescan if phrase lists were registered after this scan was taken
+        if hits is None or hits.version != KEYWORDS.version:
+            hits = KEYWORDS.scan(self.lower)
+            self._keyword_hits = hits
+        return hits
+
+    def _tokenize(self):
+        # Tokens and their offsets come from the same single scan
+        tokens: List[str] = []
+        offsets: List[int] = []
+
+        for match in TOKEN_REGEX.finditer(self.text):
+            tokens.append(match.group(0))
+            offsets.append(match.start())
+
+        self._tokens = tokens
+        self._word_offsets = offsets
+
+
+def get_text_index(text: str, index: Optional[TextIndex] = None) -> TextIndex:
+    """
+    Returns `index` if it was built for exactly this text, else a fresh one.
+    Lets detectors accept an optional shared index without trusting it blindly.
+    """
+    if index is not None and index.text is text:
+        return index
+    return TextIndex(text)
@@ -0,0 +1,150 @@
+"""
+result_cache.py
+
+Memoizes full analysis results by content.
+
+Identical postings (reposts, aggregator mirrors) are analyzed once; later
+submissions of the same JD text are answered from cache. Keys combine a
+hash of the JD text with the rule-set version, so any change to the
+rules, detectors or insights invalidates old entries automatically.
+
+The text is hashed as given: it must be the exact text that is parsed,
+or a hit could return another text's result. The pipeline makes reposts
+that differ only in whitespace / line endings match by normalizing
+pasted text (normalizer.normalize_whitespace) before both parsing and
+caching; fetched pages are already in that form.
+
+Backends:
+- in-process LRU (always on)
+- optional shared SQLite file (survives restarts, shared by workers)
+"""
+
+import copy
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+
+# ----- Cache defaults -----
+MAX_MEMORY_ENTRIES = 5000
+
+
+def content_key(text: str, version: str) -> str:
+    digest = hashlib.sha256()
+    digest.update(version.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update((text or "").encode("utf-8", errors="surrogatepass"))
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Thread-safe text → analysis result cache.
+
+    get() / put() take the exact text that is handed to parse_jd()
+    (whitespace-normalized by the pipeline).
+    Returned results are copies, so callers may modify them freely.
+    """
+
+    def __init__(
+        self,
+        version: str,
+        max_entries: int = MAX_MEMORY_ENTRIES,
+        sqlite_path: Optional[str] = None,
+    ):
+        self.version = version
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Dict]" = OrderedDict()
+        self._counters = {"hits": 0, "misses": 0}
+
+        self._conn = None
+        if sqlite_path:
+            if sqlite_path != ":memory:":
+                directory = os.path.dirname(sqlite_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+
+            self._conn = sqlite3.connect(sqlite_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS results (
+                    key        TEXT PRIMARY KEY,
+                    version    TEXT NOT NULL,
+                    result     TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+                """
+            )
+            # Entries from older rule sets can never be hit again
+            self._conn.execute("DELETE FROM results WHERE version != ?", (version,))
+            self._conn.commit()
+
+    def key(self, text: str) -> str:
+        return content_key(text, self.version)
+
+    def get(self, text: str) -> Optional[Dict]:
+        key = self.key(text)
+
+        with self._lock:
+            result = self._memory.get(key)
+
+            if result is not None:
+                self._memory.move_to_end(key)
+            elif self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT result FROM results WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    result = json.loads(row[0])
+                    self._remember(key, result)
+
+            self._counters["hits" if result is not None else "misses"] += 1
+
+        return copy.deepcopy(result) if result is not None else None
+
+    def put(self, text: str, result: Dict):
+        key = self.key(text)
+        stored = copy.deepcopy(result)
+
+        with self._lock:
+            self._remember(key, stored)
+
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO results (key, version, result, created_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, self.version, json.dumps(stored), time.time()),
+                )
+                self._conn.commit()
+
+    def _remember(self, key: str, result: Dict):
+        # caller holds the lock
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM results")
+                self._conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counters, memory_entries=len(self._memory))
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
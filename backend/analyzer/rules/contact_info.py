@@ -1,6 +1,10 @@
 import re
 from typing import Dict, List
 from analyzer.parsing.schema import JDContext
+from analyzer.parsing.keyword_matcher import KEYWORDS
+
+
+MESSAGING_APPS = KEYWORDS.register("contact_info.messaging_apps", ["whatsapp", "telegram"])
 
 
 def poor_contact_info_rule(jd_context: JDContext) -> Dict:
@@ -13,7 +17,6 @@ def poor_contact_info_rule(jd_context: JDContext) -> Dict:
         return {"score": 0.0, "reason": None}
 
     text = (jd_context.raw_text or "")
-    lower = text.lower()
 
     company_name = (jd_context.company.name or "").lower()
 
@@ -54,7 +57,7 @@ def poor_contact_info_rule(jd_context: JDContext) -> Dict:
         }
 
     # -------- WhatsApp-only / Phone-only recruitment --------
-    if ("whatsapp" in lower or "telegram" in lower) and phones:
+    if jd_context.text_index.keyword_hits.any(MESSAGING_APPS) and phones:
         return {
             "score": 0.85,
             "reason": "Job post requests contact via WhatsApp/Telegram instead of official channels"
@@ -1,6 +1,36 @@
 from typing import Dict
 import re
 from analyzer.parsing.schema import JDContext
+from analyzer.parsing.keyword_matcher import KEYWORDS
+
+
+# Strong plagiarism / redistribution hints
+STRONG_INDICATORS = KEYWORDS.register("copy_paste.strong", [
+    "do not copy",
+    "copyright",
+    "all rights reserved",
+    "this content is protected",
+    "original posting",
+    "plagiarized",
+    "taken from",
+    "source:",
+])
+
+# Template / boilerplate style
+TEMPLATE_PHRASES = KEYWORDS.register("copy_paste.template", [
+    "we are one of the leading",
+    "renowned organization",
+    "prestigious company",
+    "world class organization",
+    "industry leading company",
+    "among the top companies",
+    "number one company",
+])
+
+# Distinct other companies posting near-identical text → strong signal
+CROSS_POST_MIN_COMPANIES = 2
+# Near-identical earlier postings when no company could be detected
+CROSS_POST_MIN_UNATTRIBUTED = 3
 
 
 def copy_paste_jd_rule(jd_context: JDContext) -> Dict:
@@ -12,40 +42,48 @@ def copy_paste_jd_rule(jd_context: JDContext) -> Dict:
     - Uses structured company + role context if available
     - Safer repetition thresholds
     - Avoids falsely penalizing normal boilerplate HR language
+    - Flags text reposted under other company names (jd_context.near_duplicates)
     """
 
     if not isinstance(jd_context, JDContext):
         return {"score": 0.0, "reason": None}
 
-    text = (jd_context.raw_text or "").strip()
-    if not text:
+    index = jd_context.text_index
+    text = index.text
+
+    if not text or text.isspace():
         return {"score": 0.0, "reason": None}
 
-    lower = text.lower()
+    hits = index.keyword_hits
 
     # ----------------- Strong plagiarism / redistribution hints -----------------
-    strong_indicators = [
-        "do not copy",
-        "copyright",
-        "all rights reserved",
-        "this content is protected",
-        "original posting",
-        "plagiarized",
-        "taken from",
-        "source:",
-    ]
-
-    if any(p in lower for p in strong_indicators):
+    if hits.any(STRONG_INDICATORS):
         return {
             "score": 0.9,
             "reason": "Job description explicitly indicates copied / redistributed content"
         }
 
-    # ----------------- Repeated Content Detection -----------------
-    lines = [l.strip() for l in text.split("\n") if l.strip()]
+    # ----------------- Cross-posting (near-duplicate index) -----------------
+    # Same text seen earlier under other company names
+    near_duplicates = jd_context.near_duplicates
+    other_companies = len(near_duplicates.other_companies) if near_duplicates else 0
 
+    if other_companies >= CROSS_POST_MIN_COMPANIES:
+        return {
+            "score": 0.85,
+            "reason": f"Job description closely matches {near_duplicates.other_company_matches} "
+                      f"earlier postings from {other_companies} different companies"
+        }
+
+    if other_companies == 1:
+        return {
+            "score": 0.6,
+            "reason": "Job description closely matches an earlier posting from a different company"
+        }
+
+    # ----------------- Repeated Content Detection -----------------
     # Ignore very short boilerplate lines
-    lines = [l for l in lines if len(l) > 25]
+    lines = [l for l in index.stripped_lines if len(l) > 25]
 
     seen = {}
     for line in lines:
@@ -84,17 +122,7 @@ def copy_paste_jd_rule(jd_context: JDContext) -> Dict:
         }
 
     # ----------------- Template / Boilerplate Style -----------------
-    template_phrases = [
-        "we are one of the leading",
-        "renowned organization",
-        "prestigious company",
-        "world class organization",
-        "industry leading company",
-        "among the top companies",
-        "number one company",
-    ]
-
-    boilerplate_hits = sum(1 for p in template_phrases if p in lower)
+    boilerplate_hits = len(hits.matched(TEMPLATE_PHRASES))
 
     if boilerplate_hits >= 3:
         return {
@@ -102,4 +130,11 @@ def copy_paste_jd_rule(jd_context: JDContext) -> Dict:
             "reason": "JD appears heavily templated with generic promotional language"
         }
 
+    # ----------------- Reposted text without company attribution -----------------
+    if not company_name and near_duplicates and near_duplicates.matches >= CROSS_POST_MIN_UNATTRIBUTED:
+        return {
+            "score": 0.4,
+            "reason": f"Job description closely matches {near_duplicates.matches} earlier postings"
+        }
+
     return {"score": 0.0, "reason": None}
\ No newline at end of file
@@ -1,5 +1,39 @@
 from typing import Dict
 from analyzer.parsing.schema import JDContext
+from analyzer.parsing.keyword_matcher import KEYWORDS
+
+
+# Strong scammy / generic title patterns
+STRONG_GENERIC = KEYWORDS.register("generic_job_title.strong", [
+    "work from home job",
+    "easy job",
+    "simple job",
+    "no skill job",
+    "anyone can apply",
+    "home based job",
+    "online typing job",
+    "form filling job",
+    "sms sending job",
+    "data entry job",
+    "back office job",
+    "online job",
+    "domestic job",
+    "part time earning",
+    "earn money",
+    "income opportunity"
+])
+
+# Weak – still suspicious, but not always scammy
+WEAK_GENERIC = KEYWORDS.register("generic_job_title.weak", [
+    "multiple openings",
+    "hiring for various roles",
+    "multiple positions available",
+    "staff required",
+    "hiring staff",
+    "required urgently",
+    "fantastic opportunity",
+    "great opportunity"
+])
 
 
 def generic_job_title_rule(jd_context: JDContext) -> Dict:
@@ -18,7 +52,6 @@ def generic_job_title_rule(jd_context: JDContext) -> Dict:
         return {"score": 0.0, "reason": None}
 
     title = (jd_context.job.title or "").lower().strip()
-    raw = (jd_context.raw_text or "").lower()
 
     # ---------------------------
     # No title extracted at all
@@ -29,55 +62,27 @@ def generic_job_title_rule(jd_context: JDContext) -> Dict:
             "reason": "Job post does not specify a clear job title"
         }
 
+    # Title is short → scanning it separately is cheap; raw text scan is shared
+    title_hits = KEYWORDS.scan(title)
+    raw_hits = jd_context.text_index.keyword_hits
+
     # ---------------------------
     # Strong scammy / generic title patterns
     # ---------------------------
-    strong_generic = [
-        "work from home job",
-        "easy job",
-        "simple job",
-        "no skill job",
-        "anyone can apply",
-        "home based job",
-        "online typing job",
-        "form filling job",
-        "sms sending job",
-        "data entry job",
-        "back office job",
-        "online job",
-        "domestic job",
-        "part time earning",
-        "earn money",
-        "income opportunity"
-    ]
-
-    for g in strong_generic:
-        if g in title or g in raw:
-            return {
-                "score": 0.9,
-                "reason": "Job title appears overly generic and commonly used in scam postings"
-            }
+    if title_hits.any(STRONG_GENERIC) or raw_hits.any(STRONG_GENERIC):
+        return {
+            "score": 0.9,
+            "reason": "Job title appears overly generic and commonly used in scam postings"
+        }
 
     # ---------------------------
     # Weak – still suspicious, but not always scammy
     # ---------------------------
-    weak_generic = [
-        "multiple openings",
-        "hiring for various roles",
-        "multiple positions available",
-        "staff required",
-        "hiring staff",
-        "required urgently",
-        "fantastic opportunity",
-        "great opportunity"
-    ]
-
-    for g in weak_generic:
-        if g in title or g in raw:
-            return {
-                "score": 0.6,
-                "reason": "Job title is vague and not role-specific"
-            }
+    if title_hits.any(WEAK_GENERIC) or raw_hits.any(WEAK_GENERIC):
+        return {
+            "score": 0.6,
+            "reason": "Job title is vague and not role-specific"
+        }
 
     # ---------------------------
     # Must at least include a meaningful profession indicator
@@ -1,5 +1,46 @@
 from typing import Dict
 from analyzer.parsing.schema import JDContext
+from analyzer.parsing.keyword_matcher import KEYWORDS
+
+
+# Strong scam indicators
+STRONG_INDICATORS = KEYWORDS.register("hiring_process_absence.strong", [
+    "no interview",
+    "without interview",
+    "direct joining",
+    "instant joining",
+    "same day joining",
+    "same day selection",
+    "guaranteed selection",
+    "offer letter immediately",
+    "instant offer",
+    "no selection process",
+    "no hr round",
+    "no screening",
+])
+
+# Vague shortcut language
+VAGUE_INDICATORS = KEYWORDS.register("hiring_process_absence.vague", [
+    "simple selection process",
+    "easy hiring process",
+    "very easy selection",
+    "minimal interview",
+    "quick selection",
+    "fastest hiring",
+    "hassle free hiring",
+    "smooth selection",
+])
+
+INTERVIEW_MENTIONS = KEYWORDS.register("hiring_process_absence.interview", [
+    "interview",
+    "technical round",
+    "assessment",
+    "screening",
+    "shortlist",
+    "selection process",
+    "hr interview",
+    "panel interview",
+])
 
 
 def hiring_process_absence_rule(jd_context: JDContext) -> Dict:
@@ -11,7 +52,7 @@ def hiring_process_absence_rule(jd_context: JDContext) -> Dict:
     if not isinstance(jd_context, JDContext):
         return {"score": 0.0, "reason": None}
 
-    raw = (jd_context.raw_text or "").lower()
+    hits = jd_context.text_index.keyword_hits
 
     # Prefer structured parsed signals if parser already extracted them
     # (we coded HiringProcessDetector earlier – this integrates with it safely)
@@ -22,43 +63,16 @@ def hiring_process_absence_rule(jd_context: JDContext) -> Dict:
     # ----------------------------
     # 1️⃣ Strong scam indicators
     # ----------------------------
-    strong_indicators = [
-        "no interview",
-        "without interview",
-        "direct joining",
-        "instant joining",
-        "same day joining",
-        "same day selection",
-        "guaranteed selection",
-        "offer letter immediately",
-        "instant offer",
-        "no selection process",
-        "no hr round",
-        "no screening"
-    ]
-
-    for ind in strong_indicators:
-        if ind in raw:
-            return {
-                "score": 0.9,
-                "reason": "Job claims hiring/selection without any interview or formal evaluation"
-            }
+    if hits.any(STRONG_INDICATORS):
+        return {
+            "score": 0.9,
+            "reason": "Job claims hiring/selection without any interview or formal evaluation"
+        }
 
     # ----------------------------
     # 2️⃣ Vague shortcut language
     # ----------------------------
-    vague_indicators = [
-        "simple selection process",
-        "easy hiring process",
-        "very easy selection",
-        "minimal interview",
-        "quick selection",
-        "fastest hiring",
-        "hassle free hiring",
-        "smooth selection"
-    ]
-
-    vague_hits = [v for v in vague_indicators if v in raw]
+    vague_hits = hits.matched(VAGUE_INDICATORS)
 
     if len(vague_hits) >= 2:
         return {
@@ -84,18 +98,7 @@ def hiring_process_absence_rule(jd_context: JDContext) -> Dict:
     # ----------------------------
     has_role_info = bool(jd_context.responsibilities or jd_context.requirements)
 
-    mentions_interview = any(
-        k in raw for k in [
-            "interview",
-            "technical round",
-            "assessment",
-            "screening",
-            "shortlist",
-            "selection process",
-            "hr interview",
-            "panel interview",
-        ]
-    )
+    mentions_interview = hits.any(INTERVIEW_MENTIONS)
 
     # If job has responsibilities + salary/role clarity but zero hiring mention
     if has_role_info and not mentions_interview:
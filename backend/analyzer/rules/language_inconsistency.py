@@ -1,6 +1,15 @@
 from typing import Dict
 import re
 from analyzer.parsing.schema import JDContext
+from analyzer.parsing.keyword_matcher import KEYWORDS
+
+
+# Mixed / suspicious Hinglish markers (substring match)
+HINDI_LIKE_TERMS = KEYWORDS.register("language_inconsistency.hinglish", [
+    "apply karein", "turant", "yahan", "naukri",
+    "aap", "hum", "karega", "milegi", "paise",
+    "sampark", "bharti", "rojgar", "avsar"
+])
 
 
 def language_inconsistency_rule(jd_context: JDContext) -> Dict:
@@ -18,19 +27,13 @@ def language_inconsistency_rule(jd_context: JDContext) -> Dict:
         return {"score": 0.0, "reason": None}
 
     text = (jd_context.raw_text or "")
-    lower = text.lower()
+    lower = jd_context.text_index.lower
 
-    if not text.strip():
+    if not text or text.isspace():
         return {"score": 0.0, "reason": None}
 
     # ---------------- Mixed / Suspicious Hinglish Detection ----------------
-    hindi_like_terms = [
-        "apply karein", "turant", "yahan", "naukri",
-        "aap", "hum", "karega", "milegi", "paise",
-        "sampark", "bharti", "rojgar", "avsar"
-    ]
-
-    hindi_hits = [t for t in hindi_like_terms if t in lower]
+    hindi_hits = jd_context.text_index.keyword_hits.matched(HINDI_LIKE_TERMS)
 
     english_detected = bool(re.search(r"[a-z]{3,}", lower))
     mixed_language = english_detected and len(hindi_hits) > 0
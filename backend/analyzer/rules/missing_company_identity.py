@@ -1,8 +1,42 @@
 from typing import Dict
 from analyzer.parsing.schema import JDContext
+from analyzer.parsing.keyword_matcher import KEYWORDS
 import re
 
 
+# Strong explicit anonymity
+EXPLICIT_ANONYMOUS = KEYWORDS.register("missing_company_identity.anonymous", [
+    "confidential company",
+    "company name not disclosed",
+    "client confidential",
+    "confidential employer",
+    "hidden company",
+    "undisclosed company",
+    "name withheld"
+])
+
+# Agency / third party hiring
+THIRD_PARTY_MARKERS = KEYWORDS.register("missing_company_identity.third_party", [
+    "hiring for client",
+    "recruiting for client",
+    "recruiting on behalf of",
+    "third party hiring",
+    "staffing partner",
+    "placement agency"
+])
+
+# Corporate keyword presence
+CORPORATE_KEYWORDS = KEYWORDS.register("missing_company_identity.corporate", [
+    "pvt ltd",
+    "private limited",
+    "inc",
+    "llc",
+    "corp",
+    "corporation",
+    "ltd"
+])
+
+
 def missing_company_identity_rule(jd_context: JDContext) -> Dict:
     """
     Detects missing or suspiciously anonymous company identity.
@@ -14,7 +48,7 @@ def missing_company_identity_rule(jd_context: JDContext) -> Dict:
         return {"score": 0.0, "reason": None}
 
     raw_text = (jd_context.raw_text or "")
-    lower = raw_text.lower()
+    hits = jd_context.text_index.keyword_hits
 
     # ---------------- Structured Signal ----------------
     company_name = (jd_context.company.name or "").strip()
@@ -24,33 +58,14 @@ def missing_company_identity_rule(jd_context: JDContext) -> Dict:
         return {"score": 0.0, "reason": None}
 
     # ---------------- Strong Explicit Anonymity ----------------
-    explicit_anonymous = [
-        "confidential company",
-        "company name not disclosed",
-        "client confidential",
-        "confidential employer",
-        "hidden company",
-        "undisclosed company",
-        "name withheld"
-    ]
-
-    if any(p in lower for p in explicit_anonymous):
+    if hits.any(EXPLICIT_ANONYMOUS):
         return {
             "score": 0.9,
             "reason": "Company identity intentionally hidden or undisclosed"
         }
 
     # ---------------- Agency / Third Party Hiring ----------------
-    third_party_markers = [
-        "hiring for client",
-        "recruiting for client",
-        "recruiting on behalf of",
-        "third party hiring",
-        "staffing partner",
-        "placement agency"
-    ]
-
-    if any(p in lower for p in third_party_markers):
+    if hits.any(THIRD_PARTY_MARKERS):
         # If it's clearly stated agency hiring but identity truly unknown
         return {
             "score": 0.55,
@@ -59,17 +74,7 @@ def missing_company_identity_rule(jd_context: JDContext) -> Dict:
 
     # ---------------- Heuristic Company Presence ----------------
     # Corporate keyword presence
-    corporate_keywords = [
-        "pvt ltd",
-        "private limited",
-        "inc",
-        "llc",
-        "corp",
-        "corporation",
-        "ltd"
-    ]
-
-    has_corporate_keyword = any(k in lower for k in corporate_keywords)
+    has_corporate_keyword = hits.any(CORPORATE_KEYWORDS)
 
     # Capitalized probable brand tokens
     capital_words = re.findall(r"\b[A-Z][A-Za-z]{2,}\b", raw_text)
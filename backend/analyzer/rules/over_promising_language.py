@@ -1,6 +1,38 @@
 from typing import Dict
 import re
 from analyzer.parsing.schema import JDContext
+from analyzer.parsing.keyword_matcher import KEYWORDS
+
+
+# Strong scam / impossible guarantees
+STRONG_SCAMS = KEYWORDS.register("over_promising.strong", [
+    "guaranteed job",
+    "100% job guarantee",
+    "assured placement",
+    "job assured",
+    "placement guaranteed",
+    "offer letter guaranteed",
+    "salary guaranteed",
+    "fixed job after training",
+    "job without interview",
+    "selection without interview",
+    "instant selection",
+    "same day joining guaranteed",
+])
+
+# Medium level exaggeration
+MEDIUM_PROMISES = KEYWORDS.register("over_promising.medium", [
+    "earn unlimited",
+    "no effort required",
+    "effortless income",
+    "easy money",
+    "earn while you sleep",
+    "work only few hours and earn",
+    "guaranteed selection",
+    "instant approval",
+    "quick approval",
+    "job sure shot",
+])
 
 
 def over_promising_language_rule(jd_context: JDContext) -> Dict:
@@ -19,53 +51,25 @@ def over_promising_language_rule(jd_context: JDContext) -> Dict:
         return {"score": 0.0, "reason": None}
 
     text = (jd_context.raw_text or "")
-    lower = text.lower()
 
-    if not text.strip():
+    if not text or text.isspace():
         return {"score": 0.0, "reason": None}
 
+    hits = jd_context.text_index.keyword_hits
+
     # -------------------------
     # Strong scam / impossible guarantees
     # -------------------------
-    strong_scams = [
-        "guaranteed job",
-        "100% job guarantee",
-        "assured placement",
-        "job assured",
-        "placement guaranteed",
-        "offer letter guaranteed",
-        "salary guaranteed",
-        "fixed job after training",
-        "job without interview",
-        "selection without interview",
-        "instant selection",
-        "same day joining guaranteed",
-    ]
-
-    for s in strong_scams:
-        if s in lower:
-            return {
-                "score": 0.9,
-                "reason": "Unrealistic guaranteed hiring / placement promises detected"
-            }
+    if hits.any(STRONG_SCAMS):
+        return {
+            "score": 0.9,
+            "reason": "Unrealistic guaranteed hiring / placement promises detected"
+        }
 
     # -------------------------
     # Medium level exaggeration
     # -------------------------
-    medium_promises = [
-        "earn unlimited",
-        "no effort required",
-        "effortless income",
-        "easy money",
-        "earn while you sleep",
-        "work only few hours and earn",
-        "guaranteed selection",
-        "instant approval",
-        "quick approval",
-        "job sure shot",
-    ]
-
-    med_hits = [t for t in medium_promises if t in lower]
+    med_hits = hits.matched(MEDIUM_PROMISES)
 
     # -------------------------
     # Tone / formatting reinforcement
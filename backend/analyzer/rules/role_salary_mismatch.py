@@ -1,6 +1,16 @@
 from typing import Dict, Optional
 import re
 from analyzer.parsing.schema import JDContext
+from analyzer.parsing.keyword_matcher import KEYWORDS
+
+
+NEGATIVE_EXPERIENCE = KEYWORDS.register("role_salary_mismatch.negative_experience", [
+    "no experience required",
+    "no experience",
+    "fresher",
+    "freshers",
+    "anyone can apply",
+])
 
 
 def role_salary_mismatch_rule(jd_context: JDContext) -> Dict:
@@ -16,7 +26,7 @@ def role_salary_mismatch_rule(jd_context: JDContext) -> Dict:
     if getattr(jd_context, "confidence_score", 0) < 0.35:
         return {"score": 0.0, "reason": None}
 
-    text = (jd_context.raw_text or "").lower()
+    text = jd_context.text_index.lower
     title = (jd_context.job.title or "").lower()
 
     # ---------- Seniority Detection ----------
@@ -113,17 +123,9 @@ def role_salary_mismatch_rule(jd_context: JDContext) -> Dict:
     # ---------- Experience Signals ----------
     structured_exp = getattr(jd_context.job, "years_experience", None)
 
-    negative_exp_phrases = [
-        "no experience required",
-        "no experience",
-        "fresher",
-        "freshers",
-        "anyone can apply",
-    ]
-
     has_negative_experience = (
         (structured_exp is not None and structured_exp <= 0)
-        or any(p in text for p in negative_exp_phrases)
+        or jd_context.text_index.keyword_hits.any(NEGATIVE_EXPERIENCE)
     )
 
     # ---------- Decision Logic ----------
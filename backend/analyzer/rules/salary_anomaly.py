@@ -12,7 +12,7 @@ def unrealistic_salary_rule(jd_context: JDContext) -> Dict:
     if not isinstance(jd_context, JDContext):
         return {"score": 0.0, "reason": None}
 
-    text = (jd_context.raw_text or "").lower()
+    text = jd_context.text_index.lower
 
     # =====================
     # Structured Salary Data
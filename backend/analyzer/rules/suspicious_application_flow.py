@@ -1,6 +1,60 @@
 from typing import Dict
-import re
 from analyzer.parsing.schema import JDContext
+from analyzer.parsing.keyword_matcher import KEYWORDS
+
+
+# Text-based backup signals (legacy but safe)
+SUSPICIOUS_INDICATORS = KEYWORDS.register("suspicious_application_flow.indicators", [
+    # Money
+    "pay to apply",
+    "application fee",
+    "processing fee",
+    "registration fee",
+    "security deposit",
+    "training fee",
+    "refundable fee",
+    "non refundable",
+    "pay before interview",
+    "pay before joining",
+
+    # Informal channels
+    "apply via whatsapp",
+    "contact on whatsapp",
+    "send resume on whatsapp",
+    "telegram",
+    "dm us",
+    "directly message",
+    "contact hr directly",
+    "text us",
+
+    # Google forms
+    "fill google form",
+    "forms.gle",
+    "google form application",
+
+    # Documents
+    "send documents before interview",
+    "submit id proof",
+    "share aadhaar",
+    "share pan card",
+])
+
+PAYMENT_TERMS = KEYWORDS.register("suspicious_application_flow.payment", [
+    "application fee", "processing fee",
+    "registration fee", "security deposit",
+    "training fee", "refundable fee",
+    "pay to apply", "pay before"
+])
+
+DOCUMENT_TERMS = KEYWORDS.register("suspicious_application_flow.documents", [
+    "aadhaar", "pan card", "id proof", "documents before interview"
+])
+
+MEDIUM_TERMS = KEYWORDS.register("suspicious_application_flow.channels", [
+    "whatsapp", "telegram", "forms.gle", "google form", "dm us"
+])
+
+
 def suspicious_application_flow_rule(jd_context: JDContext) -> Dict:
     """
     Flags suspicious or unsafe application flows.
@@ -10,7 +64,7 @@ def suspicious_application_flow_rule(jd_context: JDContext) -> Dict:
     if not isinstance(jd_context, JDContext):
         return {"score": 0.0, "reason": None}
 
-    text = (jd_context.raw_text or "").lower()
+    hits = jd_context.text_index.keyword_hits
 
     # ==========================================================
     # STRUCTURED SIGNALS (preferred if parsing provided them)
@@ -64,67 +118,23 @@ def suspicious_application_flow_rule(jd_context: JDContext) -> Dict:
     # ==========================================================
     # TEXT-BASED BACKUP (legacy but safe)
     # ==========================================================
-    suspicious_indicators = [
-        # Money
-        "pay to apply",
-        "application fee",
-        "processing fee",
-        "registration fee",
-        "security deposit",
-        "training fee",
-        "refundable fee",
-        "non refundable",
-        "pay before interview",
-        "pay before joining",
-
-        # Informal channels
-        "apply via whatsapp",
-        "contact on whatsapp",
-        "send resume on whatsapp",
-        "telegram",
-        "dm us",
-        "directly message",
-        "contact hr directly",
-        "text us",
-
-        # Google forms
-        "fill google form",
-        "forms.gle",
-        "google form application",
-
-        # Documents
-        "send documents before interview",
-        "submit id proof",
-        "share aadhaar",
-        "share pan card",
-    ]
-
-    payment_terms = [
-        "application fee", "processing fee",
-        "registration fee", "security deposit",
-        "training fee", "refundable fee",
-        "pay to apply", "pay before"
-    ]
-
-    hit_terms = [t for t in suspicious_indicators if t in text]
+    hit_terms = hits.matched(SUSPICIOUS_INDICATORS)
 
     # High risk — payment / document demands
-    if any(t in text for t in payment_terms):
+    if hits.any(PAYMENT_TERMS):
         return {
             "score": 0.9,
             "reason": "Application requires payment or financial commitment"
         }
 
-    if any(x in text for x in ["aadhaar", "pan card", "id proof", "documents before interview"]):
+    if hits.any(DOCUMENT_TERMS):
         return {
             "score": 0.8,
             "reason": "Job post asks for sensitive documents before interview"
         }
 
     # Medium Risk — non-standard apply channels
-    medium_terms = ["whatsapp", "telegram", "forms.gle", "google form", "dm us"]
-
-    medium_hits = [t for t in medium_terms if t in text]
+    medium_hits = hits.matched(MEDIUM_TERMS)
 
     if len(medium_hits) >= 2:
         return {
@@ -1,6 +1,37 @@
 from typing import Dict
 from analyzer.parsing.schema import JDContext
-import re
+from analyzer.parsing.keyword_matcher import KEYWORDS
+
+
+# =========================
+# Strong scam urgency phrases
+# =========================
+STRONG_PHRASES = KEYWORDS.register("urgency_density.strong", [
+    "join immediately",
+    "immediate join",
+    "immediate joining",
+    "apply now",
+    "join now",
+    "no interview",
+    "instant selection",
+    "selected instantly",
+    "guaranteed selection",
+    "limited slots",
+    "act fast",
+    "apply asap",
+], word_boundary=True)
+
+# =========================
+# Normal urgency (mild)
+# =========================
+MILD_PHRASES = KEYWORDS.register("urgency_density.mild", [
+    "urgent",
+    "urgently",
+    "asap",
+    "immediately",
+    "fast hiring",
+    "quick hiring",
+], word_boundary=True)
 
 
 def urgency_density_rule(jd_context: JDContext) -> Dict:
@@ -18,49 +49,16 @@ def urgency_density_rule(jd_context: JDContext) -> Dict:
         return {"score": 0.0, "reason": None}
 
     # Prefer structured title + raw text as fallback
-    text_sources = [
-        getattr(jd_context.job, "title", "") or "",
-        jd_context.raw_text or "",
-    ]
-    text = " ".join(text_sources).lower()
-
-    # =========================
-    # Strong scam urgency phrases
-    # =========================
-    strong_phrases = [
-        r"\bjoin immediately\b",
-        r"\bimmediate join(?:ing)?\b",
-        r"\bapply now\b",
-        r"\bjoin now\b",
-        r"\bno interview\b",
-        r"\binstant selection\b",
-        r"\bselected instantly\b",
-        r"\bguaranteed selection\b",
-        r"\blimited slots\b",
-        r"\bact fast\b",
-        r"\bapply asap\b",
-    ]
-
-    # =========================
-    # Normal urgency (mild)
-    # =========================
-    mild_phrases = [
-        r"\burgent\b",
-        r"\burgently\b",
-        r"\basap\b",
-        r"\bimmediately\b",
-        r"\bfast hiring\b",
-        r"\bquick hiring\b",
-    ]
-
-    strong_hits = 0
-    mild_hits = 0
-
-    for p in strong_phrases:
-        strong_hits += len(re.findall(p, text))
-
-    for p in mild_phrases:
-        mild_hits += len(re.findall(p, text))
+    # (raw text scan is shared; only the title is scanned here)
+    index = jd_context.text_index
+    hits = KEYWORDS.scan_joined(
+        (getattr(jd_context.job, "title", "") or "").lower(),
+        index.lower,
+        index.keyword_hits,
+    )
+
+    strong_hits = hits.count(STRONG_PHRASES)
+    mild_hits = hits.count(MILD_PHRASES)
 
     total_hits = strong_hits + mild_hits
 
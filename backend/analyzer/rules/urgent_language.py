@@ -1,6 +1,39 @@
-import re
 from typing import Dict
 from analyzer.parsing.schema import JDContext
+from analyzer.parsing.keyword_matcher import KEYWORDS
+
+
+# =========================
+# Strong urgency / pressure
+# =========================
+STRONG_URGENCY = KEYWORDS.register("urgent_language.strong", [
+    "join immediately",
+    "immediate join",
+    "immediate joining",
+    "apply now",
+    "join now",
+    "no interview",
+    "instant selection",
+    "selected instantly",
+    "guaranteed selection",
+    "limited slots",
+    "only few positions",
+    "apply asap",
+], word_boundary=True)
+
+# =========================
+# Mild urgency
+# =========================
+MILD_URGENCY = KEYWORDS.register("urgent_language.mild", [
+    "urgent hiring",
+    "urgent requirement",
+    "urgently hiring",
+    "urgent vacancy",
+    "asap",
+    "immediately",
+    "fast hiring",
+    "quick hiring",
+], word_boundary=True)
 
 
 def urgent_language_rule(jd_context: JDContext) -> Dict:
@@ -16,47 +49,18 @@ def urgent_language_rule(jd_context: JDContext) -> Dict:
     if getattr(jd_context, "confidence_score", 0) < 0.35:
         return {"score": 0.0, "reason": None}
 
-    text_sources = [
-        jd_context.job.title or "",
-        jd_context.raw_text or ""
-    ]
-
-    text = " ".join(text_sources)
-    lower = text.lower()
+    index = jd_context.text_index
 
-    # =========================
-    # Strong urgency / pressure
-    # =========================
-    strong_urgency_patterns = [
-        r"\bjoin immediately\b",
-        r"\bimmediate join(?:ing)?\b",
-        r"\bapply now\b",
-        r"\bjoin now\b",
-        r"\bno interview\b",
-        r"\binstant selection\b",
-        r"\bselected instantly\b",
-        r"\bguaranteed selection\b",
-        r"\blimited slots\b",
-        r"\bonly few positions\b",
-        r"\bapply asap\b",
-    ]
+    # Title + raw text are scored as one string; only the title part is
+    # scanned here, the raw text scan is shared with every other rule.
+    hits = KEYWORDS.scan_joined(
+        (jd_context.job.title or "").lower(),
+        index.lower,
+        index.keyword_hits,
+    )
 
-    # =========================
-    # Mild urgency
-    # =========================
-    mild_urgency_patterns = [
-        r"\burgent hiring\b",
-        r"\burgent requirement\b",
-        r"\burgently hiring\b",
-        r"\burgent vacancy\b",
-        r"\basap\b",
-        r"\bimmediately\b",
-        r"\bfast hiring\b",
-        r"\bquick hiring\b",
-    ]
-
-    strong_hits = sum(len(re.findall(p, lower)) for p in strong_urgency_patterns)
-    mild_hits = sum(len(re.findall(p, lower)) for p in mild_urgency_patterns)
+    strong_hits = hits.count(STRONG_URGENCY)
+    mild_hits = hits.count(MILD_URGENCY)
     total_hits = strong_hits + mild_hits
 
     # =========================
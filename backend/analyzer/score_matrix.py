@@ -0,0 +1,162 @@
+"""
+score_matrix.py
+
+Vectorized batch scoring over an N×R rule-score matrix (N postings,
+R rules in registry order).
+
+The rules run once to fill the matrix; aggregation, capping, what-if
+weightings, thresholds and per-rule statistics are then array operations,
+so a whole corpus can be re-scored in milliseconds.
+
+Exact parity with run_all_rules():
+- rule scores are added column by column, i.e. in registry order, the
+  same order as the engine's Python loop (numpy's pairwise row sums
+  would round differently)
+- NaN (rule failed / skipped) adds nothing, like a skipped rule
+- min(total, 1.0) then round(…, 2) with Python's correctly rounded
+  semantics: values near a .xx5 tie are re-rounded with round()
+
+Requires numpy (optional dependency).
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from analyzer.analysis_engine import RULE_NAMES, RULE_TIMEOUT_SECONDS, run_all_rules_with_scores
+
+try:
+    import numpy as np
+except ImportError:  # optional: vectorized scoring needs numpy
+    np = None
+
+
+MAX_SCORE = 1.0
+SCORE_DECIMALS = 2
+
+# |scaled - (k + 0.5)| below this → let Python's round() decide
+_TIE_TOLERANCE = 1e-6
+
+
+def round_scores(values):
+    """Elementwise round(v, 2), bit-identical to Python's round()."""
+    values = np.asarray(values, dtype=np.float64)
+    scale = 10.0 ** SCORE_DECIMALS
+    scaled = values * scale
+    out = np.round(scaled) / scale
+
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < _TIE_TOLERANCE
+    if near_tie.any():
+        out[near_tie] = [round(v, SCORE_DECIMALS) for v in values[near_tie].tolist()]
+
+    return out
+
+
+class ScoreMatrix:
+    """
+    N×R float64 matrix of per-rule scores (NaN = rule failed / skipped).
+    """
+
+    def __init__(self, scores, rule_names: Sequence[str] = RULE_NAMES):
+        if np is None:
+            raise ImportError("numpy is required for vectorized scoring")
+
+        self.rule_names = list(rule_names)
+        self.scores = np.array(scores, dtype=np.float64).reshape(-1, len(self.rule_names))
+        self._filled = np.nan_to_num(self.scores, nan=0.0)
+
+    # ---------------- Construction ----------------
+    @classmethod
+    def from_feature_batch(cls, batch) -> "ScoreMatrix":
+        """From analyzer.feature_export.FeatureBatch (no copy of Python rows)."""
+        return cls(np.frombuffer(batch.rule_scores, dtype=np.float64), batch.rule_names)
+
+    @classmethod
+    def from_arrow(cls, table) -> "ScoreMatrix":
+        """From an exported feature table (e.g. pyarrow.parquet.read_table)."""
+        rule_names = table.schema.metadata[b"rule_names"].decode("utf-8").split(",")
+        columns = [table.column(f"score_{name}").to_numpy() for name in rule_names]
+        return cls(np.column_stack(columns) if columns else [], rule_names)
+
+    def __len__(self) -> int:
+        return self.scores.shape[0]
+
+    # ---------------- Aggregation ----------------
+    def _weights(self, weights: Optional[Dict[str, float]]):
+        if not weights:
+            return None
+        unknown = set(weights) - set(self.rule_names)
+        if unknown:
+            raise ValueError(f"unknown rules in weights: {sorted(unknown)}")
+        return [float(weights.get(name, 1.0)) for name in self.rule_names]
+
+    def raw_totals(self, weights: Optional[Dict[str, float]] = None):
+        """Uncapped sums in registry order; `weights` maps rule name → factor."""
+        factors = self._weights(weights)
+        total = np.zeros(len(self), dtype=np.float64)
+
+        for j in range(len(self.rule_names)):
+            column = self._filled[:, j]
+            total += column if factors is None else column * factors[j]
+
+        return total
+
+    def totals(self, weights: Optional[Dict[str, float]] = None):
+        """rule_score per posting, exactly as run_all_rules() computes it."""
+        return round_scores(np.minimum(self.raw_totals(weights), MAX_SCORE))
+
+    def flagged(self, threshold: float, weights: Optional[Dict[str, float]] = None):
+        """Boolean mask of postings scoring at or above threshold."""
+        return self.totals(weights) >= threshold
+
+    def what_if(self, thresholds: Sequence[float],
+                weights: Optional[Dict[str, float]] = None) -> Dict[float, int]:
+        """Flagged posting count for each candidate threshold."""
+        ordered = np.sort(self.totals(weights))
+        counts = len(ordered) - np.searchsorted(ordered, np.asarray(thresholds, dtype=np.float64), side="left")
+        return {float(t): int(n) for t, n in zip(thresholds, counts)}
+
+    # ---------------- Per-rule statistics ----------------
+    def rule_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Per rule: fired (score > 0) count and rate, mean score, mean score
+        when fired, and how often the rule failed / was skipped.
+        """
+        failed = np.isnan(self.scores).sum(axis=0)
+        fired_mask = self._filled > 0
+        fired = fired_mask.sum(axis=0)
+        n = max(len(self), 1)
+
+        sums = self._filled.sum(axis=0)
+        stats = {}
+
+        for j, name in enumerate(self.rule_names):
+            stats[name] = {
+                "fired": int(fired[j]),
+                "fire_rate": float(fired[j]) / n,
+                "mean_score": float(sums[j]) / n,
+                "mean_when_fired": float(sums[j]) / int(fired[j]) if fired[j] else 0.0,
+                "failed": int(failed[j]),
+            }
+
+        return stats
+
+
+def score_contexts(
+    contexts,
+    parallel: bool = False,
+    rule_timeout: float = RULE_TIMEOUT_SECONDS,
+) -> Tuple[List[Dict], ScoreMatrix]:
+    """
+    Runs the engine once per context and returns (analyses, score matrix).
+    Row i of the matrix belongs to analyses[i].
+    """
+    analyses: List[Dict] = []
+    rows: List[List[float]] = []
+
+    for jd_context in contexts:
+        analysis, scores = run_all_rules_with_scores(
+            jd_context, parallel=parallel, rule_timeout=rule_timeout
+        )
+        analyses.append(analysis)
+        rows.append(scores)
+
+    return analyses, ScoreMatrix(rows)
@@ -0,0 +1,115 @@
+"""
+Debug capture of raw JD texts.
+
+Replaces the old "overwrite debug/raw_jd.txt on every request":
+- recent captures live in a bounded in-memory ring buffer
+- a sampled share can be written to disk by a background thread,
+  one file per capture (no shared file → no cross-worker races)
+- disabled capture is a single attribute check on the hot path
+"""
+
+import itertools
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+from analyzer.utils.logging import get_logger, log_event
+
+
+# ----- Capture defaults -----
+CAPTURE_CAPACITY = 50          # captures kept in memory
+WRITE_QUEUE_SIZE = 200         # pending disk writes; extra samples are dropped
+
+logger = get_logger("debug_capture")
+
+
+class DebugCapture:
+    """
+    Thread-safe capture of raw JD texts.
+
+    capture() never blocks on I/O: disk writes (sample_rate > 0 and a
+    dump_dir) are queued for a daemon writer thread.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        capacity: int = CAPTURE_CAPACITY,
+        sample_rate: float = 0.0,
+        dump_dir: Optional[str] = None,
+    ):
+        self.enabled = enabled
+        self.sample_rate = sample_rate if dump_dir else 0.0
+        self.dump_dir = dump_dir
+
+        self._lock = threading.Lock()
+        self._ring: deque = deque(maxlen=capacity)
+        self._ids = itertools.count(1)
+        self.dropped_writes = 0
+
+        self._queue: Optional[queue.Queue] = None
+        if enabled and self.sample_rate > 0:
+            self._queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+            threading.Thread(
+                target=self._writer, name="debug-capture-writer", daemon=True
+            ).start()
+
+    # ---------------- Capture ----------------
+    def capture(self, raw_text: str, source: str, url: Optional[str] = None):
+        if not self.enabled:
+            return
+
+        entry = {
+            "id": next(self._ids),
+            "ts": round(time.time(), 3),
+            "source": source,
+            "url": url,
+            "chars": len(raw_text or ""),
+            "text": raw_text or "",
+        }
+
+        with self._lock:
+            self._ring.append(entry)
+
+        if self._queue is not None and random.random() < self.sample_rate:
+            try:
+                self._queue.put_nowait(entry)
+            except queue.Full:
+                with self._lock:
+                    self.dropped_writes += 1
+
+    def recent(self, limit: Optional[int] = None) -> List[Dict]:
+        """Newest first."""
+        with self._lock:
+            entries = list(self._ring)
+        entries.reverse()
+        return entries[:limit] if limit else entries
+
+    # ---------------- Background writer ----------------
+    def _writer(self):
+        pid = os.getpid()
+
+        while True:
+            entry = self._queue.get()
+            path = os.path.join(
+                self.dump_dir, f"raw_jd_{int(entry['ts'] * 1000)}_{pid}_{entry['id']}.txt"
+            )
+            try:
+                os.makedirs(self.dump_dir, exist_ok=True)
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(entry["text"])
+            except OSError:
+                log_event(logger, "capture_write_failed", level=logging.WARNING,
+                          exc_info=True, path=path)
+            finally:
+                self._queue.task_done()
+
+    def flush(self):
+        """Blocks until queued writes are on disk (tests / shutdown)."""
+        if self._queue is not None:
+            self._queue.join()
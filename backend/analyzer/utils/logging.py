@@ -0,0 +1,60 @@
+"""
+Structured (JSON lines) logging for the backend.
+
+Every record is one JSON object:
+    {"ts": ..., "level": "INFO", "logger": "ghosthire.api", "event": "analyze", ...fields}
+
+Usage:
+    logger = get_logger("api")
+    log_event(logger, "analyze", total_ms=12.5, cache="hit")
+"""
+
+import json
+import logging
+import sys
+
+
+ROOT_LOGGER = "ghosthire"
+LOG_LEVEL = logging.INFO
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "event": record.getMessage(),
+        }
+        payload.update(getattr(record, "fields", None) or {})
+
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+
+        return json.dumps(payload, default=str, ensure_ascii=False)
+
+
+def _configure_root() -> logging.Logger:
+    root = logging.getLogger(ROOT_LOGGER)
+
+    if not getattr(root, "_ghosthire_configured", False):
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(JsonFormatter())
+        root.addHandler(handler)
+        root.setLevel(LOG_LEVEL)
+        root.propagate = False
+        root._ghosthire_configured = True
+
+    return root
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Child of the "ghosthire" logger, e.g. get_logger("api") → ghosthire.api"""
+    _configure_root()
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+def log_event(logger: logging.Logger, event: str, level: int = logging.INFO,
+              exc_info=None, **fields):
+    if logger.isEnabledFor(level):
+        logger.log(level, event, exc_info=exc_info, extra={"fields": fields})
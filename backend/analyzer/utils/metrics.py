@@ -0,0 +1,277 @@
+"""
+In-process metrics with Prometheus text exposition.
+
+Dependency-free counters / histograms, safe to update from any thread.
+
+The registry is per process and is NOT aggregated across workers: behind
+a pre-fork server sharing one port (gunicorn -w N), a /metrics scrape
+reports only the worker that answered it. Expose each worker as its own
+scrape target (or run the single-process ASGI service) for complete
+numbers.
+
+Hot-path cost: one dict lookup + one lock per update.
+"""
+
+import bisect
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+# Seconds; covers cached hits (sub-ms) through slow remote fetches
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def _header(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+
+    @abstractmethod
+    def render(self) -> List[str]:
+        """Exposition lines, HELP / TYPE header included."""
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def values(self) -> Dict[Tuple[str, ...], float]:
+        with self._lock:
+            return dict(self._values)
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        for key, value in sorted(self.values().items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Gauge(_Metric):
+    """
+    Gauge whose samples are computed at scrape time by `collect()`,
+    returning {label values tuple: value}.
+    """
+    kind = "gauge"
+
+    def __init__(self, name, documentation, labelnames=(), collect=None):
+        super().__init__(name, documentation, labelnames)
+        self._collect = collect
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        samples = self._collect() if self._collect else {}
+        for key, value in sorted(samples.items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # key -> [per-bucket counts..., +Inf count], sum
+        self._counts: Dict[Tuple[str, ...], List[int]] = {}
+        self._sums: Dict[Tuple[str, ...], float] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        slot = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+                self._sums[key] = 0.0
+            counts[slot] += 1
+            self._sums[key] += value
+
+    def count(self, **labels) -> int:
+        with self._lock:
+            return sum(self._counts.get(self._key(labels), ()))
+
+    def render(self) -> List[str]:
+        with self._lock:
+            snapshot = {k: (list(c), self._sums[k]) for k, c in self._counts.items()}
+
+        lines = self._header()
+        bounds = [*self.buckets, float("inf")]
+
+        for key, (counts, total) in sorted(snapshot.items()):
+            cumulative = 0
+            for bound, n in zip(bounds, counts):
+                cumulative += n
+                le = 'le="' + _format_value(bound) + '"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}"
+                )
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            self._metrics.append(metric)
+        return metric
+
+    def counter(self, name, documentation, labelnames=()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge(self, name, documentation, labelnames=(), collect=None) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames, collect))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics)
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# ===== Process-wide registry + pipeline metrics =====
+REGISTRY = Registry()
+
+REQUESTS = REGISTRY.counter(
+    "ghosthire_requests_total", "Analyze API requests.", ("endpoint", "status")
+)
+REQUEST_LATENCY = REGISTRY.histogram(
+    "ghosthire_request_duration_seconds", "Analyze API request latency.", ("endpoint",)
+)
+STAGE_LATENCY = REGISTRY.histogram(
+    "ghosthire_stage_duration_seconds",
+    "Pipeline stage latency (fetch, extract, normalize, parse, rules, insights, ...).",
+    ("stage",),
+)
+FETCH_RESULTS = REGISTRY.counter(
+    "ghosthire_fetch_total", "Job page fetches by outcome (ok or failure reason code).", ("outcome",)
+)
+CACHE_LOOKUPS = REGISTRY.counter(
+    "ghosthire_cache_lookups_total", "Cache lookups by cache and outcome.", ("cache", "outcome")
+)
+COALESCED_REQUESTS = REGISTRY.counter(
+    "ghosthire_coalesced_requests_total",
+    "Analyze requests answered by an identical in-flight analysis.",
+    ("endpoint", "source"),
+)
+RULE_FIRED = REGISTRY.counter(
+    "ghosthire_rule_fired_total", "Times a rule returned a non-zero score.", ("rule",)
+)
+RULE_ERRORS = REGISTRY.counter(
+    "ghosthire_rule_errors_total", "Exceptions swallowed per rule.", ("rule",)
+)
+RULE_TIMEOUTS = REGISTRY.counter(
+    "ghosthire_rule_timeouts_total", "Rules skipped after exceeding their time budget.", ("rule",)
+)
+
+# Trace span name → stage label
+STAGE_SPANS = {
+    "stage.fetch": "fetch",
+    "stage.extract": "extract",
+    "stage.normalize": "normalize",
+    "stage.parse": "parse",
+    "stage.rules": "rules",
+    "stage.skills": "insights",
+    "stage.result_cache": "result_cache",
+    "stage.near_duplicates": "near_duplicates",
+}
+
+
+def _cache_hit_ratios() -> Dict[Tuple[str, ...], float]:
+    totals: Dict[str, float] = {}
+    hits: Dict[str, float] = {}
+
+    for (cache, outcome), n in CACHE_LOOKUPS.values().items():
+        totals[cache] = totals.get(cache, 0.0) + n
+        # a 304 revalidation still saved the download
+        if outcome in ("hit", "revalidated"):
+            hits[cache] = hits.get(cache, 0.0) + n
+
+    return {(cache,): hits.get(cache, 0.0) / total for cache, total in totals.items() if total}
+
+
+CACHE_HIT_RATIO = REGISTRY.gauge(
+    "ghosthire_cache_hit_ratio", "Share of cache lookups served from cache.", ("cache",),
+    collect=_cache_hit_ratios,
+)
+
+
+def fetch_outcome(reason: Optional[str]) -> str:
+    """
+    Failure reason → bounded label value ("network_error: <details>" → "network_error").
+    """
+    if not reason:
+        return "ok"
+    return reason.split(":", 1)[0].strip() or "unknown"
+
+
+def observe_span(name: str, seconds: float):
+    """Trace observer: feeds stage spans into STAGE_LATENCY."""
+    stage = STAGE_SPANS.get(name)
+    if stage is not None:
+        STAGE_LATENCY.observe(seconds, stage=stage)
+
+
+def render_metrics() -> str:
+    return REGISTRY.render()
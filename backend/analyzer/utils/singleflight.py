@@ -0,0 +1,127 @@
+"""
+singleflight.py
+
+In-flight request coalescing ("single flight").
+
+Concurrent calls with the same key share one computation: the first
+caller (the leader) runs it, later callers wait and receive the same
+result or exception. Nothing is kept once the call finishes, so this is
+not a cache; it only absorbs bursts of identical work that overlap in
+time (e.g. a viral posting submitted by many users at once).
+
+SingleFlight       -> threads (Flask workers)
+AsyncSingleFlight  -> asyncio tasks (ASGI service)
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Thread-safe coalescing of concurrent calls by key.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._counters = {"leaders": 0, "coalesced": 0}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Runs fn() unless a call with the same key is already in flight, in
+        which case waits for that one instead.
+
+        Returns (result, shared); shared is True for callers that waited.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+
+            if leader:
+                call = self._calls[key] = _Call()
+                self._counters["leaders"] += 1
+            else:
+                self._counters["coalesced"] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result, False
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counters, in_flight=len(self._calls))
+
+
+class AsyncSingleFlight:
+    """
+    Coalescing of concurrent coroutines by key, within one event loop.
+
+    The shared computation runs as its own task, so a waiting request that
+    is cancelled (client gone) never cancels it for the others. The task
+    is created from the leader's context (trace, contextvars).
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self._counters = {"leaders": 0, "coalesced": 0}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Awaits fn() unless a call with the same key is already in flight.
+
+        Returns (result, shared); shared is True for callers that waited.
+        """
+        task = self._calls.get(key)
+        shared = task is not None
+
+        if shared:
+            self._counters["coalesced"] += 1
+        else:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            self._counters["leaders"] += 1
+            task.add_done_callback(lambda done: self._finish(key, done))
+
+        return await asyncio.shield(task), shared
+
+    def _finish(self, key: Hashable, task: asyncio.Future):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # mark the exception retrieved even if every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    def stats(self) -> Dict[str, int]:
+        return dict(self._counters, in_flight=len(self._calls))
@@ -0,0 +1,114 @@
+"""
+Lightweight request tracing.
+
+A Trace collects named span durations and counters for one request (or
+one batch). The active trace lives in a context variable, so pipeline
+code only needs `with span("parse_jd"):` and never passes a trace
+around. With no active trace, span() is close to free.
+
+Span names are dotted by layer:
+    stage.<name>     pipeline steps (fetch, extract, normalize, parse, rules, ...)
+    detector.<name>  parsing detectors
+    rule.<name>      fraud rules
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Optional
+
+
+_current_trace: ContextVar[Optional["Trace"]] = ContextVar("ghosthire_trace", default=None)
+
+
+class Trace:
+    """
+    Thread-safe span / counter collector.
+    Repeated spans with the same name (e.g. one rule over a batch) add up.
+
+    `observer(name, seconds)` is also called for every single span, e.g. to
+    feed latency histograms with per-occurrence values.
+    """
+
+    def __init__(self, observer: Optional[Callable[[str, float], None]] = None):
+        self.started = time.perf_counter()
+        self.observer = observer
+        self._lock = threading.Lock()
+        self._spans: Dict[str, float] = {}
+        self._calls: Dict[str, int] = {}
+        self._counters: Dict[str, int] = {}
+
+    def add_span(self, name: str, seconds: float):
+        with self._lock:
+            self._spans[name] = self._spans.get(name, 0.0) + seconds
+            self._calls[name] = self._calls.get(name, 0) + 1
+
+        if self.observer is not None:
+            self.observer(name, seconds)
+
+    def incr(self, name: str, n: int = 1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def elapsed_ms(self) -> float:
+        return round((time.perf_counter() - self.started) * 1000, 3)
+
+    def as_dict(self) -> Dict:
+        """
+        {
+            "total_ms": float,
+            "spans":    {name: ms, ...}  (first-seen order),
+            "calls":    {name: n, ...}   (only names seen more than once),
+            "counters": {name: n, ...},
+        }
+        """
+        with self._lock:
+            return {
+                "total_ms": self.elapsed_ms(),
+                "spans": {k: round(v * 1000, 3) for k, v in self._spans.items()},
+                "calls": {k: n for k, n in self._calls.items() if n > 1},
+                "counters": dict(self._counters),
+            }
+
+
+def current_trace() -> Optional[Trace]:
+    return _current_trace.get()
+
+
+@contextmanager
+def start_trace(trace: Optional[Trace] = None):
+    """
+    Makes `trace` (or a new one) the active trace for this context.
+    """
+    trace = trace or Trace()
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+
+
+@contextmanager
+def span(name: str, trace: Optional[Trace] = None):
+    """
+    Times the block into `trace` (default: the active trace).
+    Pass `trace` explicitly from worker threads, which do not inherit
+    the caller's context.
+    """
+    trace = trace or _current_trace.get()
+    if trace is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add_span(name, time.perf_counter() - start)
+
+
+def incr(name: str, n: int = 1, trace: Optional[Trace] = None):
+    trace = trace or _current_trace.get()
+    if trace is not None:
+        trace.incr(name, n)
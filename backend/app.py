@@ -1,109 +1,110 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
 
-from analyzer.analysis_engine import run_all_rules
-from analyzer.ingestion.url_fetcher import fetch_url_content
-from analyzer.ingestion.jd_extractor import extract_job_description
-from analyzer.ingestion.normalizer import normalize_job_description
-from analyzer.parsing.jd_parser import parse_jd
+from analyzer.utils.tracing import Trace, start_trace
+from analyzer.utils.metrics import observe_span, render_metrics
+from pipeline import (
+    ALLOWED_ORIGINS,
+    analyze_batch_payload,
+    analyze_payload,
+    debug_capture,
+    traced_body,
+)
 import os
 from utils.loc_counter import count_loc
 
+# Pipeline config (caches, rule execution, debug capture) lives in pipeline.py,
+# shared with the ASGI service (asgi.py).
+
 app = Flask(__name__)
 CORS(
     app,
-    resources={r"/*": {"origins": ["http://localhost:3000", "http://127.0.0.1:3000"]}},
+    resources={r"/*": {"origins": ALLOWED_ORIGINS}},
     supports_credentials=True,
     allow_headers=["Content-Type"],
     methods=["GET", "POST", "OPTIONS"]
 )
 
-# ===== Debug raw JD dump config =====
-DEBUG_DUMP_RAW_JD = True
-DEBUG_RAW_JD_PATH = "debug/raw_jd.txt"
-# ===================================
+
+def _wants_timings(data: dict) -> bool:
+    return bool(data.get("timings")) or request.args.get("timings") in ("1", "true")
+
+
+def _traced_response(event: str, data: dict, trace: Trace, body: dict, status: int):
+    return jsonify(traced_body(event, trace, body, status, _wants_timings(data))), status
 
 
 @app.route("/analyze", methods=["POST", "OPTIONS"])
 def analyze():
+    """
+    Pass "timings": true in the body (or ?timings=1) to get per-stage,
+    per-detector and per-rule durations in a "timings" block.
+    """
     if request.method == "OPTIONS":
         return "", 200
 
     data = request.get_json(silent=True) or {}
 
-    job_text = (data.get("job_text") or "").strip()
-    job_url = (data.get("job_url") or "").strip()
-
-    # -------- Case 1: JD pasted directly --------
-    if job_text:
-        raw_jd_text = job_text
+    with start_trace(Trace(observer=observe_span)) as trace:
+        body, status = analyze_payload(data)
 
-        if DEBUG_DUMP_RAW_JD:
-            try:
-                with open(DEBUG_RAW_JD_PATH, "w", encoding="utf-8") as f:
-                    f.write(raw_jd_text)
-            except Exception:
-                pass
+    return _traced_response("analyze", data, trace, body, status)
 
-        jd_context = parse_jd(raw_jd_text)
 
-        if jd_context is None:
-            return jsonify({
-                "error": "Failed to parse job description"
-            }), 400
+@app.route("/analyze/batch", methods=["POST", "OPTIONS"])
+def analyze_batch():
+    """
+    Analyzes many postings in one round trip.
 
-        return jsonify(run_all_rules(jd_context))
+    Request:
+        {"items": [{"job_text": "..."}, {"job_url": "..."}, ...]}
 
-    # -------- Case 2: JD fetched via URL --------
-    if job_url:
-        try:
-            fetch_result = fetch_url_content(job_url)
-
-            if not fetch_result.get("success"):
-                return jsonify({
-                    "error": "Failed to fetch job page",
-                    "reason": fetch_result.get("reason"),
-                    "status_code": fetch_result.get("status_code")
-                }), 400
+    Response:
+        {"results": [...]} in the same order as "items". Each entry is either
+        the usual /analyze output or {"error": ..., "status": ...} for that item.
+        "timings" (summed over the batch) is added when requested.
+    """
+    if request.method == "OPTIONS":
+        return "", 200
 
-            html = fetch_result.get("html") or ""
+    data = request.get_json(silent=True) or {}
 
-            extracted_text = extract_job_description(html)
-            normalized_text = normalize_job_description(extracted_text)
+    with start_trace(Trace(observer=observe_span)) as trace:
+        body, status = analyze_batch_payload(data)
 
-            if not normalized_text:
-                return jsonify({
-                    "error": "Unable to extract job description from the provided URL"
-                }), 400
+    return _traced_response("analyze_batch", data, trace, body, status)
 
-            raw_jd_text = normalized_text
 
-            if DEBUG_DUMP_RAW_JD:
-                try:
-                    with open(DEBUG_RAW_JD_PATH, "w", encoding="utf-8") as f:
-                        f.write(raw_jd_text)
-                except Exception:
-                    pass
+@app.route("/metrics", methods=["GET"])
+def metrics():
+    """
+    Prometheus text exposition of this worker's request / stage / fetch /
+    cache / rule metrics (see analyzer/utils/metrics.py). Not aggregated
+    across worker processes.
+    """
+    return Response(render_metrics(), mimetype="text/plain; version=0.0.4")
 
-            jd_context = parse_jd(raw_jd_text)
 
-            if jd_context is None:
-                return jsonify({
-                    "error": "Failed to parse extracted job description"
-                }), 400
+def debug_captures():
+    """
+    Most recent captured raw JDs, newest first. ?limit=N (default 10).
+    """
+    if not debug_capture.enabled:
+        return jsonify({"error": "Debug capture is disabled"}), 404
 
-            return jsonify(run_all_rules(jd_context))
+    try:
+        limit = max(1, int(request.args.get("limit", 10)))
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
 
-        except Exception as e:
-            return jsonify({
-                "error": str(e)
-            }), 400
+    return jsonify({"captures": debug_capture.recent(limit)})
 
-    # -------- Case 3: Invalid input --------
 
-    return jsonify({
-        "error": "Either job_text or job_url is required"
-    }), 400
+# Unauthenticated and serves raw JD text: only exposed when capture is
+# switched on explicitly (GHOSTHIRE_DEBUG_CAPTURE=1). Decided at import
+# time, so Flask's debug mode (set later by app.run) does not affect it.
+if debug_capture.enabled:
+    app.add_url_rule("/debug/captures", view_func=debug_captures, methods=["GET"])
 
 
 @app.route("/loc", methods=["GET"])
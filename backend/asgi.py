@@ -0,0 +1,358 @@
+"""
+asgi.py
+
+asyncio-native variant of the analysis service: same /analyze,
+/analyze/batch and /metrics contract as app.py, same pipeline (pipeline.py).
+
+The Flask app blocks a worker thread for the whole URL fetch (up to the
+(5, 10) s timeouts, times the retries). Here the fetch is awaited
+(analyzer/ingestion/async_fetcher.py), so one process keeps hundreds of
+URL analyses in flight; the CPU-bound steps (extract, normalize, parse,
+rules) run on a bounded thread pool so they never stall the event loop.
+Batch URL items are fetched like the Flask batch (bulk_fetcher): once per
+distinct canonical URL, with per-host concurrency and request-rate limits.
+
+Plain ASGI 3 callable, no framework. Run with any ASGI server:
+    uvicorn asgi:app --port 5000
+
+Requires httpx for URL analysis (optional dependency).
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import copy
+import functools
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import pipeline
+from analyzer.ingestion import bulk_fetcher
+from analyzer.ingestion.async_fetcher import AsyncFetcher
+from analyzer.ingestion.url_fetcher import _validate_url, canonicalize_url
+from analyzer.utils.logging import log_event
+from analyzer.utils.metrics import observe_span, render_metrics
+from analyzer.utils.singleflight import AsyncSingleFlight
+from analyzer.utils.tracing import Trace, span, start_trace
+
+
+# ===== Async service config =====
+MAX_CONCURRENT_FETCHES = 500              # URL fetches in flight per process
+CPU_WORKERS = min(8, os.cpu_count() or 1)  # threads for extract / parse / rules
+PER_HOST_CONCURRENCY = bulk_fetcher.PER_DOMAIN_CONCURRENCY  # per batch, like the Flask batch
+PER_HOST_RATE = bulk_fetcher.PER_DOMAIN_RATE                # request starts / s (None = unlimited)
+# ================================
+
+_cpu_executor = ThreadPoolExecutor(max_workers=CPU_WORKERS, thread_name_prefix="ghosthire-cpu")
+
+
+class _FetchState:
+    """
+    Fetcher + concurrency limit, bound to the running event loop.
+    Created on lifespan startup (or lazily on the first URL request).
+    """
+
+    def __init__(self):
+        self.fetcher: Optional[AsyncFetcher] = None
+        self.slots: Optional[asyncio.Semaphore] = None
+
+    def start(self):
+        if self.fetcher is None:
+            self.fetcher = AsyncFetcher()
+            self.slots = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+    async def stop(self):
+        fetcher, self.fetcher, self.slots = self.fetcher, None, None
+        if fetcher is not None:
+            await fetcher.close()
+
+
+_fetch_state = _FetchState()
+
+
+class _HostLimits:
+    """
+    Per-host concurrency + request-start pacing for one batch, keyed on
+    the canonical host (the one actually requested), as in bulk_fetcher.
+    """
+
+    def __init__(self, concurrency: int = None, rate: Optional[float] = None):
+        self.concurrency = concurrency or PER_HOST_CONCURRENCY
+        self.interval = 1.0 / rate if rate else 0.0
+        self._slots: Dict[str, asyncio.Semaphore] = {}
+        self._next_start: Dict[str, float] = {}
+
+    @contextlib.asynccontextmanager
+    async def slot(self, url: str):
+        _validate_url(url)
+        host = (urlsplit(canonicalize_url(url).url).hostname or "").lower()
+
+        slots = self._slots.get(host)
+        if slots is None:
+            slots = self._slots[host] = asyncio.Semaphore(self.concurrency)
+
+        async with slots:
+            now = asyncio.get_running_loop().time()
+            start = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start + self.interval
+            if start > now:
+                await asyncio.sleep(start - now)
+            yield
+
+# identical concurrent /analyze requests share one analysis (per event loop)
+analysis_flights = AsyncSingleFlight() if pipeline.ENABLE_SINGLE_FLIGHT else None
+
+
+async def _run_cpu(fn, *args):
+    """
+    Runs fn(*args) on the CPU pool. The context is copied, so stage spans
+    land in the request's trace.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(_cpu_executor, functools.partial(context.run, fn, *args))
+
+
+# ---------------- Pipeline ----------------
+async def _resolve_jd_text(data: dict, hosts: Optional[_HostLimits] = None):
+    """
+    pipeline.resolve_jd_text() with the fetch awaited instead of blocking.
+    With `hosts`, the fetch also waits for its host's batch limits.
+    """
+    job_text, job_url = pipeline.payload_fields(data)
+
+    # Pasted text / invalid input: no I/O, same code path as Flask
+    if job_text or not job_url:
+        return pipeline.resolve_jd_text(data)
+
+    try:
+        _fetch_state.start()
+        host_slot = hosts.slot(job_url) if hosts is not None else contextlib.nullcontext()
+
+        async with host_slot, _fetch_state.slots:
+            with span("stage.fetch"):
+                fetch_result = await _fetch_state.fetcher.fetch(
+                    job_url, cache=pipeline.get_http_cache()
+                )
+
+        return await _run_cpu(pipeline.fetched_jd_text, job_url, fetch_result)
+
+    except Exception as e:
+        return None, False, ({
+            "error": str(e)
+        }, 400)
+
+
+async def _resolve_batch_item(item, hosts: _HostLimits):
+    if not isinstance(item, dict):
+        return pipeline.resolve_batch_item(item)
+    return await _resolve_jd_text(item, hosts)
+
+
+async def analyze_payload(data: dict):
+    """
+    Returns (response body, status) for one /analyze payload.
+    Concurrent requests for the same URL / text share one analysis.
+    """
+    key = pipeline.flight_key(data) if analysis_flights is not None else None
+
+    if key is None:
+        return await _analyze_payload(data)
+
+    source, key = key
+    (body, status), shared = await analysis_flights.do(key, lambda: _analyze_payload(data))
+
+    if shared:
+        pipeline.record_coalesced("analyze", source)
+        body = copy.deepcopy(body)
+
+    return body, status
+
+
+async def _analyze_payload(data: dict):
+    raw_jd_text, from_url, error = await _resolve_jd_text(data)
+
+    if error:
+        return error
+
+    return await _run_cpu(pipeline.analyze_jd_text, raw_jd_text, from_url)
+
+
+async def analyze_batch_payload(data: dict):
+    """
+    Returns (response body, status) for one /analyze/batch payload.
+    URL items are fetched concurrently within per-host limits; repeated
+    URLs (same canonical URL) are fetched once.
+    """
+    items, error = pipeline.batch_items(data)
+
+    if error:
+        return error
+
+    hosts = _HostLimits(PER_HOST_CONCURRENCY, PER_HOST_RATE)
+    url_flights: Dict[str, asyncio.Future] = {}
+
+    def resolve(item):
+        key = pipeline.flight_key(item) if isinstance(item, dict) else None
+        if key is None or key[0] != "url":
+            return _resolve_batch_item(item, hosts)
+
+        flight = url_flights.get(key[1])
+        if flight is None:
+            flight = url_flights[key[1]] = asyncio.ensure_future(_resolve_batch_item(item, hosts))
+        return flight
+
+    resolved = await asyncio.gather(*(resolve(item) for item in items))
+
+    return await _run_cpu(pipeline.analyze_resolved_batch, list(resolved))
+
+
+# ---------------- HTTP plumbing ----------------
+JSON_CONTENT_TYPE = b"application/json"
+METRICS_CONTENT_TYPE = b"text/plain; version=0.0.4; charset=utf-8"
+
+ALLOWED_METHODS = b"GET, OPTIONS, POST"
+ALLOWED_HEADERS = b"Content-Type"
+
+Headers = List[Tuple[bytes, bytes]]
+
+
+def _cors_headers(scope) -> Headers:
+    """Mirrors the flask_cors setup in app.py (credentials, fixed origins)."""
+    origin = dict(scope.get("headers") or []).get(b"origin")
+
+    if origin is None or origin.decode("latin-1") not in pipeline.ALLOWED_ORIGINS:
+        return []
+
+    headers = [
+        (b"access-control-allow-origin", origin),
+        (b"access-control-allow-credentials", b"true"),
+        (b"vary", b"Origin"),
+    ]
+
+    if scope["method"] == "OPTIONS":
+        headers += [
+            (b"access-control-allow-methods", ALLOWED_METHODS),
+            (b"access-control-allow-headers", ALLOWED_HEADERS),
+        ]
+
+    return headers
+
+
+async def _send(send, scope, status: int, body: bytes, content_type: bytes):
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", content_type),
+            (b"content-length", str(len(body)).encode("ascii")),
+        ] + _cors_headers(scope),
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _send_json(send, scope, body: Dict, status: int):
+    # Same serialization as Flask's jsonify (sorted keys, compact)
+    payload = json.dumps(body, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    await _send(send, scope, status, payload, JSON_CONTENT_TYPE)
+
+
+async def _read_json(receive) -> Dict:
+    """Request body as a JSON object; {} when missing or invalid."""
+    chunks = []
+
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body"):
+            break
+
+    try:
+        data = json.loads(b"".join(chunks) or b"null")
+    except ValueError:
+        return {}
+
+    return data if isinstance(data, dict) else {}
+
+
+def _wants_timings(data: dict, scope) -> bool:
+    query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+    return bool(data.get("timings")) or query.get("timings", [""])[-1] in ("1", "true")
+
+
+async def _traced(event: str, handler, scope, receive, send):
+    """
+    Runs one analyze handler under a request trace; same metrics, log
+    line and optional "timings" block as the Flask app.
+    """
+    data = await _read_json(receive)
+
+    with start_trace(Trace(observer=observe_span)) as trace:
+        body, status = await handler(data)
+
+    body = pipeline.traced_body(event, trace, body, status, _wants_timings(data, scope))
+    await _send_json(send, scope, body, status)
+
+
+ROUTES = {
+    "/analyze": ("POST", "analyze", analyze_payload),
+    "/analyze/batch": ("POST", "analyze_batch", analyze_batch_payload),
+}
+
+
+async def _lifespan(receive, send):
+    while True:
+        message = await receive()
+
+        if message["type"] == "lifespan.startup":
+            try:
+                _fetch_state.start()
+            except ImportError:
+                # pasted-text analysis still works; URL requests report the error
+                log_event(pipeline.api_logger, "async_fetcher_unavailable", level=logging.WARNING)
+            await send({"type": "lifespan.startup.complete"})
+
+        elif message["type"] == "lifespan.shutdown":
+            await _fetch_state.stop()
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def app(scope, receive, send):
+    """ASGI 3 entry point."""
+    if scope["type"] == "lifespan":
+        await _lifespan(receive, send)
+        return
+
+    if scope["type"] != "http":
+        return
+
+    path = scope["path"]
+    method = scope["method"]
+
+    try:
+        if path == "/metrics" and method == "GET":
+            await _send(send, scope, 200, render_metrics().encode("utf-8"), METRICS_CONTENT_TYPE)
+            return
+
+        route = ROUTES.get(path)
+
+        if route is None:
+            await _send_json(send, scope, {"error": "Not found"}, 404)
+        elif method == "OPTIONS":
+            await _send(send, scope, 200, b"", JSON_CONTENT_TYPE)
+        elif method != route[0]:
+            await _send_json(send, scope, {"error": "Method not allowed"}, 405)
+        else:
+            _, event, handler = route
+            await _traced(event, handler, scope, receive, send)
+
+    except Exception:
+        log_event(pipeline.api_logger, "asgi_error", level=logging.ERROR, exc_info=True, path=path)
+        await _send_json(send, scope, {"error": "Internal server error"}, 500)
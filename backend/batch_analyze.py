@@ -0,0 +1,422 @@
+"""
+batch_analyze.py
+
+Offline batch analysis of exported job corpora, without Flask.
+
+Reads JSONL or CSV records (pasted text or raw HTML), runs the same
+pipeline as /analyze (extract → normalize for HTML, then parse_jd +
+run_all_rules, which includes skill extraction) on a process pool, and
+streams one JSON result per input record, in input order.
+
+Usage:
+    python batch_analyze.py corpus.jsonl -o results.jsonl --workers 8
+    python batch_analyze.py corpus.csv -o results.jsonl --resume
+
+Record fields (configurable):
+    id        optional identifier copied to the output
+    job_text  JD text            (used when present)
+    html      raw page HTML      (used when there is no text)
+    job_url   page URL, helps portal detection for HTML
+
+Resume:
+    After every written chunk the record offset, the input byte position
+    and the output size are saved to <output>.checkpoint. --resume seeks
+    the input past the processed records (nothing before them is re-read)
+    and trims any half-written tail from the output.
+
+Features:
+    --features out.parquet (or .npy) also writes parsed fields + per-rule
+    scores in columnar form (see analyzer/feature_export.py); the "index"
+    column is the record offset. Not combinable with --resume.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from analyzer.analysis_engine import run_all_rules
+from analyzer.feature_export import FeatureBatch, FeatureWriter
+from analyzer.ingestion.jd_extractor import extract_job_description
+from analyzer.ingestion.normalizer import normalize_job_description
+from analyzer.parsing.jd_parser import parse_jd
+
+
+# ----- Batch defaults -----
+CHUNK_SIZE = 200              # records per task sent to a worker
+CHUNKS_PER_WORKER = 4         # in-flight chunks per worker (bounds memory)
+PROGRESS_EVERY_SECONDS = 5.0
+
+
+# ===================== Input =====================
+def _detect_format(path: str, fmt: str) -> str:
+    if fmt != "auto":
+        return fmt
+    return "csv" if path.lower().endswith(".csv") else "jsonl"
+
+
+def read_records(path: str, fmt: str = "auto") -> Iterator[Dict]:
+    """
+    Streams records one at a time. Blank lines are not records; any other
+    line that is not a JSON object yields {"_error": ...}, so every
+    non-blank line keeps its record offset.
+    """
+    for record, _ in read_positioned_records(path, fmt):
+        yield record
+
+
+def read_positioned_records(path: str, fmt: str = "auto",
+                            start_byte: int = 0) -> Iterator[Tuple[Dict, int]]:
+    """
+    read_records() as (record, input byte position after it) pairs,
+    starting at `start_byte` (a position yielded by an earlier read).
+    """
+    fmt = _detect_format(path, fmt)
+
+    with open(path, "rb") as f:
+        if fmt == "csv":
+            yield from _read_csv(f, start_byte)
+            return
+
+        f.seek(start_byte)
+        position = start_byte
+
+        for line in f:
+            position += len(line)
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                record = {"_error": f"invalid_json: {e}"}
+            if not isinstance(record, dict):
+                record = {"_error": "record is not a JSON object"}
+            yield record, position
+
+
+def _read_csv(f, start_byte: int) -> Iterator[Tuple[Dict, int]]:
+    # HTML columns easily exceed the default 128KB field limit
+    csv.field_size_limit(sys.maxsize)
+    position = 0
+
+    def lines():
+        nonlocal position
+        for line in f:
+            position += len(line)
+            yield line.decode("utf-8")
+
+    reader = csv.DictReader(lines())
+    reader.fieldnames  # the header always comes from the top of the file
+
+    if start_byte > position:
+        f.seek(start_byte)
+        position = start_byte
+
+    for record in reader:
+        yield record, position
+
+
+# ===================== Worker side =====================
+def analyze_record(record: Dict, fields: Dict[str, str],
+                   features: Optional[FeatureBatch] = None, offset: int = 0) -> Dict:
+    """
+    Runs the /analyze pipeline on one record.
+    Returns the analysis, or {"error": ...} for records that can't be analyzed.
+    With `features`, the analyzed record is also appended there as row `offset`.
+    """
+    if record.get("_error"):
+        return {"error": record["_error"]}
+
+    job_text = (record.get(fields["text"]) or "").strip()
+
+    if not job_text:
+        html = record.get(fields["html"]) or ""
+        if not html:
+            return {"error": f"record has neither '{fields['text']}' nor '{fields['html']}'"}
+
+        extracted = extract_job_description(html, url=record.get(fields["url"]) or None)
+        job_text = normalize_job_description(extracted)
+
+        if not job_text:
+            return {"error": "Unable to extract job description from HTML"}
+
+    jd_context = parse_jd(job_text)
+
+    if jd_context is None:
+        return {"error": "Failed to parse job description"}
+
+    if features is not None:
+        return features.analyze(jd_context, index=offset)
+
+    return run_all_rules(jd_context)
+
+
+def analyze_chunk(
+    chunk: List[Tuple[int, Dict]], fields: Dict[str, str], with_features: bool = False
+) -> Tuple[List[str], int, Optional[FeatureBatch]]:
+    """
+    Worker task: analyze a chunk, return (ready-to-write JSON lines, error
+    count, feature columns or None). Serialization happens in the worker,
+    not the writer process.
+    """
+    lines = []
+    errors = 0
+    features = FeatureBatch() if with_features else None
+
+    for offset, record in chunk:
+        try:
+            result = analyze_record(record, fields, features, offset)
+        except Exception as e:
+            result = {"error": f"analysis_failed: {e}"}
+
+        if "error" in result:
+            errors += 1
+
+        out = {"offset": offset}
+        record_id = record.get(fields["id"])
+        if record_id not in (None, ""):
+            out["id"] = record_id
+        out.update(result)
+
+        lines.append(json.dumps(out, ensure_ascii=False))
+
+    return lines, errors, features
+
+
+# ===================== Checkpointing =====================
+def _checkpoint_path(output: str) -> str:
+    return output + ".checkpoint"
+
+
+def load_checkpoint(output: str) -> Tuple[int, int, Optional[int]]:
+    """
+    (records done, output bytes, input bytes) or (0, 0, None) if there is
+    no checkpoint. Input bytes is None for checkpoints written before it
+    was recorded (resume then skips records by count).
+    """
+    try:
+        with open(_checkpoint_path(output), encoding="utf-8") as f:
+            state = json.load(f)
+        input_bytes = state.get("input_bytes")
+        return (
+            int(state["offset"]),
+            int(state["output_bytes"]),
+            None if input_bytes is None else int(input_bytes),
+        )
+    except (OSError, ValueError, KeyError):
+        return 0, 0, None
+
+
+def save_checkpoint(output: str, offset: int, output_bytes: int,
+                    input_bytes: Optional[int] = None):
+    path = _checkpoint_path(output)
+    tmp = path + ".tmp"
+    state = {"offset": offset, "output_bytes": output_bytes}
+    if input_bytes is not None:
+        state["input_bytes"] = input_bytes
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmp, path)
+
+
+# ===================== Driver =====================
+def _chunks(
+    records: Iterator[Tuple[Dict, int]], start: int, chunk_size: int, first_offset: int = 0
+) -> Iterator[Tuple[List[Tuple[int, Dict]], int]]:
+    """
+    Groups (record, input position) pairs, numbered from `first_offset`,
+    into (chunk, input position after its last record). Records before
+    `start` are skipped.
+    """
+    chunk: List[Tuple[int, Dict]] = []
+    position = 0
+
+    for offset, (record, position) in enumerate(records, first_offset):
+        if offset < start:
+            continue
+        chunk.append((offset, record))
+        if len(chunk) >= chunk_size:
+            yield chunk, position
+            chunk = []
+
+    if chunk:
+        yield chunk, position
+
+
+def _ordered_results(chunks, fields, workers: int, with_features: bool = False):
+    """
+    Yields (analyze_chunk() result, input position) per chunk, in input
+    order. At most workers * CHUNKS_PER_WORKER chunks are in flight, so
+    huge inputs are never read into memory ahead of the pool.
+    """
+    if workers <= 1:
+        for chunk, position in chunks:
+            yield analyze_chunk(chunk, fields, with_features), position
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        in_flight = deque()
+
+        for chunk, position in chunks:
+            future = executor.submit(analyze_chunk, chunk, fields, with_features)
+            in_flight.append((future, position))
+
+            if len(in_flight) >= workers * CHUNKS_PER_WORKER:
+                future, position = in_flight.popleft()
+                yield future.result(), position
+
+        while in_flight:
+            future, position = in_flight.popleft()
+            yield future.result(), position
+
+
+class _Progress:
+    def __init__(self, start_offset: int, stream=sys.stderr):
+        self.started = time.monotonic()
+        self.last_report = self.started
+        self.start_offset = start_offset
+        self.records = 0
+        self.errors = 0
+        self.stream = stream
+
+    def update(self, lines: List[str], errors: int):
+        self.records += len(lines)
+        self.errors += errors
+
+        now = time.monotonic()
+        if now - self.last_report >= PROGRESS_EVERY_SECONDS:
+            self.last_report = now
+            self.report()
+
+    def report(self, final: bool = False):
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        print(
+            f"[batch_analyze] {'done' if final else 'progress'}: "
+            f"{self.records} records ({self.errors} errors) in {elapsed:.1f}s, "
+            f"{self.records / elapsed:.1f} records/s, "
+            f"next offset {self.start_offset + self.records}",
+            file=self.stream,
+            flush=True,
+        )
+
+
+def run(
+    input_path: str,
+    output_path: str,
+    fmt: str = "auto",
+    workers: int = os.cpu_count() or 1,
+    chunk_size: int = CHUNK_SIZE,
+    resume: bool = False,
+    fields: Optional[Dict[str, str]] = None,
+    features_path: Optional[str] = None,
+) -> Dict:
+    """
+    Analyzes input_path into output_path (JSONL), plus columnar features
+    into features_path if given. Returns run statistics.
+    """
+    fields = fields or {"id": "id", "text": "job_text", "html": "html", "url": "job_url"}
+
+    if resume and features_path:
+        raise ValueError("--features cannot be combined with --resume")
+
+    feature_writer = FeatureWriter(features_path) if features_path else None
+
+    start, output_bytes, input_bytes = (
+        load_checkpoint(output_path) if resume else (0, 0, None)
+    )
+
+    if resume and os.path.exists(output_path):
+        out = open(output_path, "r+b")
+        out.truncate(output_bytes)  # drop lines written after the last checkpoint
+        out.seek(output_bytes)
+    else:
+        out = open(output_path, "wb")
+        start = output_bytes = 0
+        input_bytes = None
+
+    progress = _Progress(start)
+    offset = start
+
+    try:
+        if input_bytes is not None:
+            # seek past the processed records instead of re-reading them
+            records = read_positioned_records(input_path, fmt, input_bytes)
+            chunks = _chunks(records, start, chunk_size, first_offset=start)
+        else:
+            chunks = _chunks(read_positioned_records(input_path, fmt), start, chunk_size)
+
+        results = _ordered_results(chunks, fields, workers, feature_writer is not None)
+
+        for (lines, errors, features), input_bytes in results:
+            if feature_writer is not None:
+                feature_writer.write(features)
+
+            payload = ("\n".join(lines) + "\n").encode("utf-8")
+            out.write(payload)
+            out.flush()
+
+            offset += len(lines)
+            output_bytes += len(payload)
+            save_checkpoint(output_path, offset, output_bytes, input_bytes)
+
+            progress.update(lines, errors)
+    finally:
+        out.close()
+        if feature_writer is not None:
+            feature_writer.close()
+
+    progress.report(final=True)
+
+    return {"records": progress.records, "errors": progress.errors, "next_offset": offset}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Analyze a JSONL/CSV job corpus offline (no Flask)."
+    )
+    parser.add_argument("input", help="JSONL or CSV file of job records")
+    parser.add_argument("-o", "--output", required=True, help="results file (JSONL)")
+    parser.add_argument("--format", choices=("auto", "jsonl", "csv"), default="auto")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (1 = run in this process)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE,
+                        help="records per worker task")
+    parser.add_argument("--resume", action="store_true",
+                        help="continue from <output>.checkpoint")
+    parser.add_argument("--id-field", default="id")
+    parser.add_argument("--text-field", default="job_text")
+    parser.add_argument("--html-field", default="html")
+    parser.add_argument("--url-field", default="job_url")
+    parser.add_argument("--features", metavar="PATH",
+                        help="also write columnar features (.parquet or .npy)")
+
+    args = parser.parse_args(argv)
+
+    if args.resume and args.features:
+        parser.error("--features cannot be combined with --resume")
+
+    run(
+        args.input,
+        args.output,
+        fmt=args.format,
+        workers=args.workers,
+        chunk_size=max(1, args.chunk_size),
+        resume=args.resume,
+        fields={
+            "id": args.id_field,
+            "text": args.text_field,
+            "html": args.html_field,
+            "url": args.url_field,
+        },
+        features_path=args.features,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
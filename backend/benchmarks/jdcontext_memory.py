@@ -0,0 +1,141 @@
+"""
+Memory per parsed JDContext.
+
+Parses N synthetic postings and reports retained bytes per context for:
+- dict-based objects (the schema layout before slots, rebuilt on the fly)
+- slotted schema objects (current)
+- slotted objects after release_text_index()
+
+raw_text is allocated before measuring, so the numbers are pure context
+overhead on top of the text itself.
+
+Usage (from backend/):
+    python -m benchmarks.jdcontext_memory --count 20000
+"""
+
+import argparse
+import gc
+import random
+import tracemalloc
+from dataclasses import fields, is_dataclass
+
+from analyzer.parsing.jd_parser import parse_jd
+
+
+TEMPLATE = """{company}
+{title} ({employment})
+Location: {location}
+Salary: {salary}
+
+About the role
+We are looking for a {title} to join our {team} team. You will design, build
+and operate services used by thousands of customers every day.
+
+Responsibilities
+- Own features end to end, from design reviews to deployment
+- Work closely with product managers and designers
+- Participate in an on-call rotation
+
+Requirements
+- {years}+ years of experience with {skill_a} and {skill_b}
+- Strong communication skills
+
+Hiring process: recruiter call, technical interview, team interview, offer.
+Apply at careers@{domain}.com (ref {ref})
+"""
+
+
+def synthetic_postings(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    for i in range(count):
+        company = rng.choice(["Acme Robotics", "Northwind Labs", "Globex", "Initech", "Umbrella Health"])
+        yield TEMPLATE.format(
+            company=company,
+            title=rng.choice(["Backend Engineer", "Data Analyst", "QA Engineer", "Product Designer"]),
+            employment=rng.choice(["Full-time", "Contract", "Part-time", "Internship"]),
+            location=rng.choice(["Bangalore", "Remote", "Pune (Hybrid)", "Berlin", "New York"]),
+            salary=rng.choice(["INR 12-18 LPA", "$120,000 - $150,000 per year", "EUR 4,500 per month"]),
+            team=rng.choice(["payments", "platform", "growth", "search"]),
+            years=rng.randint(1, 9),
+            skill_a=rng.choice(["Python", "Java", "Go", "SQL"]),
+            skill_b=rng.choice(["AWS", "Kubernetes", "React", "Kafka"]),
+            domain=company.split()[0].lower(),
+            ref=i,
+        )
+
+
+_PLAIN_CLASSES = {}
+
+
+def _plain_class(cls):
+    plain_cls = _PLAIN_CLASSES.get(cls)
+    if plain_cls is None:
+        plain_cls = _PLAIN_CLASSES[cls] = type(cls.__name__, (), {})
+    return plain_cls
+
+
+def rebuild(obj, target):
+    """
+    Copies the schema objects of a context into instances of target(cls),
+    sharing every field value (strings, lists, floats) with the original.
+    """
+    if not is_dataclass(obj):
+        return obj
+
+    copy = object.__new__(target(type(obj)))
+    for f in fields(obj):
+        setattr(copy, f.name, rebuild(getattr(obj, f.name), target))
+    return copy
+
+
+def _traced_bytes() -> int:
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--count", type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    texts = list(synthetic_postings(args.count))
+    n = len(texts)
+
+    # one trace session: frees are only counted for traced allocations
+    tracemalloc.start()
+    base = _traced_bytes()
+
+    contexts = [parse_jd(t) for t in texts]
+    with_index = _traced_bytes() - base
+
+    for ctx in contexts:
+        ctx.release_text_index()
+    released = _traced_bytes() - base
+
+    # object shells only (field values shared with `contexts`)
+    mark = _traced_bytes()
+    slotted_copies = [rebuild(c, lambda cls: cls) for c in contexts]
+    slotted_shells = _traced_bytes() - mark
+
+    mark = _traced_bytes()
+    dict_copies = [rebuild(c, _plain_class) for c in contexts]
+    dict_shells = _traced_bytes() - mark
+
+    tracemalloc.stop()
+
+    values = released - slotted_shells
+
+    print(f"{n} contexts, avg raw_text {sum(map(len, texts)) / n:.0f} chars (not counted)")
+    print(f"  schema objects, __dict__ based  : {dict_shells / n:8.0f} B/context")
+    print(f"  schema objects, slotted         : {slotted_shells / n:8.0f} B/context")
+    print(f"  field values (lists, str, float): {values / n:8.0f} B/context")
+    print(f"  total before (dict + values)    : {(dict_shells + values) / n:8.0f} B/context")
+    print(f"  total now (slotted + values)    : {released / n:8.0f} B/context")
+    print(f"  ... with cached text index      : {with_index / n:8.0f} B/context "
+          f"(release_text_index() drops it)")
+
+    del slotted_copies, dict_copies
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+normalize_job_description: fused pipeline vs the original multi-pass one.
+
+reference_normalize() is the previous implementation, kept verbatim
+(a str.replace per unicode mapping, six uncompiled bullet re.sub calls,
+split/rejoin whitespace cleanup, eight re.match calls per line). The
+benchmark first checks that both produce byte-identical output on every
+generated page, then times them on pages of increasing size.
+
+Usage (from backend/):
+    python -m benchmarks.normalizer_speed --pages 200
+"""
+
+import argparse
+import random
+import re
+import html
+import time
+
+from analyzer.ingestion.normalizer import normalize_job_description
+
+
+# ---------------- Reference (previous implementation) ----------------
+def _reference_clean_unicode(text):
+    text = html.unescape(text)
+    replacements = {
+        "\u00A0": " ", "\u200B": "", "\u2013": "-", "\u2014": "-",
+        "\u2022": "-", "\u25CF": "-", "\u2212": "-",
+    }
+    for bad, good in replacements.items():
+        text = text.replace(bad, good)
+    return text
+
+
+def _reference_normalize_bullets(text):
+    for pat in [r"•\s*", r"▪\s*", r"‣\s*", r"►\s*", r"»\s*", r"-\s*•\s*"]:
+        text = re.sub(pat, "- ", text)
+    return text
+
+
+def _reference_collapse_whitespace(text):
+    text = text.replace("\r", "\n")
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = re.sub(r"[ \t]{2,}", " ", text)
+    text = "\n".join(line.strip() for line in text.split("\n"))
+    return text.strip()
+
+
+def _reference_remove_trash_lines(text):
+    trash_patterns = [
+        r"^\s*$", r"^cookies? policy", r"^privacy policy", r"^terms and conditions",
+        r"^advertisement", r"^subscribe", r"^sign up", r"^login",
+    ]
+    cleaned_lines = []
+    for line in text.split("\n"):
+        lower = line.strip().lower()
+        if any(re.match(p, lower) for p in trash_patterns):
+            continue
+        cleaned_lines.append(line)
+    return "\n".join(cleaned_lines).strip()
+
+
+def reference_normalize(text):
+    if not text:
+        return None
+    text = _reference_clean_unicode(text)
+    text = _reference_normalize_bullets(text)
+    text = _reference_collapse_whitespace(text)
+    text = _reference_remove_trash_lines(text)
+    if len(text) < 200:
+        return None
+    return text
+
+
+# ---------------- Synthetic pages ----------------
+# Body lines plus the junk the normalizer exists for: entities, odd unicode,
+# mixed bullets, \r\n, runs of spaces / tabs, blank lines, UI leftovers.
+LINES = [
+    "We are hiring a Senior Backend Engineer to join our payments team.",
+    "You will design, build and operate services used by millions of customers.",
+    "Salary: ₹18–₹24 LPA + ESOPs &amp; benefits",
+    "Experience: 5–8 years — Python, Go &amp; Kubernetes",
+    "• Own features end to end",
+    "● Work closely with product &amp; design",
+    "▪  Mentor junior engineers",
+    "‣\tParticipate in on-call",
+    "► Write clear design docs",
+    "» Ship to production weekly",
+    "- • Nested bullet from a rich-text editor",
+    "&raquo; Bullet that only appears after unescaping",
+    "Temperature − not a bullet, a minus sign",
+    "Zero​width​spaces inside words",
+    "   indented   line\twith \t mixed   whitespace   ",
+    "",
+    "   ",
+    "\t",
+    "Cookie Policy",
+    "COOKIES POLICY | Manage preferences",
+    "Privacy Policy",
+    "Terms and Conditions apply",
+    "Advertisement",
+    "Subscribe to our newsletter",
+    "Sign up for job alerts",
+    "Login to apply",
+    "Logins are handled by SSO (this line is dropped too)",
+    "Apply at careers@acme.com before 30 Nov",
+]
+
+NEWLINES = ["\n", "\n", "\n", "\r\n", "\r", "\n\n\n\n"]
+
+
+def synthetic_page(n_lines: int, rng: random.Random) -> str:
+    parts = []
+    for _ in range(n_lines):
+        parts.append(rng.choice(LINES))
+        parts.append(rng.choice(NEWLINES))
+    return "".join(parts)
+
+
+def random_text(length: int, rng: random.Random) -> str:
+    """Character soup over every symbol the normalizer handles."""
+    alphabet = "ab  \t\n\n\r&;" + "".join(sorted(set("".join(LINES)))) + "\u000b\u000c\u0085\u2028\u3000"
+    return "".join(rng.choice(alphabet) for _ in range(length))
+
+
+def _time(fn, pages, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for page in pages:
+            fn(page)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--pages", type=int, default=200, help="pages per size")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+    rng = random.Random(args.seed)
+
+    # byte-identical check: structured pages + random character soup
+    checked = 0
+    for n_lines in (5, 50, 500, 5000):
+        for _ in range(20):
+            for text in (synthetic_page(n_lines, rng), random_text(n_lines * 20, rng)):
+                if normalize_job_description(text) != reference_normalize(text):
+                    raise SystemExit(f"output mismatch on {len(text)} char input:\n{text!r}")
+                checked += 1
+    print(f"byte-identical output on {checked} inputs")
+
+    print(f"{'page (chars)':>12} {'reference':>12} {'fused':>12} {'speedup':>8}")
+    for n_lines in (20, 200, 2000, 20000):
+        pages = [synthetic_page(n_lines, rng) for _ in range(max(args.pages * 20 // n_lines, 3))]
+        avg_chars = sum(map(len, pages)) / len(pages)
+
+        before = _time(reference_normalize, pages, args.repeat) / len(pages)
+        after = _time(normalize_job_description, pages, args.repeat) / len(pages)
+
+        print(f"{avg_chars / 1000:>11.0f}k {before * 1000:>9.3f} ms {after * 1000:>9.3f} ms "
+              f"{before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
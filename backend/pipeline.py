@@ -0,0 +1,578 @@
+"""
+pipeline.py
+
+Request pipeline shared by the Flask app (app.py) and the ASGI service
+(asgi.py): payload → JD text → JDContext → analysis, plus the caches and
+indexes it runs against.
+
+Fetching is the only step that differs between the two: resolve_jd_text()
+fetches inline (blocking), the ASGI service awaits the fetch and hands
+the page to fetched_jd_text().
+"""
+
+import copy
+import logging
+import os
+import threading
+from typing import List, Optional, Tuple
+
+from analyzer.analysis_engine import run_all_rules, run_all_rules_batch, RULESET_VERSION
+from analyzer.result_cache import ResultCache, content_key
+from analyzer.near_duplicate_index import NearDuplicateIndex
+from analyzer.ingestion.url_fetcher import canonicalize_url, fetch_url_content
+from analyzer.ingestion.bulk_fetcher import fetch_urls
+from analyzer.ingestion.http_cache import HttpCache
+from analyzer.ingestion.politeness import PolitenessScheduler
+from analyzer.ingestion.jd_extractor import extract_job_description
+from analyzer.ingestion.normalizer import normalize_job_description, normalize_whitespace
+from analyzer.parsing.jd_parser import parse_jd
+from analyzer.utils.debug_capture import DebugCapture
+from analyzer.utils.logging import get_logger, log_event
+from analyzer.utils.singleflight import SingleFlight
+from analyzer.utils.tracing import Trace, incr, span
+from analyzer.utils.metrics import CACHE_LOOKUPS, COALESCED_REQUESTS, REQUEST_LATENCY, REQUESTS
+
+
+# ===== CORS config =====
+ALLOWED_ORIGINS = ["http://localhost:3000", "http://127.0.0.1:3000"]
+# =======================
+
+# ===== Debug capture config =====
+# Off unless GHOSTHIRE_DEBUG_CAPTURE=1: captures hold raw pasted JD text
+DEBUG_CAPTURE_ENABLED = os.environ.get("GHOSTHIRE_DEBUG_CAPTURE", "").lower() in ("1", "true", "yes")
+DEBUG_CAPTURE_CAPACITY = 50
+DEBUG_CAPTURE_SAMPLE_RATE = 0.0    # share of captures also written to DEBUG_CAPTURE_DIR
+DEBUG_CAPTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "debug", "captures")
+# =================================
+
+debug_capture = DebugCapture(
+    enabled=DEBUG_CAPTURE_ENABLED,
+    capacity=DEBUG_CAPTURE_CAPACITY,
+    sample_rate=DEBUG_CAPTURE_SAMPLE_RATE,
+    dump_dir=DEBUG_CAPTURE_DIR,
+)
+
+# ===== Batch analysis config =====
+MAX_BATCH_SIZE = 500
+# =================================
+
+# ===== Observability config =====
+LOG_REQUEST_TIMINGS = True     # one structured log line per analyze request
+# ================================
+
+api_logger = get_logger("api")
+
+# ===== Rule execution config =====
+PARALLEL_RULES = False         # True: run rules on the shared executor (per-rule budget)
+RULE_TIMEOUT_SECONDS = 2.0     # slower rules are skipped (see "skipped_rules")
+ANALYSIS_TIMEOUT_SECONDS = 5.0 # all rules of one analysis, queue wait included
+# =================================
+
+# ===== Storage config =====
+# Directory of the persistent caches / indexes below (":memory:" keeps
+# them all in memory, e.g. for tests). Anchored to this file, not the cwd.
+CACHE_DIR = os.environ.get("GHOSTHIRE_CACHE_DIR") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "cache"
+)
+# ==========================
+
+# ===== Fetched page cache config =====
+ENABLE_HTTP_CACHE = True
+HTTP_CACHE_FILE = "http_cache.sqlite"
+HTTP_CACHE_TTL_SECONDS = 15 * 60
+HTTP_CACHE_MAX_BYTES = 256 * 1024 * 1024
+# =====================================
+
+# ===== Batch crawl politeness config =====
+# robots.txt + adaptive per-host rates for /analyze/batch URL items
+# (analyzer/ingestion/politeness.py); state survives restarts.
+ENABLE_POLITENESS = True
+POLITENESS_FILE = "politeness.sqlite"
+# ==========================================
+
+# ===== Analysis result cache config =====
+ENABLE_RESULT_CACHE = True
+RESULT_CACHE_MAX_ENTRIES = 5000
+RESULT_CACHE_SQLITE_FILE = None   # e.g. "results.sqlite" to share across workers
+# ========================================
+
+# ===== Cross-posting index config =====
+# Intentionally stateful: every analyzed text is added, so copy_paste_jd
+# scores reflect what this deployment has seen. A text is only matched
+# against postings first seen before it, so its score never changes
+# afterwards and result-cache entries stay valid.
+ENABLE_NEAR_DUPLICATE_INDEX = True
+NEAR_DUPLICATE_INDEX_FILE = "near_duplicates.sqlite"
+# ======================================
+
+# ===== Request coalescing config =====
+ENABLE_SINGLE_FLIGHT = True    # identical concurrent /analyze requests share one analysis
+# =====================================
+
+analysis_flights = SingleFlight() if ENABLE_SINGLE_FLIGHT else None
+
+
+# ---------------- Stores ----------------
+# Opened on first use (not at import), so importing the pipeline never
+# touches the disk and tests can point CACHE_DIR elsewhere first.
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def _cache_path(filename: str) -> str:
+    if CACHE_DIR == ":memory:":
+        return ":memory:"
+    return os.path.join(CACHE_DIR, filename)
+
+
+def _store(name: str, factory):
+    if name not in _stores:
+        with _stores_lock:
+            if name not in _stores:
+                _stores[name] = factory()
+    return _stores[name]
+
+
+def get_http_cache() -> Optional[HttpCache]:
+    if not ENABLE_HTTP_CACHE:
+        return None
+    return _store("http_cache", lambda: HttpCache(
+        _cache_path(HTTP_CACHE_FILE),
+        ttl=HTTP_CACHE_TTL_SECONDS,
+        max_bytes=HTTP_CACHE_MAX_BYTES,
+    ))
+
+
+def get_politeness_scheduler() -> Optional[PolitenessScheduler]:
+    if not ENABLE_POLITENESS:
+        return None
+    return _store("politeness", lambda: PolitenessScheduler(_cache_path(POLITENESS_FILE)))
+
+
+def get_result_cache() -> Optional[ResultCache]:
+    if not ENABLE_RESULT_CACHE:
+        return None
+    return _store("result_cache", lambda: ResultCache(
+        RULESET_VERSION,
+        max_entries=RESULT_CACHE_MAX_ENTRIES,
+        sqlite_path=_cache_path(RESULT_CACHE_SQLITE_FILE) if RESULT_CACHE_SQLITE_FILE else None,
+    ))
+
+
+def get_near_duplicate_index() -> Optional[NearDuplicateIndex]:
+    if not ENABLE_NEAR_DUPLICATE_INDEX:
+        return None
+    return _store("near_duplicate_index", lambda: NearDuplicateIndex(
+        _cache_path(NEAR_DUPLICATE_INDEX_FILE)
+    ))
+
+
+def reset_stores():
+    """Closes and forgets every opened store (next use reopens them)."""
+    with _stores_lock:
+        stores = list(_stores.values())
+        _stores.clear()
+
+    for store in stores:
+        close = getattr(store, "close", None)
+        if close is not None:
+            close()
+
+
+def payload_fields(data: dict) -> Tuple[str, str]:
+    """(job_text, job_url) of one request payload, stripped."""
+    return (data.get("job_text") or "").strip(), (data.get("job_url") or "").strip()
+
+
+def resolve_jd_text(data: dict):
+    """
+    Turns one request payload (job_text or job_url) into the JD text that
+    will be parsed.
+
+    Returns:
+        (raw_jd_text, from_url, None)      -> ready for parsing
+        (None, False, (error_body, status)) -> request cannot be analyzed
+    """
+
+    job_text, job_url = payload_fields(data)
+
+    # -------- Case 1: JD pasted directly --------
+    if job_text:
+        # layout-only differences must not change the result or its cache key
+        raw_jd_text = normalize_whitespace(job_text)
+
+        debug_capture.capture(raw_jd_text, source="text")
+
+        return raw_jd_text, False, None
+
+    # -------- Case 2: JD fetched via URL --------
+    if job_url:
+        try:
+            with span("stage.fetch"):
+                fetch_result = fetch_url_content(job_url, cache=get_http_cache())
+
+            return fetched_jd_text(job_url, fetch_result)
+
+        except Exception as e:
+            return None, False, ({
+                "error": str(e)
+            }, 400)
+
+    # -------- Case 3: Invalid input --------
+    return None, False, ({
+        "error": "Either job_text or job_url is required"
+    }, 400)
+
+
+def fetched_jd_text(job_url: str, fetch_result: dict):
+    """
+    Extract + normalize step for a fetched page (same return shape as
+    resolve_jd_text).
+    """
+    if not fetch_result.get("success"):
+        return None, False, ({
+            "error": "Failed to fetch job page",
+            "reason": fetch_result.get("reason"),
+            "status_code": fetch_result.get("status_code")
+        }, 400)
+
+    html = fetch_result.get("html") or ""
+
+    with span("stage.extract"):
+        extracted_text = extract_job_description(html, url=job_url)
+    with span("stage.normalize"):
+        normalized_text = normalize_job_description(extracted_text)
+
+    if not normalized_text:
+        return None, False, ({
+            "error": "Unable to extract job description from the provided URL"
+        }, 400)
+
+    raw_jd_text = normalized_text
+
+    debug_capture.capture(raw_jd_text, source="url", url=job_url)
+
+    return raw_jd_text, True, None
+
+
+def _check_near_duplicates(jd_context):
+    """
+    Looks the posting up in (and adds it to) the cross-posting index.
+    Index problems never fail the request; the rule just sees no signal.
+    """
+    near_duplicate_index = get_near_duplicate_index()
+
+    if near_duplicate_index is None:
+        return
+
+    try:
+        with span("stage.near_duplicates"):
+            jd_context.near_duplicates = near_duplicate_index.check(
+                jd_context.raw_text, jd_context.company.name
+            )
+    except Exception:
+        incr("near_duplicates.errors")
+        log_event(api_logger, "near_duplicate_index_error", level=logging.WARNING, exc_info=True)
+
+
+def parse_jd_text(raw_jd_text: str, from_url: bool):
+    """
+    Returns:
+        (jd_context, None)            -> ready for analysis
+        (None, (error_body, status))  -> text could not be parsed
+    """
+
+    if not from_url:
+        with span("stage.parse"):
+            jd_context = parse_jd(raw_jd_text)
+
+        if jd_context is None:
+            return None, ({
+                "error": "Failed to parse job description"
+            }, 400)
+
+        _check_near_duplicates(jd_context)
+        return jd_context, None
+
+    try:
+        with span("stage.parse"):
+            jd_context = parse_jd(raw_jd_text)
+    except Exception as e:
+        return None, ({
+            "error": str(e)
+        }, 400)
+
+    if jd_context is None:
+        return None, ({
+            "error": "Failed to parse extracted job description"
+        }, 400)
+
+    _check_near_duplicates(jd_context)
+    return jd_context, None
+
+
+def flight_key(data: dict) -> Optional[Tuple[str, str]]:
+    """
+    (source, key) identifying the analysis a payload asks for: the
+    canonical URL for job_url (tracking params / portal variants folded,
+    see canonicalize_url), a content hash for pasted job_text.
+    None for payloads that cannot be analyzed.
+    """
+    job_text, job_url = payload_fields(data)
+
+    if job_text:
+        return "text", "text:" + content_key(normalize_whitespace(job_text), RULESET_VERSION)
+
+    if job_url:
+        try:
+            return "url", "url:" + canonicalize_url(job_url).url
+        except ValueError:
+            return None   # e.g. bad port; the normal path reports it
+
+    return None
+
+
+def record_coalesced(endpoint: str, source: str):
+    COALESCED_REQUESTS.inc(endpoint=endpoint, source=source)
+    incr("singleflight.coalesced")
+
+
+def traced_body(event: str, trace: Trace, body: dict, status: int, wants_timings: bool) -> dict:
+    """
+    Records request metrics, logs one structured line per request and, if
+    asked for, attaches the trace as a "timings" block.
+    """
+    timings = trace.as_dict()
+
+    REQUESTS.inc(endpoint=event, status=str(status))
+    REQUEST_LATENCY.observe(timings["total_ms"] / 1000, endpoint=event)
+
+    if LOG_REQUEST_TIMINGS:
+        log_event(api_logger, event, status=status, **timings)
+
+    if wants_timings:
+        body = dict(body, timings=timings)
+
+    return body
+
+
+def analyze_payload(data: dict):
+    """
+    Returns (response body, status) for one /analyze payload.
+
+    Concurrent requests for the same URL / text wait on one shared
+    analysis (see analysis_flights).
+    """
+    key = flight_key(data) if analysis_flights is not None else None
+
+    if key is None:
+        return _analyze_payload(data)
+
+    source, key = key
+    (body, status), shared = analysis_flights.do(key, lambda: _analyze_payload(data))
+
+    if shared:
+        record_coalesced("analyze", source)
+        # same contract as result cache hits: callers get their own copy
+        body = copy.deepcopy(body)
+
+    return body, status
+
+
+def _analyze_payload(data: dict):
+    raw_jd_text, from_url, error = resolve_jd_text(data)
+
+    if error:
+        return error
+
+    return analyze_jd_text(raw_jd_text, from_url)
+
+
+def analyze_jd_text(raw_jd_text: str, from_url: bool):
+    """
+    Result cache → parse → rules for resolved JD text; (body, status).
+    """
+
+    result_cache = get_result_cache()
+
+    # Same JD text + same rules → same result; skip parsing entirely
+    if result_cache is not None:
+        with span("stage.result_cache"):
+            cached = result_cache.get(raw_jd_text)
+        CACHE_LOOKUPS.inc(cache="result", outcome="miss" if cached is None else "hit")
+        if cached is not None:
+            incr("result_cache.hit")
+            return cached, 200
+
+    jd_context, error = parse_jd_text(raw_jd_text, from_url)
+
+    if error:
+        return error
+
+    analysis = run_all_rules(
+        jd_context, parallel=PARALLEL_RULES, rule_timeout=RULE_TIMEOUT_SECONDS,
+        analysis_timeout=ANALYSIS_TIMEOUT_SECONDS,
+    )
+
+    # A timed-out rule makes the result partial → don't memoize it
+    if result_cache is not None and not analysis.get("skipped_rules"):
+        result_cache.put(raw_jd_text, analysis)
+
+    return analysis, 200
+
+
+def batch_items(data: dict):
+    """
+    Returns:
+        (items, None)                    -> valid /analyze/batch payload
+        (None, (error_body, status))     -> rejected as a whole
+    """
+    items = data.get("items")
+
+    if not isinstance(items, list) or not items:
+        return None, ({
+            "error": "items must be a non-empty list of {job_text | job_url} objects"
+        }, 400)
+
+    if len(items) > MAX_BATCH_SIZE:
+        return None, ({
+            "error": f"Batch too large (max {MAX_BATCH_SIZE} items)"
+        }, 400)
+
+    return items, None
+
+
+def resolve_batch_item(item):
+    """resolve_jd_text() for one batch item; never raises."""
+    if not isinstance(item, dict):
+        return None, False, ({
+            "error": "Each item must be an object with job_text or job_url"
+        }, 400)
+
+    try:
+        return resolve_jd_text(item)
+    except Exception as e:
+        return None, False, ({"error": str(e)}, 400)
+
+
+def resolve_batch_items(items: list) -> List[tuple]:
+    """
+    resolve_batch_item() for every item. URL items are fetched together
+    through bulk_fetcher.fetch_urls (bounded concurrency, robots.txt and
+    adaptive per-host rates, one fetch per distinct URL) instead of one
+    after another.
+    """
+    resolved = [None] * len(items)
+    # job_url -> item positions asking for it
+    url_slots = {}
+
+    for i, item in enumerate(items):
+        if isinstance(item, dict):
+            job_text, job_url = payload_fields(item)
+            if job_url and not job_text:
+                url_slots.setdefault(job_url, []).append(i)
+                continue
+
+        resolved[i] = resolve_batch_item(item)
+
+    if url_slots:
+        urls = list(url_slots)
+
+        with span("stage.fetch"):
+            fetched = list(fetch_urls(
+                urls, cache=get_http_cache(), scheduler=get_politeness_scheduler()
+            ))
+
+        for fetch_result in fetched:
+            job_url = urls[fetch_result["index"]]
+            item = _fetched_batch_item(job_url, fetch_result)
+            for i in url_slots[job_url]:
+                resolved[i] = item
+
+    return resolved
+
+
+def _fetched_batch_item(job_url: str, fetch_result: dict):
+    """fetched_jd_text() for one bulk fetch result; never raises."""
+    reason = fetch_result.get("reason") or ""
+
+    # fetch_url_content() raised → same error body as resolve_jd_text()
+    for prefix in ("invalid_url: ", "fetch_error: "):
+        if reason.startswith(prefix):
+            return None, False, ({"error": reason[len(prefix):]}, 400)
+
+    try:
+        return fetched_jd_text(job_url, fetch_result)
+    except Exception as e:
+        return None, False, ({"error": str(e)}, 400)
+
+
+def analyze_batch_payload(data: dict):
+    """
+    Returns (response body, status) for one /analyze/batch payload.
+    """
+    items, error = batch_items(data)
+
+    if error:
+        return error
+
+    return analyze_resolved_batch(resolve_batch_items(items))
+
+
+def analyze_resolved_batch(resolved: List[tuple]):
+    """
+    Parse + rules for already resolved batch items (one resolve_jd_text()
+    triple per item); (body, status).
+    """
+    result_cache = get_result_cache()
+    results = [None] * len(resolved)
+    contexts = []
+    context_texts = []
+    # JD text -> result slots waiting on it (duplicates are analyzed once)
+    pending_slots = {}
+
+    for i, (raw_jd_text, from_url, error) in enumerate(resolved):
+        try:
+            if not error:
+                if raw_jd_text in pending_slots:
+                    pending_slots[raw_jd_text].append(i)
+                    continue
+
+                if result_cache is not None:
+                    with span("stage.result_cache"):
+                        cached = result_cache.get(raw_jd_text)
+                    CACHE_LOOKUPS.inc(
+                        cache="result", outcome="miss" if cached is None else "hit"
+                    )
+                    if cached is not None:
+                        incr("result_cache.hit")
+                        results[i] = cached
+                        continue
+
+                jd_context, error = parse_jd_text(raw_jd_text, from_url)
+        except Exception as e:
+            results[i] = {"error": str(e), "status": 400}
+            continue
+
+        if error:
+            body, status = error
+            results[i] = dict(body, status=status)
+            continue
+
+        contexts.append(jd_context)
+        context_texts.append(raw_jd_text)
+        pending_slots[raw_jd_text] = [i]
+
+    analyses = run_all_rules_batch(
+        contexts, parallel=PARALLEL_RULES, rule_timeout=RULE_TIMEOUT_SECONDS,
+        analysis_timeout=ANALYSIS_TIMEOUT_SECONDS,
+    )
+
+    for raw_jd_text, analysis in zip(context_texts, analyses):
+        if result_cache is not None and not analysis.get("skipped_rules"):
+            result_cache.put(raw_jd_text, analysis)
+
+        for i in pending_slots[raw_jd_text]:
+            results[i] = analysis
+
+    return {"results": results}, 200
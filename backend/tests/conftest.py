@@ -0,0 +1,71 @@
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+
+
+JOB_PAGE = (
+    b"<html><head><title>Backend Engineer</title></head><body>"
+    + b"<p>We are hiring a backend engineer to build reliable APIs.</p>" * 10
+    + b"</body></html>"
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # HTTP/1.1 so connections stay open between requests (keep-alive)
+    protocol_version = "HTTP/1.1"
+    routes = {}
+
+    def do_GET(self):
+        route = self.routes.get(
+            self.path, (200, {"Content-Type": "text/html; charset=utf-8"}, JOB_PAGE)
+        )
+        if callable(route):
+            route = route(self)
+        status, headers, body = route
+        if callable(body):
+            body = body(self)
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def isolated_stores(monkeypatch):
+    """
+    Keeps the pipeline's caches / indexes in memory and fresh per test,
+    so runs never write backend/cache or see each other's state.
+    """
+    import pipeline
+
+    monkeypatch.setattr(pipeline, "CACHE_DIR", ":memory:")
+    pipeline.reset_stores()
+    yield
+    pipeline.reset_stores()
+
+
+@pytest.fixture
+def job_server():
+    """
+    Local keep-alive HTTP server; yields (base_url, routes dict).
+    routes maps path -> (status, headers, body bytes or callable(handler)),
+    or to callable(handler) returning that tuple.
+    """
+    routes = {}
+    handler = type("Handler", (_Handler,), {"routes": routes})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+
+    yield f"http://127.0.0.1:{server.server_address[1]}", routes
+
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from analyzer.ingestion.async_fetcher import AsyncFetcher
+from analyzer.ingestion.http_cache import HttpCache
+from analyzer.ingestion.url_fetcher import SessionPool, fetch_url_content
+from tests.conftest import JOB_PAGE
+
+
+def _fetch_all(urls, **kwargs):
+    async def main():
+        async with AsyncFetcher() as fetcher:
+            return await asyncio.gather(*(fetcher.fetch(url, **kwargs) for url in urls))
+    return asyncio.run(main())
+
+
+def test_results_match_sync_fetcher(job_server):
+    base_url, routes = job_server
+    wall = b"<html><body>Please verify you are human to continue.</body></html>" * 5
+    latin = ("<html><head><meta charset='iso-8859-1'></head><body>"
+             + "<p>Café développeur recherché.</p>" * 20 + "</body></html>")
+    routes["/gone"] = (404, {"Content-Type": "text/html"}, b"not found")
+    routes["/json"] = (200, {"Content-Type": "application/json"}, b"{}")
+    routes["/tiny"] = (200, {"Content-Type": "text/html"}, b"<p>hi</p>")
+    routes["/big"] = (200, {"Content-Type": "text/html"}, JOB_PAGE * 2000)
+    routes["/wall"] = (200, {"Content-Type": "text/html"}, wall + JOB_PAGE * 2000)
+    routes["/latin"] = (200, {"Content-Type": "text/html"}, latin.encode("iso-8859-1"))
+
+    urls = [f"{base_url}{path}" for path in
+            ("/job/1", "/gone", "/json", "/tiny", "/big", "/wall", "/latin")]
+
+    results = _fetch_all(urls, max_bytes=100_000)
+
+    for url, result in zip(urls, results):
+        assert result == fetch_url_content(url, session_pool=SessionPool(), max_bytes=100_000)
+
+
+def test_retries_then_serves_from_cache(job_server):
+    base_url, routes = job_server
+    attempts = []
+
+    def flaky(handler):
+        attempts.append(1)
+        if len(attempts) < 3:
+            return 503, {"Content-Type": "text/html", "Retry-After": "0"}, b"busy"
+        return 200, {"Content-Type": "text/html", "ETag": '"v1"'}, JOB_PAGE
+
+    routes["/flaky"] = flaky
+    cache = HttpCache(":memory:")
+
+    first, second = [_fetch_all([f"{base_url}/flaky"], cache=cache)[0] for _ in range(2)]
+
+    assert first["success"] and first["cache"] == "miss"
+    assert len(attempts) == 3
+    assert second["cache"] == "hit" and second["html"] == first["html"]
@@ -0,0 +1,63 @@
+import threading
+import time
+
+from analyzer.ingestion.bulk_fetcher import fetch_urls
+from analyzer.ingestion.url_fetcher import SessionPool
+from tests.conftest import JOB_PAGE
+
+
+def test_yields_every_url_once_with_invalid_ones_reported(job_server):
+    base_url, _ = job_server
+    urls = [f"{base_url}/job/{i}" for i in range(5)] + ["ftp://example.com/job", ""]
+
+    results = list(fetch_urls(urls, session_pool=SessionPool(), per_domain_rate=None))
+
+    assert sorted(r["index"] for r in results) == list(range(7))
+    by_index = {r["index"]: r for r in results}
+    assert all(by_index[i]["success"] for i in range(5))
+    assert by_index[5]["reason"].startswith("invalid_url")
+    assert by_index[6]["reason"].startswith("invalid_url")
+
+
+def test_per_domain_concurrency_limit(job_server):
+    base_url, routes = job_server
+    lock = threading.Lock()
+    seen = {"current": 0, "max": 0}
+
+    def slow_page(handler):
+        with lock:
+            seen["current"] += 1
+            seen["max"] = max(seen["max"], seen["current"])
+        time.sleep(0.05)
+        with lock:
+            seen["current"] -= 1
+        return JOB_PAGE
+
+    routes["/slow"] = (200, {"Content-Type": "text/html"}, slow_page)
+
+    results = list(fetch_urls(
+        [f"{base_url}/slow"] * 8,
+        max_workers=8,
+        per_domain_concurrency=2,
+        per_domain_rate=None,
+        session_pool=SessionPool(),
+    ))
+
+    assert len(results) == 8
+    assert seen["max"] <= 2
+
+
+def test_per_domain_rate_limit(job_server):
+    base_url, _ = job_server
+
+    start = time.monotonic()
+    results = list(fetch_urls(
+        [f"{base_url}/job/{i}" for i in range(4)],
+        per_domain_concurrency=4,
+        per_domain_rate=20,
+        session_pool=SessionPool(),
+    ))
+
+    assert len(results) == 4
+    # 4 starts at 20/s → at least 3 intervals of 50ms
+    assert time.monotonic() - start >= 0.15
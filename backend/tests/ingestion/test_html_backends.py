@@ -0,0 +1,39 @@
+import os
+
+import pytest
+
+from analyzer.ingestion.html_backends import REFERENCE_BACKEND, parse_html
+from analyzer.ingestion.jd_extractor import extract_job_description
+
+
+CORPUS_DIR = os.path.join(os.path.dirname(__file__), "html_corpus")
+CORPUS = sorted(f for f in os.listdir(CORPUS_DIR) if f.endswith(".html"))
+
+
+def _page(name):
+    with open(os.path.join(CORPUS_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+@pytest.mark.parametrize("name", CORPUS)
+def test_reference_backend_extracts_corpus(name):
+    text = extract_job_description(_page(name), backend=REFERENCE_BACKEND)
+
+    assert text is not None
+    # noise filtering removed banners / hidden blocks
+    assert "cookies" not in text
+    assert "hidden tracking text" not in text
+
+
+@pytest.mark.parametrize("name", CORPUS)
+def test_lxml_backend_matches_reference(name):
+    pytest.importorskip("lxml")
+    html = _page(name)
+
+    assert extract_job_description(html, backend="lxml") == \
+        extract_job_description(html, backend=REFERENCE_BACKEND)
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        parse_html("<html></html>", backend="no-such-parser")
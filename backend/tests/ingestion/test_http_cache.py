@@ -0,0 +1,70 @@
+from analyzer.ingestion.http_cache import HttpCache
+from analyzer.ingestion.url_fetcher import SessionPool, fetch_url_content
+from tests.conftest import JOB_PAGE
+
+
+def _counting_route(calls, etag='"v1"'):
+    def route(handler):
+        calls.append(dict(handler.headers))
+        if handler.headers.get("If-None-Match") == etag:
+            return 304, {"ETag": etag}, b""
+        return 200, {"Content-Type": "text/html", "ETag": etag}, JOB_PAGE
+    return route
+
+
+def test_fresh_entry_is_served_without_request(job_server):
+    base_url, routes = job_server
+    calls = []
+    routes["/job"] = _counting_route(calls)
+    cache = HttpCache(":memory:", ttl=60)
+    pool = SessionPool()
+
+    first = fetch_url_content(f"{base_url}/job", session_pool=pool, cache=cache)
+    second = fetch_url_content(f"{base_url}/job#apply", session_pool=pool, cache=cache)
+
+    assert first["cache"] == "miss"
+    assert second["cache"] == "hit"
+    assert second["html"] == first["html"]
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_stale_entry_is_revalidated_with_etag(job_server):
+    base_url, routes = job_server
+    calls = []
+    routes["/job"] = _counting_route(calls)
+    cache = HttpCache(":memory:", ttl=0)
+    pool = SessionPool()
+
+    fetch_url_content(f"{base_url}/job", session_pool=pool, cache=cache)
+    result = fetch_url_content(f"{base_url}/job", session_pool=pool, cache=cache)
+
+    assert result["success"]
+    assert result["cache"] == "revalidated"
+    assert result["html"] == JOB_PAGE.decode()
+    assert calls[1].get("If-None-Match") == '"v1"'
+
+
+def test_lru_eviction_keeps_under_size_cap():
+    cache = HttpCache(":memory:", max_bytes=2500)
+    page = "x" * 1000
+
+    cache.put("https://example.com/a", page)
+    cache.put("https://example.com/b", page)
+    cache.get("https://example.com/a")  # a is now most recently used
+    cache.put("https://example.com/c", page)
+
+    assert cache.get("https://example.com/a") is not None
+    assert cache.get("https://example.com/b") is None
+    assert cache.get("https://example.com/c") is not None
+    assert cache.stats()["bytes"] <= 2500
+
+
+def test_equivalent_urls_share_one_entry():
+    cache = HttpCache(":memory:")
+    cache.put("HTTPS://Example.COM:443/jobs?b=2&a=1&utm_source=x#top", "<html></html>")
+
+    assert cache.get("https://example.com/jobs?b=2&a=1") is not None
+    # parameter order is kept, so a reordered query is a different page
+    assert cache.get("https://example.com/jobs?a=1&b=2") is None
+    assert cache.stats()["entries"] == 1
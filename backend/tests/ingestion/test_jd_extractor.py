@@ -0,0 +1,77 @@
+from bs4 import BeautifulSoup
+
+from analyzer.ingestion.jd_extractor import (
+    _detect_source,
+    _text_stats,
+    extract_job_description,
+)
+
+
+PARAGRAPH = "<p>We are hiring a backend engineer to design, build and operate reliable APIs.</p>"
+
+
+def _soup(html):
+    return BeautifulSoup(html, "html.parser")
+
+
+def test_source_comes_from_url_meta_or_markers():
+    page = _soup("<html><body><div>Share this job on LinkedIn</div></body></html>")
+
+    # page text alone no longer decides the portal
+    assert _detect_source(page) == "generic"
+    assert _detect_source(page, "https://in.indeed.com/viewjob?jk=1") == "indeed"
+
+    meta = _soup('<html><head><meta property="og:site_name" content="Naukri.com"></head></html>')
+    assert _detect_source(meta) == "naukri"
+
+    marked = _soup('<html><body><div id="jobDescriptionText">...</div></body></html>')
+    assert _detect_source(marked) == "indeed"
+
+
+def test_source_hosts_match_on_whole_labels():
+    page = _soup("<html><body></body></html>")
+
+    assert _detect_source(page, "https://in.linkedin.com/jobs/view/1") == "linkedin"
+    assert _detect_source(page, "https://notlinkedin.com/jobs/view/1") == "generic"
+    assert _detect_source(page, "https://linkedin.evil.io/jobs/view/1") == "generic"
+
+    for content, source in (("LinkedIn", "linkedin"), ("@indeed", "indeed"),
+                            ("https://linkedin.evil.io/x", "generic")):
+        meta = _soup(f'<html><head><meta property="og:site_name" content="{content}"></head></html>')
+        assert _detect_source(meta) == source, content
+
+
+def test_text_stats_match_get_text():
+    html = (
+        "<html><body><div> <section>Intro <b>bold</b><!-- hidden --> tail</section>"
+        "<div><p>  </p><p>one</p>two<br/> three </div></div></body></html>"
+    )
+    soup = _soup(html)
+    stats = _text_stats(soup.body)
+
+    for tag in soup.body.find_all(True):
+        text = tag.get_text(" ", strip=True)
+        length, _, spaced = stats.get(id(tag), (0, 0, False))
+        assert length == len(text)
+        assert spaced == (" " in text)
+
+
+def test_fallback_picks_largest_block_on_nested_page():
+    nested = "<div><section>" + PARAGRAPH * 2
+    html = "<html><body>" + nested * 50 + "</section></div>" * 50 + "</body></html>"
+
+    text = extract_job_description(html)
+
+    assert text is not None
+    assert text.count("backend engineer") == 100
+
+
+def test_portal_url_uses_portal_selectors():
+    html = (
+        "<html><body><div class='sidebar'>" + PARAGRAPH * 20 + "</div>"
+        "<div id='jobDescriptionText'>" + PARAGRAPH * 4 + "</div></body></html>"
+    )
+
+    text = extract_job_description(html, url="https://www.indeed.com/viewjob?jk=1")
+
+    assert text.count("backend engineer") == 4
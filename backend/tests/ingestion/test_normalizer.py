@@ -0,0 +1,48 @@
+import random
+
+from analyzer.ingestion.normalizer import normalize_job_description, normalize_whitespace
+from benchmarks.normalizer_speed import random_text, reference_normalize, synthetic_page
+
+
+FILLER = "We build payment infrastructure used by thousands of merchants every day. " * 3
+
+
+def test_cleans_unicode_bullets_whitespace_and_trash_lines():
+    text = (
+        "Cookie Policy\r\n"
+        "Senior Engineer &amp; Mentor – Remote\r\n\r\n\r\n\r\n"
+        "• Python\u200b\n"
+        "▪   Go\tand\t\t Rust\n"
+        "&raquo;\n   Kubernetes   \n"
+        "LOGIN to apply\n"
+        + FILLER
+    )
+
+    assert normalize_job_description(text) == (
+        "Senior Engineer & Mentor - Remote\n"
+        "- Python\n"
+        "- Go\tand Rust\n"
+        "- Kubernetes\n"
+        + FILLER.strip()
+    )
+    assert normalize_job_description("Too short • posting") is None
+
+
+def test_output_identical_to_multi_pass_reference():
+    rng = random.Random(11)
+    for _ in range(300):
+        for text in (synthetic_page(rng.randint(1, 80), rng), random_text(rng.randint(0, 1500), rng)):
+            assert normalize_job_description(text) == reference_normalize(text)
+
+
+def test_whitespace_form_matches_fetched_text_form():
+    assert normalize_whitespace("  Backend\tEngineer \r\n\r\n  Python  and Go\rRemote  ") == (
+        "Backend\tEngineer\nPython and Go\nRemote"
+    )
+
+    # fetched pages are already in this form
+    rng = random.Random(7)
+    for _ in range(100):
+        text = normalize_job_description(synthetic_page(rng.randint(1, 40), rng))
+        if text is not None:
+            assert normalize_whitespace(text) == text
@@ -0,0 +1,192 @@
+import time
+
+from analyzer.ingestion.bulk_fetcher import fetch_urls
+from analyzer.ingestion.politeness import (
+    BASE_COOLDOWN_SECONDS,
+    DEFAULT_RATE,
+    ROBOTS_USER_AGENT,
+    PolitenessScheduler,
+)
+from analyzer.ingestion.url_fetcher import SessionPool
+
+
+ROBOTS_TXT = b"User-agent: *\nDisallow: /private\nRequest-rate: 10/1\n"
+
+
+def _serve_robots(routes, body=ROBOTS_TXT, agents=None):
+    fetches = []
+
+    def robots(handler):
+        fetches.append(handler.path)
+        if agents is not None:
+            agents.append(handler.headers.get("User-Agent"))
+        return body
+
+    routes["/robots.txt"] = (200, {"Content-Type": "text/plain"}, robots)
+    return fetches
+
+
+def test_bulk_fetch_honours_robots_txt(job_server):
+    base_url, routes = job_server
+    fetches = _serve_robots(routes)
+    pool = SessionPool()
+    scheduler = PolitenessScheduler(default_rate=50, session_pool=pool)
+
+    start = time.monotonic()
+    results = list(fetch_urls(
+        [f"{base_url}/job/{i}" for i in range(3)] + [f"{base_url}/private/1"],
+        per_domain_concurrency=4,
+        session_pool=pool,
+        scheduler=scheduler,
+    ))
+
+    by_index = {r["index"]: r for r in results}
+    assert all(by_index[i]["success"] for i in range(3))
+    assert by_index[3]["reason"] == "blocked_by_robots_txt"
+    assert len(fetches) == 1
+    # Request-rate 10/s → 3 starts need at least 2 intervals of 100ms
+    assert time.monotonic() - start >= 0.2
+
+
+def test_robots_txt_cached_on_disk(job_server, tmp_path):
+    base_url, routes = job_server
+    fetches = _serve_robots(routes)
+    path = str(tmp_path / "politeness.sqlite3")
+
+    scheduler = PolitenessScheduler(path, default_rate=50, session_pool=SessionPool())
+    scheduler.load_robots(f"{base_url}/job/1")
+    scheduler.close()
+
+    reopened = PolitenessScheduler(path, default_rate=50, session_pool=SessionPool())
+    assert reopened.robots_ready(f"{base_url}/job/2")
+    assert not reopened.allowed(f"{base_url}/private/1")
+    assert reopened.host_stats(base_url)["ceiling"] == 10
+    assert len(fetches) == 1
+
+
+def test_throttling_backs_off_and_persists(tmp_path):
+    now = [1000.0]
+    path = str(tmp_path / "politeness.sqlite3")
+    url = "https://jobs.example.com/job/1"
+
+    scheduler = PolitenessScheduler(path, clock=lambda: now[0])
+    assert scheduler.reserve(url) == 0
+
+    scheduler.record(url, {"success": False, "status_code": 429, "reason": "http_error_429"})
+    scheduler.record(url, {"success": False, "status_code": 200,
+                           "reason": "blocked_by_site_captcha"})
+
+    stats = scheduler.host_stats(url)
+    assert stats["rate"] == DEFAULT_RATE / 4
+    assert stats["strikes"] == 2
+    assert stats["cooldown_seconds"] == 2 * BASE_COOLDOWN_SECONDS
+    assert scheduler.reserve(url) == 2 * BASE_COOLDOWN_SECONDS
+    scheduler.close()
+
+    # a restarted crawl keeps the slower rate and the cooldown
+    now[0] += 10
+    reopened = PolitenessScheduler(path, clock=lambda: now[0])
+    stats = reopened.host_stats(url)
+    assert stats["rate"] == DEFAULT_RATE / 4
+    assert stats["cooldown_seconds"] == 2 * BASE_COOLDOWN_SECONDS - 10
+
+    now[0] += 2 * BASE_COOLDOWN_SECONDS
+    assert reopened.reserve(url) == 0
+    reopened.record(url, {"success": True, "status_code": 200, "reason": None})
+    stats = reopened.host_stats(url)
+    assert stats["strikes"] == 0
+    assert DEFAULT_RATE / 4 < stats["rate"] <= DEFAULT_RATE
+
+
+def test_host_aliases_share_canonical_politeness_state(monkeypatch):
+    import analyzer.ingestion.bulk_fetcher as bulk_fetcher
+
+    scheduler = PolitenessScheduler(default_rate=50)
+    robots_urls, recorded, fetched = [], [], []
+
+    def fetch_robots(robots_url):
+        robots_urls.append(robots_url)
+        return 200, "User-agent: *\nDisallow: /jobs/view/3899999999/\n"
+
+    def fetch(url, **kwargs):
+        fetched.append(url)
+        return {"success": True, "status_code": 200, "html": "<html></html>", "reason": None,
+                "truncated": False, "cache": "miss", "canonical_url": None, "job_id": None}
+
+    record = scheduler.record
+    monkeypatch.setattr(scheduler, "_fetch_robots", fetch_robots)
+    monkeypatch.setattr(scheduler, "record",
+                        lambda url, result: (recorded.append(url), record(url, result)))
+    monkeypatch.setattr(bulk_fetcher, "fetch_url_content", fetch)
+
+    results = list(fetch_urls(
+        [
+            "https://in.linkedin.com/jobs/view/backend-engineer-at-acme-3812345678",
+            "https://www.linkedin.com/jobs/view/3812345678/?trk=x",
+            # only the canonical path matches the Disallow rule
+            "https://in.linkedin.com/jobs/view/data-engineer-at-acme-3899999999",
+        ],
+        scheduler=scheduler,
+    ))
+
+    by_index = {r["index"]: r for r in results}
+    assert by_index[0]["success"] and by_index[1]["success"]
+    assert by_index[0]["url"].startswith("https://in.linkedin.com/")
+    assert by_index[2]["reason"] == "blocked_by_robots_txt"
+    assert robots_urls == ["https://www.linkedin.com/robots.txt"]
+    assert recorded == ["https://www.linkedin.com/jobs/view/3812345678/"] * 2
+    assert len(fetched) == 2
+
+
+def test_throttling_reaches_the_scheduler_unretried(job_server):
+    base_url, routes = job_server
+    agents, hits = [], []
+    _serve_robots(routes, agents=agents)
+
+    def busy(handler):
+        hits.append(handler.path)
+        return 429, {"Content-Type": "text/html", "Retry-After": "30"}, b"slow down"
+
+    routes["/job/1"] = busy
+    scheduler = PolitenessScheduler(default_rate=50)
+
+    start = time.monotonic()
+    [result] = fetch_urls([f"{base_url}/job/1"], scheduler=scheduler)
+
+    # no urllib3 retries / Retry-After sleep: the first 429 is a strike
+    assert time.monotonic() - start < 5
+    assert result["status_code"] == 429
+    assert hits == ["/job/1"]
+    assert scheduler.host_stats(base_url)["strikes"] == 1
+    # robots.txt is requested as the agent its rules are read for
+    assert agents == [ROBOTS_USER_AGENT]
+    scheduler.close()
+
+
+def test_failed_robots_load_is_logged_and_counted(monkeypatch):
+    import analyzer.ingestion.bulk_fetcher as bulk_fetcher
+    from analyzer.utils.tracing import start_trace
+
+    scheduler = PolitenessScheduler(default_rate=50)
+
+    def broken_load(url):
+        raise RuntimeError("robots store unavailable")
+
+    monkeypatch.setattr(scheduler, "load_robots", broken_load)
+    monkeypatch.setattr(bulk_fetcher, "fetch_url_content", lambda url, **kwargs: {
+        "success": True, "status_code": 200, "html": "<html></html>", "reason": None,
+        "truncated": False, "cache": "miss", "canonical_url": url, "job_id": None,
+    })
+    events = []
+    monkeypatch.setattr(bulk_fetcher, "log_event",
+                        lambda logger, event, **fields: events.append((event, fields)))
+
+    with start_trace() as trace:
+        [result] = fetch_urls(["https://jobs.example.com/job/1"], scheduler=scheduler)
+
+    assert result["success"]
+    assert trace.as_dict()["counters"] == {"robots_errors": 1}
+    [(event, fields)] = events
+    assert event == "robots_load_error"
+    assert fields["host"] == "jobs.example.com"
+    assert isinstance(fields["exc_info"], RuntimeError)
@@ -0,0 +1,57 @@
+import json
+import re
+
+import pytest
+
+from analyzer.insights.skill_extractor import extract_skills
+from analyzer.insights.skill_matcher import SkillMatcher, SkillTaxonomy, load_taxonomy
+
+
+def reference_skills(text, skills):
+    """The original per-alias scan: `f" {alias} " in normalized text`."""
+    normalized = re.sub(r"[^a-z0-9+#/ ]", " ", text.lower())
+    normalized = " " + re.sub(r"\s+", " ", normalized) + " "
+    return sorted(
+        skill for skill, aliases in skills.items()
+        if any(f" {alias} " in normalized for alias in aliases)
+    )
+
+
+def test_matches_reference_scan_on_bundled_taxonomy():
+    skills = load_taxonomy().skills
+    texts = [
+        "Senior Python/Django engineer. Spring Boot, Node.js and C++ a plus.",
+        "Experience with Amazon Web Services (AWS), Google Cloud and k8s.",
+        "CI/CD pipelines, continuous integration, C# or C sharp, REST-ful APIs.",
+        "Golang; go; GO-lang; postgres/mysql; mongo\tredis\nkafka",
+        "no skills here at all",
+    ]
+
+    for text in texts:
+        assert extract_skills(text)["skills_found"] == reference_skills(text, skills)
+
+
+def test_positions_and_counts_include_overlapping_aliases():
+    matcher = SkillMatcher(SkillTaxonomy(
+        "test",
+        {"spring": ["spring"], "spring boot": ["spring boot"], "aws": ["aws", "amazon web services"]},
+        {},
+    ))
+    text = "Spring Boot on Amazon  Web Services; spring, AWS."
+
+    result = matcher.scan(text)
+
+    assert result.counts() == {"spring": 2, "spring boot": 1, "aws": 2}
+    assert result.positions("spring boot") == [(0, 11)]
+    assert [text[s:e] for s, e in result.positions("aws")] == ["Amazon  Web Services", "AWS"]
+
+
+def test_load_taxonomy_rejects_duplicate_skills(tmp_path):
+    path = tmp_path / "taxonomy.json"
+    path.write_text(json.dumps({
+        "version": "1",
+        "skills": [{"name": "python"}, {"name": "Python", "aliases": ["py"]}],
+    }))
+
+    with pytest.raises(ValueError):
+        load_taxonomy(str(path))
@@ -0,0 +1,64 @@
+import re
+
+from analyzer.parsing.keyword_matcher import KeywordMatcher
+
+
+def make_matcher():
+    matcher = KeywordMatcher()
+    matcher.register("strong", ["join immediately", "apply now", "no interview"], word_boundary=True)
+    matcher.register("mild", ["immediately", "asap", "urgent"], word_boundary=True)
+    matcher.register("substring", ["hum", "no interview required"])
+    return matcher
+
+
+def test_counts_match_per_pattern_findall():
+    matcher = make_matcher()
+    text = "urgent!! join immediately, apply now. immediately asap, urgently. no interview required"
+
+    hits = matcher.scan(text)
+
+    for category in ("strong", "mild"):
+        expected = sum(
+            len(re.findall(r"\b" + re.escape(p) + r"\b", text))
+            for p in matcher.phrases(category)
+        )
+        assert hits.count(category) == expected
+
+
+def test_overlapping_and_prefix_phrases_are_all_counted():
+    hits = make_matcher().scan("join immediately and no interview required")
+
+    # "immediately" sits inside "join immediately"
+    assert hits.counts("strong") == {"join immediately": 1, "no interview": 1}
+    assert hits.counts("mild") == {"immediately": 1}
+    # "no interview" is a prefix of "no interview required"
+    assert hits.matched("substring") == ["no interview required"]
+
+
+def test_word_boundary_vs_substring():
+    hits = make_matcher().scan("human resources, urgently")
+
+    assert hits.matched("substring") == ["hum"]
+    assert not hits.any("mild")
+
+
+def test_scan_joined_matches_concatenated_scan():
+    matcher = make_matcher()
+    head, body = "apply", "now! urgent hiring, join immediately"
+
+    joined = matcher.scan_joined(head, body, matcher.scan(body))
+    direct = matcher.scan(head + " " + body)
+
+    for category in ("strong", "mild", "substring"):
+        assert joined.counts(category) == direct.counts(category)
+
+
+def test_registering_later_bumps_version():
+    matcher = make_matcher()
+    first = matcher.scan("limited slots")
+
+    matcher.register("late", ["limited slots"], word_boundary=True)
+    second = matcher.scan("limited slots")
+
+    assert first.version != second.version
+    assert second.count("late") == 1
@@ -0,0 +1,29 @@
+from analyzer.parsing.jd_parser import parse_jd
+from analyzer.parsing.schema import JDContext
+
+
+JD = """Acme Robotics
+Senior Backend Engineer (Full-time)
+Location: Bangalore
+We are looking for an engineer with 5+ years of Python experience.
+Hiring process: recruiter call, technical interview, offer.
+"""
+
+
+def test_contexts_are_slotted_and_share_raw_text():
+    jd_context = parse_jd(JD)
+
+    for obj in (jd_context, jd_context.company, jd_context.job, jd_context.salary):
+        assert not hasattr(obj, "__dict__")
+
+    assert jd_context.raw_text is jd_context.text_index.text
+
+
+def test_release_text_index_rebuilds_on_next_access():
+    jd_context = JDContext(raw_text=JD)
+    lower = jd_context.text_index.lower
+
+    jd_context.release_text_index()
+
+    assert jd_context._text_index is None
+    assert jd_context.text_index.lower == lower
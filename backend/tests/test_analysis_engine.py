@@ -0,0 +1,209 @@
+from analyzer.analysis_engine import run_all_rules, run_all_rules_batch
+from tests.rules.test_utils import make_context
+
+
+def test_batch_matches_single_results_in_order():
+    contexts = [
+        make_context(text="Urgent hiring! Apply now, no interview. Contact jobs@gmail.com"),
+        make_context(text="We are hiring a backend engineer with 4 years of Python experience."),
+        make_context(text="Earn unlimited, easy money, guaranteed job!!!"),
+    ]
+
+    batch = run_all_rules_batch(contexts)
+
+    assert batch == [run_all_rules(ctx) for ctx in contexts]
+
+
+def test_batch_keeps_position_of_invalid_entries():
+    contexts = [make_context(text="Senior data analyst role"), "not a context", None]
+
+    batch = run_all_rules_batch(contexts)
+
+    assert len(batch) == 3
+    assert batch[0] == run_all_rules(contexts[0])
+    assert batch[1]["rule_score"] == 0.0
+    assert "JDContext required" in batch[1]["reasons"][0]
+    assert batch[2] == batch[1]
+
+
+def test_empty_batch():
+    assert run_all_rules_batch([]) == []
+
+
+def test_parallel_batch_runs_postings_together(monkeypatch):
+    import time
+    from analyzer import analysis_engine
+
+    def slow_rule(jd_context):
+        time.sleep(0.1)
+        return {"score": 0.1, "reason": jd_context.raw_text}
+
+    contexts = [make_context(text=f"Backend engineer {n}") for n in range(5)] + [None]
+
+    sequential = run_all_rules_batch(contexts)
+    for result in sequential[:5]:
+        result["skipped_rules"] = []
+
+    assert run_all_rules_batch(contexts, parallel=True) == sequential
+
+    # one submission for the whole batch: 5 postings x 2 slow rules overlap
+    monkeypatch.setattr(analysis_engine, "RULES", [slow_rule, slow_rule])
+    start = time.monotonic()
+    batch = run_all_rules_batch(contexts, parallel=True)
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.35
+    assert [r["reasons"] for r in batch[:5]] == [[f"Backend engineer {n}"] * 2 for n in range(5)]
+    assert "JDContext required" in batch[5]["reasons"][0]
+
+
+def test_parallel_mode_matches_sequential():
+    ctx = make_context(text="Urgent hiring! Pay registration fee. Contact jobs@gmail.com on WhatsApp")
+
+    parallel = run_all_rules(ctx, parallel=True)
+
+    assert parallel.pop("skipped_rules") == []
+    assert parallel == run_all_rules(ctx)
+
+
+def test_slow_rule_is_skipped_and_reported(monkeypatch):
+    import time
+    from analyzer import analysis_engine
+
+    def fast_rule(jd_context):
+        return {"score": 0.3, "reason": "fast"}
+
+    def slow_rule(jd_context):
+        time.sleep(1.0)
+        return {"score": 0.5, "reason": "slow"}
+
+    def late_rule(jd_context):
+        return {"score": 0.2, "reason": "late"}
+
+    monkeypatch.setattr(analysis_engine, "RULES", [fast_rule, slow_rule, late_rule])
+
+    start = time.monotonic()
+    result = run_all_rules(make_context(text="Backend engineer"), parallel=True, rule_timeout=0.1)
+
+    assert time.monotonic() - start < 0.5
+    assert result["reasons"] == ["fast", "late"]
+    assert result["rule_score"] == 0.5
+    assert result["skipped_rules"] == ["slow_rule"]
+
+
+def test_trace_records_rule_spans_and_swallowed_errors(monkeypatch):
+    from analyzer import analysis_engine
+    from analyzer.utils.tracing import start_trace
+
+    def ok_rule(jd_context):
+        return {"score": 0.1, "reason": None}
+
+    def broken_rule(jd_context):
+        raise ValueError("boom")
+
+    monkeypatch.setattr(analysis_engine, "RULES", [ok_rule, broken_rule])
+
+    for parallel in (False, True):
+        with start_trace() as trace:
+            run_all_rules(make_context(text="Backend engineer"), parallel=parallel)
+
+        timings = trace.as_dict()
+        assert "rule.ok_rule" in timings["spans"]
+        assert "rule.broken_rule" in timings["spans"]
+        assert "stage.rules" in timings["spans"]
+        assert timings["counters"] == {"rule_errors.broken_rule": 1}
+
+
+def test_rule_budget_starts_when_the_rule_runs(monkeypatch):
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+    from analyzer import analysis_engine
+
+    def slow_rule(jd_context):
+        time.sleep(0.08)
+        return {"score": 0.1, "reason": None}
+
+    # one worker: each rule waits in the queue behind the previous ones
+    executor = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(analysis_engine, "_rule_executor", executor)
+    monkeypatch.setattr(analysis_engine, "RULES", [slow_rule] * 3)
+
+    result = run_all_rules(make_context(text="Backend engineer"), parallel=True, rule_timeout=0.15)
+    executor.shutdown()
+
+    assert result["skipped_rules"] == []
+    assert result["rule_score"] == 0.3
+
+
+def test_analysis_deadline_covers_queue_time(monkeypatch):
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+    from analyzer import analysis_engine
+
+    calls = []
+
+    def slow_rule(jd_context):
+        calls.append(time.monotonic())
+        time.sleep(0.1)
+        return {"score": 0.1, "reason": None}
+
+    # one worker: the third rule is still queued when the analysis budget runs out
+    executor = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(analysis_engine, "_rule_executor", executor)
+    monkeypatch.setattr(analysis_engine, "RULES", [slow_rule] * 3)
+
+    start = time.monotonic()
+    result = run_all_rules(make_context(text="Backend engineer"), parallel=True,
+                           rule_timeout=1.0, analysis_timeout=0.15)
+    elapsed = time.monotonic() - start
+    executor.shutdown()
+
+    assert elapsed < 0.3
+    assert result["skipped_rules"] == ["slow_rule", "slow_rule"]
+    assert result["rule_score"] == 0.1
+    # the queued rule was dropped, not run after the analysis gave up
+    assert len(calls) == 2
+
+
+def test_saturated_pool_skips_rules(monkeypatch):
+    import threading
+    import time
+    from analyzer import analysis_engine
+
+    release = threading.Event()
+    calls = []
+
+    def stuck_rule(jd_context):
+        release.wait(5)
+        return {"score": 0.5, "reason": "stuck"}
+
+    def fast_rule(jd_context):
+        calls.append(1)
+        return {"score": 0.2, "reason": "fast"}
+
+    # leftovers of earlier tests may still be running
+    before = analysis_engine.rule_stragglers()
+    monkeypatch.setattr(analysis_engine, "MAX_RULE_STRAGGLERS", before + 2)
+    ctx = make_context(text="Backend engineer")
+
+    try:
+        monkeypatch.setattr(analysis_engine, "RULES", [stuck_rule, stuck_rule])
+        first = run_all_rules(ctx, parallel=True, rule_timeout=0.05)
+        assert first["skipped_rules"] == ["stuck_rule", "stuck_rule"]
+        assert analysis_engine.rule_stragglers() == before + 2
+
+        # pool held by leftovers → nothing is submitted or run, all reported as timeouts
+        monkeypatch.setattr(analysis_engine, "RULES", [fast_rule, fast_rule])
+        start = time.monotonic()
+        second = run_all_rules(ctx, parallel=True, rule_timeout=0.05)
+        assert time.monotonic() - start < 0.05
+        assert second["skipped_rules"] == ["fast_rule", "fast_rule"]
+        assert second["rule_score"] == 0.0
+        assert calls == []
+    finally:
+        release.set()
+
+    deadline = time.monotonic() + 2
+    while analysis_engine.rule_stragglers() > before and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert analysis_engine.rule_stragglers() <= before
@@ -0,0 +1,84 @@
+import pytest
+
+import pipeline
+from app import app
+
+
+JD = (
+    "Senior Backend Engineer, full-time, remote. 5+ years of Python and AWS. "
+    "Salary INR 20-30 LPA. Interview: recruiter call, technical round, offer. "
+) * 3
+
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+
+def test_batch_rejects_empty_list(client):
+    response = client.post("/analyze/batch", json={"items": []})
+
+    assert response.status_code == 400
+    assert "non-empty list" in response.get_json()["error"]
+
+
+def test_batch_rejects_oversized_batch(client):
+    items = [{"job_text": JD}] * (pipeline.MAX_BATCH_SIZE + 1)
+
+    response = client.post("/analyze/batch", json={"items": items})
+
+    assert response.status_code == 400
+    assert "too large" in response.get_json()["error"]
+
+
+def test_batch_mixes_text_and_url_items(client, job_server):
+    base_url, routes = job_server
+    fetches = []
+
+    def page(handler):
+        fetches.append(handler.path)
+        return 200, {"Content-Type": "text/html"}, f"<html><body><p>{JD}</p></body></html>".encode()
+
+    routes["/job/1"] = page
+
+    response = client.post("/analyze/batch", json={"items": [
+        {"job_text": JD},
+        {"job_url": f"{base_url}/job/1"},
+        {"job_url": "ftp://example.com/job"},
+        {"job_url": f"{base_url}/job/1"},
+        "not an object",
+    ]})
+
+    assert response.status_code == 200
+    text_result, url_result, bad_url, repeated_url, not_object = response.get_json()["results"]
+
+    assert "rule_score" in text_result
+    assert "rule_score" in url_result
+    assert repeated_url == url_result
+    assert len(fetches) == 1
+    assert bad_url == {"error": "Only http/https URLs are allowed", "status": 400}
+    assert not_object["status"] == 400
+
+
+def test_batch_url_items_honour_robots_txt(client, job_server):
+    base_url, routes = job_server
+    fetches = []
+
+    def page(handler):
+        fetches.append(handler.path)
+        return 200, {"Content-Type": "text/html"}, f"<html><body><p>{JD}</p></body></html>".encode()
+
+    routes["/robots.txt"] = (200, {"Content-Type": "text/plain"}, b"User-agent: *\nDisallow: /private\n")
+    routes["/private/1"] = page
+
+    response = client.post("/analyze/batch", json={"items": [{"job_url": f"{base_url}/private/1"}]})
+
+    [result] = response.get_json()["results"]
+    assert result["reason"] == "blocked_by_robots_txt"
+    assert fetches == []
+
+
+def test_debug_captures_route_is_off_by_default(client):
+    assert not pipeline.debug_capture.enabled
+    assert "/debug/captures" not in {rule.rule for rule in app.url_map.iter_rules()}
+    assert client.get("/debug/captures").status_code == 404
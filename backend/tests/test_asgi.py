@@ -0,0 +1,180 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+import asgi
+import pipeline
+from analyzer.analysis_engine import run_all_rules
+from analyzer.parsing.jd_parser import parse_jd
+from analyzer.utils.metrics import COALESCED_REQUESTS
+
+
+JD = (
+    "Senior Backend Engineer, full-time, remote. 5+ years of Python and AWS. "
+    "Salary INR 20-30 LPA. Interview: recruiter call, technical round, offer. "
+) * 3
+
+
+@pytest.fixture(autouse=True)
+def _isolated_pipeline(monkeypatch):
+    monkeypatch.setattr(pipeline, "ENABLE_HTTP_CACHE", False)
+    monkeypatch.setattr(pipeline, "ENABLE_RESULT_CACHE", False)
+    monkeypatch.setattr(pipeline, "ENABLE_NEAR_DUPLICATE_INDEX", False)
+
+
+async def _call(method, path, body=None, query=b"", headers=()):
+    scope = {
+        "type": "http", "method": method, "path": path,
+        "query_string": query, "headers": list(headers),
+    }
+    request = {"type": "http.request", "body": json.dumps(body).encode() if body else b""}
+    messages = []
+
+    async def receive():
+        return request
+
+    async def send(message):
+        messages.append(message)
+
+    await asgi.app(scope, receive, send)
+
+    start, content = messages
+    response_headers = dict(start["headers"])
+    if response_headers[b"content-type"] == asgi.JSON_CONTENT_TYPE and content["body"]:
+        return start["status"], json.loads(content["body"]), response_headers
+    return start["status"], content["body"], response_headers
+
+
+def _run(coro):
+    async def main():
+        try:
+            return await coro
+        finally:
+            await asgi._fetch_state.stop()
+    return asyncio.run(main())
+
+
+def test_analyze_text_matches_sync_pipeline():
+    status, body, _ = _run(_call("POST", "/analyze", {"job_text": JD}, query=b"timings=1"))
+
+    assert status == 200
+    timings = body.pop("timings")
+    expected = run_all_rules(parse_jd(JD.strip()), parallel=pipeline.PARALLEL_RULES)
+    assert body == json.loads(json.dumps(expected))
+    assert "stage.parse" in timings["spans"]
+
+    assert _run(_call("POST", "/analyze", {}))[:2] == (
+        400, {"error": "Either job_text or job_url is required"}
+    )
+    assert _run(_call("GET", "/analyze"))[0] == 405
+    assert _run(_call("GET", "/nope"))[0] == 404
+
+
+def test_batch_and_cors_preflight():
+    items = [{"job_text": JD}, "oops", {"job_text": JD}]
+    status, body, _ = _run(_call("POST", "/analyze/batch", {"items": items}))
+
+    assert status == 200
+    first, bad, duplicate = body["results"]
+    assert first == duplicate and "rule_score" in first
+    assert bad["status"] == 400
+
+    status, _, headers = _run(_call(
+        "OPTIONS", "/analyze", headers=[(b"origin", b"http://localhost:3000")]
+    ))
+    assert status == 200
+    assert headers[b"access-control-allow-origin"] == b"http://localhost:3000"
+    assert headers[b"access-control-allow-methods"] == asgi.ALLOWED_METHODS
+
+
+def test_url_analyses_wait_on_the_network_concurrently(job_server):
+    pytest.importorskip("httpx")
+    base_url, routes = job_server
+
+    page = b"<html><body><main>" + b"<p>" + JD.encode() + b"</p>" + b"</main></body></html>"
+
+    def slow(handler):
+        time.sleep(0.3)
+        return 200, {"Content-Type": "text/html; charset=utf-8"}, page
+
+    n = 100
+    for i in range(n):
+        routes[f"/job/{i}"] = slow
+    routes["/gone"] = (404, {"Content-Type": "text/html"}, b"not found")
+
+    async def many():
+        calls = [_call("POST", "/analyze", {"job_url": f"{base_url}/job/{i}"}) for i in range(n)]
+        calls.append(_call("POST", "/analyze", {"job_url": f"{base_url}/gone"}))
+        return await asyncio.gather(*calls)
+
+    start = time.perf_counter()
+    responses = _run(many())
+    elapsed = time.perf_counter() - start
+
+    assert [status for status, _, _ in responses[:n]] == [200] * n
+    assert responses[n][:2] == (400, {
+        "error": "Failed to fetch job page", "reason": "http_error_404", "status_code": 404
+    })
+    # 100 blocking fetches would take 30 s back to back
+    assert elapsed < 10
+
+
+def test_identical_concurrent_urls_share_one_fetch(job_server):
+    pytest.importorskip("httpx")
+    base_url, routes = job_server
+    hits = []
+
+    def viral(handler):
+        hits.append(1)
+        time.sleep(0.3)
+        return 200, {"Content-Type": "text/html"}, b"<html><body><p>" + JD.encode() + b"</p></body></html>"
+
+    routes["/viral"] = viral
+    before = COALESCED_REQUESTS.value(endpoint="analyze", source="url")
+
+    async def burst():
+        # the fragment / default port differ, the canonical URL does not
+        urls = [f"{base_url}/viral", f"{base_url}/viral#apply"] * 10
+        return await asyncio.gather(*(
+            _call("POST", "/analyze", {"job_url": url}, query=b"timings=1") for url in urls
+        ))
+
+    responses = _run(burst())
+
+    assert len(hits) == 1
+    assert all(status == 200 for status, _, _ in responses)
+    assert COALESCED_REQUESTS.value(endpoint="analyze", source="url") - before == 19
+    counters = [body["timings"]["counters"] for _, body, _ in responses]
+    assert sum(c.get("singleflight.coalesced", 0) for c in counters) == 19
+
+
+def test_batch_fetches_each_url_once_within_host_limits(job_server):
+    pytest.importorskip("httpx")
+    base_url, routes = job_server
+    hits, active, peak = [], [0], [0]
+
+    def page(handler):
+        hits.append(handler.path)
+        active[0] += 1
+        peak[0] = max(peak[0], active[0])
+        time.sleep(0.2)
+        active[0] -= 1
+        return 200, {"Content-Type": "text/html"}, b"<html><body><p>" + JD.encode() + b"</p></body></html>"
+
+    for i in range(3):
+        routes[f"/job/{i}"] = page
+
+    # every posting three times: as given, with a fragment, with a tracking param
+    items = [
+        {"job_url": url}
+        for i in range(3)
+        for url in (f"{base_url}/job/{i}", f"{base_url}/job/{i}#apply", f"{base_url}/job/{i}?utm_source=x")
+    ]
+    status, body, _ = _run(_call("POST", "/analyze/batch", {"items": items}))
+
+    assert status == 200
+    assert all("rule_score" in result for result in body["results"])
+    assert sorted(hits) == ["/job/0", "/job/1", "/job/2"]
+    assert peak[0] <= asgi.PER_HOST_CONCURRENCY
@@ -0,0 +1,122 @@
+import csv
+import json
+
+import batch_analyze
+from analyzer.analysis_engine import run_all_rules
+from analyzer.parsing.jd_parser import parse_jd
+from batch_analyze import run, save_checkpoint
+
+
+TEXTS = [
+    "Urgent hiring! Pay registration fee on WhatsApp. Earn 50000 weekly, no interview.",
+    "We are hiring a Senior Backend Engineer with 5+ years of Python experience.",
+    "Remote data analyst role at Northwind. Interview: recruiter call then technical round.",
+]
+
+
+def _write_corpus(path, n):
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(n):
+            f.write(json.dumps({"id": i, "job_text": TEXTS[i % len(TEXTS)]}) + "\n")
+        f.write("{broken json\n")
+
+
+def _read(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_results_match_pipeline_in_input_order(tmp_path):
+    corpus, output = tmp_path / "corpus.jsonl", tmp_path / "out.jsonl"
+    _write_corpus(corpus, 25)
+
+    stats = run(str(corpus), str(output), workers=2, chunk_size=4)
+
+    results = _read(output)
+    assert stats == {"records": 26, "errors": 1, "next_offset": 26}
+    assert [r["offset"] for r in results] == list(range(26))
+
+    for r in results[:25]:
+        expected = run_all_rules(parse_jd(TEXTS[r["id"] % len(TEXTS)]))
+        assert {k: r[k] for k in expected} == expected
+
+    assert results[25]["error"].startswith("invalid_json")
+
+
+def test_resume_continues_after_checkpoint(tmp_path):
+    corpus = tmp_path / "corpus.jsonl"
+    full, partial = tmp_path / "full.jsonl", tmp_path / "partial.jsonl"
+    _write_corpus(corpus, 12)
+
+    run(str(corpus), str(full), workers=1, chunk_size=5)
+
+    # crash after the first chunk: checkpoint at 5 records, half-written tail
+    with open(full, "rb") as f:
+        lines = f.readlines()
+    head = b"".join(lines[:5])
+    with open(partial, "wb") as f:
+        f.write(head + lines[5][:10])
+    save_checkpoint(str(partial), 5, len(head))
+
+    stats = run(str(corpus), str(partial), workers=1, chunk_size=5, resume=True)
+
+    assert stats["records"] == 8
+    assert partial.read_bytes() == full.read_bytes()
+
+
+def _first_checkpoint(monkeypatch, corpus, output, chunk_size):
+    """Runs the corpus fully, returning the checkpoint saved after chunk 1."""
+    saved = []
+    real_save = batch_analyze.save_checkpoint
+
+    def recording_save(*args):
+        saved.append(args[1:])
+        real_save(*args)
+
+    monkeypatch.setattr(batch_analyze, "save_checkpoint", recording_save)
+    run(str(corpus), str(output), workers=1, chunk_size=chunk_size)
+    monkeypatch.undo()
+    return saved[0]
+
+
+def test_resume_seeks_past_processed_input(tmp_path, monkeypatch):
+    corpus, seeked = tmp_path / "corpus.jsonl", tmp_path / "seeked.jsonl"
+    full, partial = tmp_path / "full.jsonl", tmp_path / "partial.jsonl"
+    _write_corpus(corpus, 12)
+
+    offset, output_bytes, input_bytes = _first_checkpoint(monkeypatch, corpus, full, 5)
+    assert offset == 5
+
+    # the processed part is never read again: replace it with junk
+    data = corpus.read_bytes()
+    seeked.write_bytes(b"x" * (input_bytes - 1) + b"\n" + data[input_bytes:])
+
+    partial.write_bytes(full.read_bytes()[:output_bytes])
+    save_checkpoint(str(partial), offset, output_bytes, input_bytes)
+
+    stats = run(str(seeked), str(partial), workers=1, chunk_size=5, resume=True)
+
+    assert stats["records"] == 8
+    assert partial.read_bytes() == full.read_bytes()
+
+
+def test_csv_resume_with_multiline_fields(tmp_path, monkeypatch):
+    corpus = tmp_path / "corpus.csv"
+    full, partial = tmp_path / "full.jsonl", tmp_path / "partial.jsonl"
+
+    with open(corpus, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "job_text"])
+        for i in range(7):
+            writer.writerow([i, TEXTS[i % len(TEXTS)].replace(". ", ".\n")])
+
+    offset, output_bytes, input_bytes = _first_checkpoint(monkeypatch, corpus, full, 3)
+
+    partial.write_bytes(full.read_bytes()[:output_bytes])
+    save_checkpoint(str(partial), offset, output_bytes, input_bytes)
+
+    stats = run(str(corpus), str(partial), workers=1, chunk_size=3, resume=True)
+
+    assert stats["records"] == 4
+    assert [r["id"] for r in _read(partial)] == [str(i) for i in range(7)]
+    assert partial.read_bytes() == full.read_bytes()
@@ -0,0 +1,37 @@
+import os
+
+from analyzer.utils.debug_capture import DebugCapture
+
+
+def test_ring_buffer_keeps_newest_captures():
+    capture = DebugCapture(enabled=True, capacity=3)
+
+    for i in range(5):
+        capture.capture(f"jd {i}", source="text")
+
+    recent = capture.recent()
+    assert [c["text"] for c in recent] == ["jd 4", "jd 3", "jd 2"]
+    assert [c["text"] for c in capture.recent(1)] == ["jd 4"]
+
+
+def test_disabled_capture_records_nothing(tmp_path):
+    capture = DebugCapture(enabled=False, sample_rate=1.0, dump_dir=str(tmp_path))
+
+    capture.capture("jd", source="text")
+
+    assert capture.recent() == []
+    assert os.listdir(tmp_path) == []
+
+
+def test_sampled_captures_are_written_in_background(tmp_path):
+    dump_dir = tmp_path / "captures"
+    capture = DebugCapture(enabled=True, sample_rate=1.0, dump_dir=str(dump_dir))
+
+    capture.capture("first jd", source="text")
+    capture.capture("second jd", source="url", url="https://example.com/job")
+    capture.flush()
+
+    files = sorted(os.listdir(dump_dir))
+    assert len(files) == 2
+    contents = {open(dump_dir / f, encoding="utf-8").read() for f in files}
+    assert contents == {"first jd", "second jd"}
@@ -0,0 +1,86 @@
+import json
+import math
+
+import pytest
+
+from analyzer.analysis_engine import RULE_NAMES, run_all_rules
+from analyzer.feature_export import FLOAT_COLUMNS, FeatureBatch
+from analyzer.parsing.jd_parser import parse_jd
+from batch_analyze import run
+
+
+TEXTS = [
+    "Urgent hiring! Pay registration fee on WhatsApp. Earn 50000 weekly, no interview.",
+    "Senior Backend Engineer, full-time, remote. 5+ years of Python. Salary INR 20-30 LPA.",
+    "Data analyst (contract) in Pune. Interview: recruiter call then technical round.",
+]
+
+
+def _batch():
+    batch = FeatureBatch()
+    analyses = [batch.analyze(parse_jd(text), index=i * 10) for i, text in enumerate(TEXTS)]
+    return batch, analyses
+
+
+def test_rows_match_analysis_without_optional_dependencies():
+    batch, analyses = _batch()
+    n_rules = len(RULE_NAMES)
+
+    assert len(batch) == len(TEXTS)
+    assert list(batch.index) == [0, 10, 20]
+    assert all(len(batch.floats[name]) == len(TEXTS) for name in FLOAT_COLUMNS)
+
+    for i, text in enumerate(TEXTS):
+        assert analyses[i] == run_all_rules(parse_jd(text))
+        scores = batch.rule_scores[i * n_rules:(i + 1) * n_rules]
+        assert batch.floats["rule_score"][i] == round(min(sum(scores), 1.0), 2)
+
+        amount = parse_jd(text).salary.amount_min
+        value = batch.floats["salary_min"][i]
+        assert math.isnan(value) if amount is None else value == amount
+
+
+def test_numpy_and_arrow_columns_agree():
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("pyarrow")
+    batch, _ = _batch()
+
+    records = batch.to_numpy()
+    table = batch.to_arrow()
+
+    assert records["rule_scores"].shape == (len(TEXTS), len(RULE_NAMES))
+    for j, name in enumerate(RULE_NAMES):
+        assert table.column(f"score_{name}").to_pylist() == records["rule_scores"][:, j].tolist()
+    assert [v or "" for v in table.column("employment_type").to_pylist()] == \
+        records["employment_type"].tolist()
+    np.testing.assert_array_equal(table.column("rule_score").to_numpy(), records["rule_score"])
+
+
+def test_numpy_keeps_long_categories_whole():
+    pytest.importorskip("numpy")
+    batch, _ = _batch()
+    long_value = "contract-to-hire (6 months, extendable)"
+    batch.codes["employment_type"][0] = len(batch.categories["employment_type"])
+    batch.categories["employment_type"].append(long_value)
+
+    records = batch.to_numpy()
+
+    assert records["employment_type"][0] == long_value
+
+
+def test_batch_cli_writes_parquet_features(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    corpus, output, features = tmp_path / "c.jsonl", tmp_path / "o.jsonl", tmp_path / "f.parquet"
+    with open(corpus, "w", encoding="utf-8") as f:
+        for i in range(20):
+            f.write(json.dumps({"job_text": TEXTS[i % len(TEXTS)]}) + "\n")
+
+    run(str(corpus), str(output), workers=2, chunk_size=3, features_path=str(features))
+
+    table = pq.read_table(features)
+    with open(output, encoding="utf-8") as f:
+        results = [json.loads(line) for line in f]
+
+    assert table.column("index").to_pylist() == list(range(20))
+    assert table.column("rule_score").to_pylist() == [r["rule_score"] for r in results]
+    assert table.schema.metadata[b"rule_names"].decode().split(",") == RULE_NAMES
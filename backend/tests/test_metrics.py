@@ -0,0 +1,36 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from analyzer.utils.metrics import Registry, fetch_outcome
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = Registry()
+    latency = registry.histogram("stage_seconds", "Stage latency.", ("stage",), buckets=(0.01, 0.1))
+
+    for value in (0.005, 0.05, 0.05, 3.0):
+        latency.observe(value, stage="parse")
+
+    text = registry.render()
+
+    assert 'stage_seconds_bucket{stage="parse",le="0.01"} 1' in text
+    assert 'stage_seconds_bucket{stage="parse",le="0.1"} 3' in text
+    assert 'stage_seconds_bucket{stage="parse",le="+Inf"} 4' in text
+    assert 'stage_seconds_count{stage="parse"} 4' in text
+
+
+def test_counter_is_thread_safe():
+    registry = Registry()
+    fired = registry.counter("rule_fired_total", "Rule fires.", ("rule",))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for _ in range(8):
+            executor.submit(lambda: [fired.inc(rule="urgent") for _ in range(1000)])
+
+    assert fired.value(rule="urgent") == 8000
+    assert 'rule_fired_total{rule="urgent"} 8000' in registry.render()
+
+
+def test_fetch_reason_codes_become_bounded_labels():
+    assert fetch_outcome(None) == "ok"
+    assert fetch_outcome("blocked_by_site_captcha") == "blocked_by_site_captcha"
+    assert fetch_outcome("network_error: Connection refused by host") == "network_error"
@@ -0,0 +1,121 @@
+from analyzer.near_duplicate_index import NearDuplicateIndex
+from analyzer.parsing.jd_parser import parse_jd
+from analyzer.rules.copy_paste_jd import copy_paste_jd_rule
+
+
+SCAM_JD = (
+    "{company} is hiring data entry operators to work from home. No experience "
+    "is needed and training is provided by our senior team. You will earn up to "
+    "5000 per week by typing simple documents and filling online forms for our "
+    "international clients. Flexible hours, weekly payouts directly to your bank "
+    "account and a joining bonus for the first fifty applicants. To reserve your "
+    "seat pay the one time registration fee and send your details to our hiring "
+    "desk on WhatsApp today."
+)
+
+OTHER_JD = (
+    "Acme Robotics is looking for a senior backend engineer to design and operate "
+    "the services that power our warehouse fleet. You will own APIs end to end, "
+    "work with product and hardware teams, and take part in a fair on-call rotation. "
+    "Requirements include five years of Python or Go, PostgreSQL and Kubernetes. "
+    "The interview process has a recruiter call, a technical interview and a team chat."
+)
+
+
+def test_reposts_under_other_companies_are_found():
+    index = NearDuplicateIndex(":memory:")
+
+    first = index.check(SCAM_JD.format(company="Sunrise Global"), "Sunrise Global")
+    index.check(SCAM_JD.format(company="Blue Ocean Jobs"), "Blue Ocean Jobs")
+    info = index.check(SCAM_JD.format(company="Star Staffing"), "Star Staffing")
+
+    assert first.matches == 0
+    assert info.matches == 2
+    assert info.other_companies == ["Blue Ocean Jobs", "Sunrise Global"]
+    assert index.check(OTHER_JD, "Acme Robotics").matches == 0
+
+
+def test_resubmitted_text_gets_the_same_answer():
+    index = NearDuplicateIndex(":memory:")
+
+    index.check(SCAM_JD.format(company="Sunrise Global"), "Sunrise Global")
+    text = SCAM_JD.format(company="Blue Ocean Jobs")
+    first = index.check(text, "Blue Ocean Jobs")
+
+    # later postings don't change what an already-seen text matched
+    index.check(SCAM_JD.format(company="Star Staffing"), "Star Staffing")
+    again = index.check(text, "Blue Ocean Jobs")
+
+    assert again == first
+    assert len(index) == 3
+
+
+def test_candidate_cap_keeps_the_closest_postings(monkeypatch):
+    import analyzer.near_duplicate_index as near_duplicate_index
+
+    monkeypatch.setattr(near_duplicate_index, "MAX_CANDIDATES", 1)
+    index = NearDuplicateIndex(":memory:")
+
+    # the oldest posting is the closest one; newer reposts must not crowd it out
+    for company in ("Sunrise Global", "Blue Ocean Jobs", "Star Staffing", "Agency number 1"):
+        index.check(SCAM_JD.format(company=company), company)
+
+    info = index.check(SCAM_JD.format(company="Sunrise Global") + " Apply now.", "Sunrise Global")
+
+    assert info.matches == 1
+    assert info.max_similarity > 0.98
+    assert info.other_companies == []
+
+
+def test_copy_paste_rule_uses_cross_posting_signal():
+    index = NearDuplicateIndex(":memory:")
+
+    for company in ("Sunrise Global", "Blue Ocean Jobs", "Star Staffing"):
+        jd_context = parse_jd(SCAM_JD.format(company=company))
+        jd_context.near_duplicates = index.check(jd_context.raw_text, company)
+
+    result = copy_paste_jd_rule(jd_context)
+
+    assert result["score"] == 0.85
+    assert "matches 2 earlier postings from 2 different companies" in result["reason"]
+
+
+def test_other_company_matches_exclude_same_company_reposts():
+    index = NearDuplicateIndex(":memory:")
+
+    for company in ("Sunrise Global", "Blue Ocean Jobs", "Star Staffing"):
+        index.check(SCAM_JD.format(company=company), company)
+    index.check(SCAM_JD.format(company="Sunrise Global") + " Apply now.", "Sunrise Global")
+
+    info = index.check(SCAM_JD.format(company="Sunrise Global") + " Apply today.", "Sunrise Global")
+
+    assert info.matches == 4
+    assert info.other_company_matches == 2
+    assert info.other_companies == ["Blue Ocean Jobs", "Star Staffing"]
+
+
+def test_unattributed_reposts_are_a_milder_signal():
+    index = NearDuplicateIndex(":memory:")
+
+    for n in range(4):
+        jd_context = parse_jd(SCAM_JD.format(company=f"Agency number {n}"))
+        jd_context.near_duplicates = index.check(jd_context.raw_text, jd_context.company.name)
+
+    assert jd_context.near_duplicates.matches == 3
+    assert copy_paste_jd_rule(jd_context)["score"] == 0.4
+
+
+def test_pipeline_signal_only_depends_on_earlier_postings(monkeypatch):
+    import pipeline
+
+    texts = [SCAM_JD.format(company=f"Agency number {n}") for n in range(4)]
+    results = [pipeline.analyze_payload({"job_text": text})[0] for text in texts]
+
+    # per-test in-memory index (tests/conftest.py), never the shared file
+    assert pipeline.get_near_duplicate_index().path == ":memory:"
+    assert not any("closely matches" in r for r in results[0]["reasons"])
+    assert any("closely matches 3 earlier" in r for r in results[3]["reasons"])
+
+    # later reposts don't change an earlier text's answer, cached or not
+    monkeypatch.setattr(pipeline, "ENABLE_RESULT_CACHE", False)
+    assert pipeline.analyze_payload({"job_text": texts[0]})[0] == results[0]
@@ -0,0 +1,63 @@
+from analyzer.analysis_engine import RULESET_VERSION, run_all_rules
+from analyzer.parsing.jd_parser import parse_jd
+from analyzer.result_cache import ResultCache
+
+
+JD = "Urgent hiring! Join immediately. Pay registration fee to confirm your slot."
+
+
+def test_hit_returns_same_result_as_fresh_analysis():
+    cache = ResultCache(RULESET_VERSION)
+    analysis = run_all_rules(parse_jd(JD))
+
+    assert cache.get(JD) is None
+    cache.put(JD, analysis)
+
+    assert cache.get(JD) == analysis
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_cached_result_cannot_be_mutated_by_callers():
+    cache = ResultCache("v1")
+    cache.put(JD, {"rule_score": 0.5, "reasons": ["a"]})
+
+    cache.get(JD)["reasons"].append("b")
+
+    assert cache.get(JD)["reasons"] == ["a"]
+
+
+def test_memory_lru_is_bounded():
+    cache = ResultCache("v1", max_entries=2)
+    cache.put("a", {"rule_score": 0.1})
+    cache.put("b", {"rule_score": 0.2})
+    cache.get("a")
+    cache.put("c", {"rule_score": 0.3})
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+
+def test_sqlite_entries_are_dropped_when_ruleset_changes(tmp_path):
+    path = str(tmp_path / "results.sqlite")
+
+    old = ResultCache("v1", sqlite_path=path)
+    old.put(JD, {"rule_score": 0.5})
+    old.close()
+
+    # shared file serves another process on the same rule set
+    assert ResultCache("v1", sqlite_path=path).get(JD) == {"rule_score": 0.5}
+
+    assert ResultCache("v2", sqlite_path=path).get(JD) is None
+
+
+def test_reposts_differing_only_in_whitespace_share_an_entry():
+    import pipeline
+
+    text = "Urgent hiring for data entry!\nPay the registration fee today.\nContact us on WhatsApp now."
+    first, _ = pipeline.analyze_payload({"job_text": text})
+    again, _ = pipeline.analyze_payload({"job_text": "  " + text.replace("\n", " \r\n\r\n").replace(" ", "  ")})
+
+    assert again == first
+    assert pipeline.get_result_cache().stats()["hits"] == 1
@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from analyzer.analysis_engine import RULE_NAMES
+from analyzer.feature_export import FeatureBatch
+from analyzer.parsing.jd_parser import parse_jd
+from analyzer.score_matrix import ScoreMatrix, round_scores, score_contexts
+
+
+TEXTS = [
+    "Urgent hiring! Pay registration fee on WhatsApp. Earn 50000 weekly, no interview, join immediately.",
+    "Senior Backend Engineer, full-time, remote. 5+ years of Python. Salary INR 20-30 LPA.",
+    "Data analyst (contract) in Pune. Interview: recruiter call then technical round.",
+    "Work from home, guaranteed income, no experience needed, limited seats, apply now!!!",
+]
+
+
+def test_totals_reproduce_engine_rule_score_exactly():
+    analyses, matrix = score_contexts([parse_jd(t) for t in TEXTS])
+
+    assert matrix.scores.shape == (len(TEXTS), len(RULE_NAMES))
+    assert matrix.totals().tolist() == [a["rule_score"] for a in analyses]
+
+    batch = FeatureBatch()
+    for text in TEXTS:
+        batch.analyze(parse_jd(text))
+    assert ScoreMatrix.from_feature_batch(batch).totals().tolist() == matrix.totals().tolist()
+
+
+def test_rounding_matches_python_round_on_ties():
+    rng = random.Random(3)
+    values = [k / 1000 for k in range(1001)]
+    values += [sum(rng.choice([0.15, 0.35, 0.45, 0.175]) for _ in range(rng.randint(1, 6)))
+               for _ in range(5000)]
+
+    assert round_scores(values).tolist() == [round(v, 2) for v in values]
+
+
+def test_weights_thresholds_and_rule_stats():
+    rule_a, rule_b = RULE_NAMES[:2]
+    rows = [[0.0] * len(RULE_NAMES) for _ in range(3)]
+    rows[0][0], rows[0][1] = 0.6, 0.6     # capped at 1.0
+    rows[1][0] = 0.35
+    rows[2][1] = float("nan")             # rule failed
+
+    matrix = ScoreMatrix(rows)
+
+    assert matrix.totals().tolist() == [1.0, 0.35, 0.0]
+    assert matrix.totals({rule_a: 0.5}).tolist() == [0.9, round(0.35 * 0.5, 2), 0.0]
+    assert matrix.what_if([0.3, 0.5, 1.0]) == {0.3: 2, 0.5: 1, 1.0: 1}
+
+    stats = matrix.rule_stats()
+    assert stats[rule_a]["fired"] == 2 and stats[rule_a]["mean_when_fired"] == pytest.approx(0.475)
+    assert stats[rule_b]["failed"] == 1
+
+    with pytest.raises(ValueError):
+        matrix.totals({"no_such_rule": 2.0})
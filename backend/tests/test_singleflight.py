@@ -0,0 +1,79 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from analyzer.utils.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def test_concurrent_threads_share_one_call():
+    flights = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def work():
+        calls.append(1)
+        release.wait(5)
+        return {"rule_score": 0.5}
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(flights.do, "url:a", work) for _ in range(8)]
+        while flights.stats()["coalesced"] < 7:
+            time.sleep(0.001)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert len(calls) == 1
+    assert all(result is results[0][0] for result, _ in results)
+    assert sorted(shared for _, shared in results) == [False] + [True] * 7
+    assert flights.stats() == {"leaders": 1, "coalesced": 7, "in_flight": 0}
+
+    # finished calls are not cached
+    flights.do("url:a", work)
+    assert len(calls) == 2
+
+
+def test_errors_reach_every_waiter():
+    flights = SingleFlight()
+    release = threading.Event()
+
+    def fail():
+        release.wait(5)
+        raise RuntimeError("fetch failed")
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(flights.do, "k", fail) for _ in range(3)]
+        while flights.stats()["coalesced"] < 2:
+            time.sleep(0.001)
+        release.set()
+        for future in futures:
+            with pytest.raises(RuntimeError):
+                future.result()
+
+    assert flights.in_flight() == 0
+
+
+def test_async_waiters_share_one_task_and_survive_cancellation():
+    flights = AsyncSingleFlight()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "analysis"
+
+    async def main():
+        first = asyncio.ensure_future(flights.do("text:x", work))
+        await asyncio.sleep(0)
+        others = [asyncio.ensure_future(flights.do("text:x", work)) for _ in range(5)]
+        await asyncio.sleep(0)
+        first.cancel()   # the leader's client went away
+        return await asyncio.gather(*others)
+
+    results = asyncio.run(main())
+
+    assert len(calls) == 1
+    assert results == [("analysis", True)] * 5
+    assert flights.stats() == {"leaders": 1, "coalesced": 5, "in_flight": 0}